@@ -0,0 +1,60 @@
+import threading
+from collections import OrderedDict
+
+
+class CacheLRU:
+    """
+    Caché acotada ID de empleado -> nombre para Empleados.obtener_nombre_empleado, con desalojo
+    del usado hace más tiempo (LRU); así repetir un ID no vuelve a consultar la tabla empleados.
+
+    También guarda los IDs que no existen (valor None). Los métodos de escritura de Empleados
+    la mantienen al día con `guardar` (alta o edición) e `invalidar` (baja).
+    """
+    def __init__(self, max_elementos: int = 1024):
+        """
+        Args:
+            max_elementos (int): Cantidad máxima de empleados guardados.
+        """
+        self.max_elementos = max_elementos
+        self._valores = OrderedDict() # id_empleado -> nombre, del menos al más usado
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def obtener(self, clave, consultar):
+        """
+        Retorna el nombre guardado para el ID o lo consulta y lo guarda.
+
+        Args:
+            clave: ID del empleado.
+            consultar: Función que recibe el ID y retorna el nombre (None si no existe).
+        """
+        with self._lock:
+            if clave in self._valores:
+                self._valores.move_to_end(clave)
+                return self._valores[clave]
+            version = self._version
+
+        valor = consultar(clave)
+        with self._lock:
+            # Una escritura durante la consulta puede haber dejado el nombre desactualizado
+            if version == self._version:
+                self._guardar(clave, valor)
+        return valor
+
+    def guardar(self, clave, valor):
+        """Escritura directa (write-through): guarda el nombre nuevo de un empleado."""
+        with self._lock:
+            self._version += 1
+            self._guardar(clave, valor)
+
+    def _guardar(self, clave, valor):
+        self._valores[clave] = valor
+        self._valores.move_to_end(clave)
+        while len(self._valores) > self.max_elementos:
+            self._valores.popitem(last=False)
+
+    def invalidar(self, clave):
+        """Descarta el nombre de un empleado eliminado."""
+        with self._lock:
+            self._version += 1
+            self._valores.pop(clave, None)
@@ -1,7 +1,29 @@
 import mysql.connector
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+from cache import CacheLRU
 
 db_name = "SistemaDeProyectos"
 
+# Parámetros de conexión
+DB_CONFIG = {
+    "host": "localhost",
+    "user": "root",
+    "password": "Inthesky1@",
+    "database": db_name,
+}
+
+# Configuración del pool de conexiones
+TAMANO_POOL = 5                 # Conexiones máximas abiertas a la vez
+VERIFICAR_SI_INACTIVA_SEG = 30  # Hacer ping al prestar una conexión que lleva este tiempo sin usarse
+INTENTOS_RECONEXION = 3
+ESPERA_RECONEXION_SEG = 1
+ESPERA_MAXIMA_POOL_SEG = 10     # Tiempo máximo esperando una conexión libre
+
+
 def conectar_db():
     """
     retorna dos instancias de conexion:
@@ -13,19 +35,148 @@ def conectar_db():
     :return: ""cursor""  ejemplos de uso
     cursor para ejecutar declaraciones y capturar datos
 
+    Abre una conexión nueva; los modelos usan conexion_db(), que reutiliza las del pool.
     """
-    conn = mysql.connector.connect(
-        host="localhost",
-        user="root",
-        password="Inthesky1@",
-        database=db_name
-    )
+    conn = mysql.connector.connect(**DB_CONFIG)
     cursor = conn.cursor()
-    conn.commit()
 
     return conn, cursor
 
 
+class PoolConexiones:
+    """
+    Pool acotado de conexiones MySQL reutilizables.
+
+    Evita el handshake TCP + autenticación en cada consulta. Al prestar una conexión
+    que estuvo inactiva se verifica con ping y, si el servidor la cerró, se reconecta.
+    """
+    def __init__(self, tamano: int = TAMANO_POOL):
+        self.tamano = tamano
+        self._libres = queue.LifoQueue(maxsize=tamano)
+        self._creadas = 0
+        self._lock = threading.Lock()
+
+    def _crear(self):
+        with self._lock:
+            if self._creadas >= self.tamano:
+                return None
+            self._creadas += 1
+        try:
+            conn, cursor = conectar_db()
+            cursor.close()
+            return conn
+        except mysql.connector.Error:
+            with self._lock:
+                self._creadas -= 1
+            raise
+
+    def _verificar(self, conn, ultimo_uso):
+        """Health-check al prestar: ping (con reconexión) si la conexión estuvo inactiva."""
+        if time.monotonic() - ultimo_uso < VERIFICAR_SI_INACTIVA_SEG:
+            return conn
+        try:
+            conn.ping(reconnect=True, attempts=INTENTOS_RECONEXION, delay=ESPERA_RECONEXION_SEG)
+            return conn
+        except mysql.connector.Error as e:
+            print(f"Conexión del pool descartada: {e}")
+            self._descartar(conn)
+            return self._crear()
+
+    def _tomar(self):
+        try:
+            conn, ultimo_uso = self._libres.get_nowait()
+            conn = self._verificar(conn, ultimo_uso)
+            if conn:
+                return conn
+        except queue.Empty:
+            pass
+
+        conn = self._crear()
+        if conn:
+            return conn
+
+        try:
+            conn, ultimo_uso = self._libres.get(timeout=ESPERA_MAXIMA_POOL_SEG)
+        except queue.Empty:
+            raise mysql.connector.errors.PoolError("No hay conexiones disponibles en el pool")
+        return self._verificar(conn, ultimo_uso) or self._crear()
+
+    def _devolver(self, conn):
+        try:
+            if conn.in_transaction:
+                conn.rollback() # No dejar transacciones (ni snapshots de lectura) abiertas
+            self._libres.put_nowait((conn, time.monotonic()))
+        except (mysql.connector.Error, queue.Full):
+            self._descartar(conn)
+
+    def _descartar(self, conn):
+        with self._lock:
+            self._creadas -= 1
+        try:
+            conn.close()
+        except mysql.connector.Error:
+            pass
+
+    @contextmanager
+    def conexion(self):
+        """
+        Presta una conexión del pool.
+        Uso:
+            with pool.conexion() as (conn, cursor):
+                ...
+        """
+        conn = self._tomar()
+        cursor = conn.cursor()
+        try:
+            yield conn, cursor
+        except BaseException:
+            try:
+                conn.rollback()
+            except mysql.connector.Error:
+                pass
+            raise
+        finally:
+            try:
+                cursor.close()
+            except mysql.connector.Error:
+                pass
+            self._devolver(conn)
+
+    def cerrar(self):
+        """Cierra las conexiones libres del pool."""
+        while True:
+            try:
+                conn, _ = self._libres.get_nowait()
+            except queue.Empty:
+                break
+            self._descartar(conn)
+
+
+_pool = PoolConexiones()
+
+
+def conexion_db():
+    """Context manager que presta (conn, cursor) del pool compartido."""
+    return _pool.conexion()
+
+
+def cerrar_conexiones():
+    """Cierra las conexiones abiertas por el pool."""
+    _pool.cerrar()
+
+
+# Resolvedor ID -> nombre de empleado (LRU); las escrituras de Empleados lo mantienen al día
+NOMBRES_EMPLEADOS = CacheLRU()
+
+
+def _normalizar_id(valor):
+    """Usa el ID como entero en la caché, así 7 y "7" (valor de un TextField) son la misma clave."""
+    try:
+        return int(valor)
+    except (TypeError, ValueError):
+        return valor
+
+
 """
 TABLE tareas (
     id_tarea INT AUTO_INCREMENT PRIMARY KEY,
@@ -53,6 +204,15 @@ class Tarea:
 
     
     """
+    # Tareas con el nombre del proyecto y del empleado (columnas de TablaTareas)
+    SQL_DETALLADO = (
+        "SELECT t.id_tarea, t.descripcion, t.estado, t.fecha_inicio, t.fecha_fin, "
+        "p.nombre, e.nombre "
+        "FROM tareas t "
+        "LEFT JOIN proyectos p ON t.id_proyecto = p.id_proyecto "
+        "LEFT JOIN empleados e ON t.id_empleado = e.id_empleado"
+    )
+
     def __init__(self,id_proyecto, id_empleado, fecha_inicio, fecha_fin = None, descripcion = None, estado = None, id_tarea = None):
         self.id_tarea = id_tarea
         self.descripcion = descripcion
@@ -64,54 +224,77 @@ class Tarea:
 
 
     def guardar_registro(self):
-        conn, cursor = conectar_db()
-        if conn:
-            sql = "INSERT INTO tareas (descripcion, estado, fecha_inicio, fecha_fin, id_proyecto, id_empleado) VALUES (%s, %s, %s, %s, %s, %s)"
-            valores = (self.descripcion, self.estado, self.fecha_inicio, self.fecha_fin, self.id_proyecto, self.id_empleado)
-            cursor.execute(sql, valores)
-            conn.commit()
-            conn.close()
+        with conexion_db() as (conn, cursor):
+            if conn:
+                sql = "INSERT INTO tareas (descripcion, estado, fecha_inicio, fecha_fin, id_proyecto, id_empleado) VALUES (%s, %s, %s, %s, %s, %s)"
+                valores = (self.descripcion, self.estado, self.fecha_inicio, self.fecha_fin, self.id_proyecto, self.id_empleado)
+                cursor.execute(sql, valores)
+                conn.commit()
+                self.id_tarea = cursor.lastrowid
 
     @staticmethod
     def actualizar_registro(estado, fecha_fin, id_tarea):
         """
         parametros estado fecha_fin, id_tarea
         """
-        conn, cursor = conectar_db()
-        if conn:
-            sql = "UPDATE tareas SET estado=%s, fecha_fin=%s WHERE id_tarea=%s"
-            valores = (estado, fecha_fin, id_tarea)
-            cursor.execute(sql, valores)
-            conn.commit()
-            conn.close()
+        with conexion_db() as (conn, cursor):
+            if conn:
+                sql = "UPDATE tareas SET estado=%s, fecha_fin=%s WHERE id_tarea=%s"
+                valores = (estado, fecha_fin, id_tarea)
+                cursor.execute(sql, valores)
+                conn.commit()
 
     @staticmethod
     def eliminar_registro(id):
         try:
-            conn, cursor = conectar_db()
-            if conn:
-                sql = "DELETE FROM tareas WHERE id_tarea = %s"
-                valores = (id,)
-                cursor.execute(sql, valores)
-                conn.commit()
-                cursor.close()
-                conn.close()
-                return True
-            else:
-                return False
+            with conexion_db() as (conn, cursor):
+                if conn:
+                    sql = "DELETE FROM tareas WHERE id_tarea = %s"
+                    valores = (id,)
+                    cursor.execute(sql, valores)
+                    conn.commit()
+                    return True
+                else:
+                    return False
         except Exception as e:
             print(f"Error al eliminar la tarea: {e}")
             return False
 
     @staticmethod
     def obtener_todos():
-        conn, cursor = conectar_db()
-        if conn:
-            cursor.execute("SELECT * FROM tareas")
-            resultados = cursor.fetchall()
-            conn.close()
-        return resultados
+        with conexion_db() as (conn, cursor):
+            if conn:
+                cursor.execute("SELECT * FROM tareas")
+                resultados = cursor.fetchall()
+            return resultados
     
+    @staticmethod
+    def obtener_todos_detallado():
+        """
+        Objetivo: Obtener las tareas con el nombre del proyecto y del empleado en una sola consulta.
+
+        Returns:
+            Lista: id_tarea, descripcion, estado, fecha_inicio, fecha_fin, nombre_proyecto, nombre_empleado
+        """
+        with conexion_db() as (conn, cursor):
+            cursor.execute(Tarea.SQL_DETALLADO)
+            return cursor.fetchall()
+
+    @staticmethod
+    def obtener_detallado_por_id(id_tarea):
+        """
+        Objetivo: Obtener una tarea con el nombre del proyecto y del empleado, para actualizar solo su fila.
+
+        Args:
+            id_tarea: ID de la tarea.
+
+        Returns:
+            Tupla: igual que una fila de obtener_todos_detallado, o None si no existe.
+        """
+        with conexion_db() as (conn, cursor):
+            cursor.execute(Tarea.SQL_DETALLADO + " WHERE t.id_tarea=%s", (id_tarea,))
+            return cursor.fetchone()
+
     
     
 
@@ -126,14 +309,12 @@ class Tarea:
         Returns:
             Lista: de .
         """
-        conn, cursor = conectar_db()
-
-        sql = "SELECT * FROM tareas WHERE id_tarea=%s"
-        valores = (id_proyecto,)
-        cursor.execute(sql, valores)
-        resultado = cursor.fetchall()
-        conn.close()
-        return resultado
+        with conexion_db() as (conn, cursor):
+            sql = "SELECT * FROM tareas WHERE id_tarea=%s"
+            valores = (id_proyecto,)
+            cursor.execute(sql, valores)
+            resultado = cursor.fetchall()
+            return resultado
 
 
 """
@@ -163,50 +344,76 @@ class Empleados:
 
 
     def guardar_registro(self):
-        conn, cursor = conectar_db()
-        if conn:
-            sql = "INSERT INTO empleados (nombre, correo, telefono) VALUES (%s, %s, %s)"
-            valores = (self.nombre, self.correo, self.telefono)
-            cursor.execute(sql, valores)
-            conn.commit()
-            conn.close()
+        with conexion_db() as (conn, cursor):
+            if conn:
+                sql = "INSERT INTO empleados (nombre, correo, telefono) VALUES (%s, %s, %s)"
+                valores = (self.nombre, self.correo, self.telefono)
+                cursor.execute(sql, valores)
+                conn.commit()
+                self.id_empleado = cursor.lastrowid
+                NOMBRES_EMPLEADOS.guardar(self.id_empleado, self.nombre)
 
     def actualizar_registro(self):
-        conn, cursor = conectar_db()
-        if conn:
-            sql = "UPDATE empleados SET nombre=%s, correo=%s, telefono=%s WHERE id_empleado=%s"
-            valores = (self.nombre, self.correo, self.telefono, self.id_empleado)
-            cursor.execute(sql, valores)
-            conn.commit()
-            conn.close()
+        with conexion_db() as (conn, cursor):
+            if conn:
+                sql = "UPDATE empleados SET nombre=%s, correo=%s, telefono=%s WHERE id_empleado=%s"
+                valores = (self.nombre, self.correo, self.telefono, self.id_empleado)
+                cursor.execute(sql, valores)
+                conn.commit()
+                NOMBRES_EMPLEADOS.guardar(_normalizar_id(self.id_empleado), self.nombre)
 
     @staticmethod
     def eliminar_registro(id):
-        conn, cursor = conectar_db()
-        if conn:
-            sql = "DELETE FROM empleados WHERE id_empleado=%s"
-            valores = (id,)
-            cursor.execute(sql, valores)
-            conn.commit()
-            conn.close()
+        try:
+            with conexion_db() as (conn, cursor):
+                if conn:
+                    sql = "DELETE FROM empleados WHERE id_empleado=%s"
+                    valores = (id,)
+                    cursor.execute(sql, valores)
+                    conn.commit()
+                    NOMBRES_EMPLEADOS.invalidar(_normalizar_id(id))
+                    return True
+                else:
+                    return False
+        except Exception as e:
+            print(f"Error al eliminar el empleado: {e}")
+            return False
 
     @staticmethod
     def obtener_todos():
-        conn, cursor = conectar_db()
-        if conn:
-            cursor.execute("SELECT * FROM empleados")
-            resultados = cursor.fetchall()
-            conn.close()
-        return resultados
+        with conexion_db() as (conn, cursor):
+            if conn:
+                cursor.execute("SELECT * FROM empleados")
+                resultados = cursor.fetchall()
+            return resultados
+
+    @staticmethod
+    def obtener_por_id(id_empleado):
+        """
+        Objetivo: Obtener un empleado, para actualizar solo su fila.
+
+        Args:
+            id_empleado: ID del empleado.
+
+        Returns:
+            Tupla: id_empleado, nombre, correo, telefono, o None si no existe.
+        """
+        with conexion_db() as (conn, cursor):
+            cursor.execute("SELECT * FROM empleados WHERE id_empleado=%s", (id_empleado,))
+            return cursor.fetchone()
     
     @staticmethod
     def obtener_nombre_empleado(id):
-        conn, cursor = conectar_db()
-        if conn:
-            cursor.execute("SELECT * FROM empleados WHERE id_empleado = %s ",(id,))
-            resultados = cursor.fetchone()
-            conn.close()
-        return resultados[1]
+        """Nombre del empleado con ese ID o None si no existe (con caché LRU)."""
+        return NOMBRES_EMPLEADOS.obtener(_normalizar_id(id), Empleados._consultar_nombre)
+
+    @staticmethod
+    def _consultar_nombre(id):
+        with conexion_db() as (conn, cursor):
+            if conn:
+                cursor.execute("SELECT nombre FROM empleados WHERE id_empleado = %s",(id,))
+                resultados = cursor.fetchone()
+            return resultados[0] if resultados else None
     
 
     @staticmethod
@@ -220,14 +427,12 @@ class Empleados:
         Returns:
             Lista: de .
         """
-        conn, cursor = conectar_db()
-
-        sql = "SELECT * FROM proyectos WHERE id_proyecto=%s"
-        valores = (id_proyecto,)
-        cursor.execute(sql, valores)
-        resultado = cursor.fetchall()
-        conn.close()
-        return resultado
+        with conexion_db() as (conn, cursor):
+            sql = "SELECT * FROM proyectos WHERE id_proyecto=%s"
+            valores = (id_proyecto,)
+            cursor.execute(sql, valores)
+            resultado = cursor.fetchall()
+            return resultado
 
 
 """
@@ -259,52 +464,70 @@ class Proyecto:
 
 
     def guardar_registro(self):
-        conn, cursor = conectar_db()
-        if conn:
-            sql = "INSERT INTO proyectos (nombre, descripcion, fecha_inicio, fecha_fin) VALUES (%s, %s, %s, %s)"
-            valores = (self.nombre, self.descripcion, self.fecha_inicio, self.fecha_fin)
-            cursor.execute(sql, valores)
-            conn.commit()
-            conn.close()
+        with conexion_db() as (conn, cursor):
+            if conn:
+                sql = "INSERT INTO proyectos (nombre, descripcion, fecha_inicio, fecha_fin) VALUES (%s, %s, %s, %s)"
+                valores = (self.nombre, self.descripcion, self.fecha_inicio, self.fecha_fin)
+                cursor.execute(sql, valores)
+                conn.commit()
+                self.id_proyecto = cursor.lastrowid
 
     def actualizar_registro(self):
-        conn, cursor = conectar_db()
-        if conn:
-            sql = "UPDATE proyectos SET nombre=%s, descripcion=%s, fecha_inicio=%s, fecha_fin=%s WHERE id_proyecto=%s"
-            valores = (self.nombre, self.descripcion, self.fecha_inicio, self.fecha_fin, self.id_proyecto)
-            cursor.execute(sql, valores)
-            conn.commit()
-            conn.close()
+        with conexion_db() as (conn, cursor):
+            if conn:
+                sql = "UPDATE proyectos SET nombre=%s, descripcion=%s, fecha_inicio=%s, fecha_fin=%s WHERE id_proyecto=%s"
+                valores = (self.nombre, self.descripcion, self.fecha_inicio, self.fecha_fin, self.id_proyecto)
+                cursor.execute(sql, valores)
+                conn.commit()
 
     @staticmethod
     def eliminar_registro(id):
-        conn, cursor = conectar_db()
-        if conn:
-            sql = "DELETE FROM proyectos WHERE id_proyecto=%s"
-            valores = (id,)
-            cursor.execute(sql, valores)
-            conn.commit()
-            conn.close()
+        try:
+            with conexion_db() as (conn, cursor):
+                if conn:
+                    sql = "DELETE FROM proyectos WHERE id_proyecto=%s"
+                    valores = (id,)
+                    cursor.execute(sql, valores)
+                    conn.commit()
+                    return True
+                else:
+                    return False
+        except Exception as e:
+            print(f"Error al eliminar el proyecto: {e}")
+            return False
 
     @staticmethod
     def obtener_todos():
-        conn, cursor = conectar_db()
-        proyectos = []
-        if conn:
-            cursor.execute("SELECT * FROM proyectos")
-            resultados = cursor.fetchall()
-            conn.close()
-        return resultados
+        with conexion_db() as (conn, cursor):
+            proyectos = []
+            if conn:
+                cursor.execute("SELECT * FROM proyectos")
+                resultados = cursor.fetchall()
+            return resultados
+
+    @staticmethod
+    def obtener_por_id(id_proyecto):
+        """
+        Objetivo: Obtener un proyecto, para actualizar solo su fila.
+
+        Args:
+            id_proyecto: ID del proyecto.
+
+        Returns:
+            Tupla: id_proyecto, nombre, descripcion, fecha_inicio, fecha_fin, o None si no existe.
+        """
+        with conexion_db() as (conn, cursor):
+            cursor.execute("SELECT * FROM proyectos WHERE id_proyecto=%s", (id_proyecto,))
+            return cursor.fetchone()
     
     @staticmethod
     def obtener_nombre_proyecto(id):
-        conn, cursor = conectar_db()
-        proyectos = []
-        if conn:
-            cursor.execute("SELECT * FROM proyectos")
-            resultados = cursor.fetchone()
-            conn.close()
-        return resultados[1]
+        with conexion_db() as (conn, cursor):
+            proyectos = []
+            if conn:
+                cursor.execute("SELECT nombre FROM proyectos WHERE id_proyecto = %s",(id,))
+                resultados = cursor.fetchone()
+            return resultados[0] if resultados else None
     
 
     @staticmethod
@@ -318,12 +541,10 @@ class Proyecto:
         Returns:
             Lista: de .
         """
-        conn, cursor = conectar_db()
-
-        sql = "SELECT * FROM proyectos WHERE id_proyecto=%s"
-        valores = (id_proyecto,)
-        cursor.execute(sql, valores)
-        resultado = cursor.fetchall()
-        conn.close()
-        return resultado
+        with conexion_db() as (conn, cursor):
+            sql = "SELECT * FROM proyectos WHERE id_proyecto=%s"
+            valores = (id_proyecto,)
+            cursor.execute(sql, valores)
+            resultado = cursor.fetchall()
+            return resultado
     
@@ -3,6 +3,7 @@ import asyncio
 
 from database import Proyecto, Empleados, Tarea
 from tablas import TablaProyectos, TablaEmpleados, TablaTareas
+from asincrono import Asincrono
 
 def formulario_registro_tarea(page: ft.Page, tabla_tareas: TablaTareas):
     
@@ -40,6 +41,7 @@ def formulario_registro_tarea(page: ft.Page, tabla_tareas: TablaTareas):
     
 
     estado_registro = ft.Text(value="", color=ft.colors.GREEN_600)
+    progreso_carga = ft.ProgressRing(visible=False, width=20, height=20)
 
     id_tarea_actualizar = ft.TextField(label="ID tarea actualizar",expand=1)
 
@@ -62,13 +64,16 @@ def formulario_registro_tarea(page: ft.Page, tabla_tareas: TablaTareas):
                     else:
                         fecha_fin = None
 
-                    Tarea.actualizar_registro(estado.value,fecha_fin,id_tarea_actualizar.value)
+                    progreso_carga.visible = True
+                    page.update()
+                    await Asincrono(Tarea).actualizar_registro(estado.value,fecha_fin,id_tarea_actualizar.value) # Se ejecuta en un hilo, sin bloquear la interfaz
 
 
 
                     
 
-                    tabla_tareas.actualizar_tabla()
+                    tabla_tareas.reemplazar(await Asincrono(Tarea).obtener_detallado_por_id(id_tarea_actualizar.value)) # Solo la fila editada
+                    progreso_carga.visible = False
 
                     estado_registro.value = "Tarea actualizada exitosamente"
                     estado_registro.color = ft.colors.GREEN
@@ -94,6 +99,7 @@ def formulario_registro_tarea(page: ft.Page, tabla_tareas: TablaTareas):
 
             except Exception as ex:
                 estado_registro.value = f"Error: {ex}"
+                progreso_carga.visible = False
 
         page.update()
 
@@ -131,8 +137,11 @@ def formulario_registro_tarea(page: ft.Page, tabla_tareas: TablaTareas):
                     nueva_tarea = Tarea(id_proyecto.value, id_empleado.value, fecha_inicio, fecha_fin, descripcion.value, estado="En curso")
                     
 
-                    nueva_tarea.guardar_registro()
-                    tabla_tareas.actualizar_tabla()
+                    progreso_carga.visible = True
+                    page.update()
+                    await Asincrono(nueva_tarea).guardar_registro() # Se ejecuta en un hilo, sin bloquear la interfaz
+                    tabla_tareas.agregar(await Asincrono(Tarea).obtener_detallado_por_id(nueva_tarea.id_tarea)) # Solo la fila nueva
+                    progreso_carga.visible = False
 
                     estado_registro.value = "Tarea asignada exitosamente"
                     estado_registro.color = ft.colors.GREEN
@@ -162,6 +171,7 @@ def formulario_registro_tarea(page: ft.Page, tabla_tareas: TablaTareas):
 
             except Exception as ex:
                 estado_registro.value = f"Error: {ex}"
+                progreso_carga.visible = False
 
         page.update()
 
@@ -200,7 +210,7 @@ def formulario_registro_tarea(page: ft.Page, tabla_tareas: TablaTareas):
                     
                     ft.Container(content=ft.Row([ft.Text("Fecha de inicio:",expand=1), ft.Text("Fecha de Fin:",expand=1)])),
                     ft.Container(content=ft.Row([contenedor_fecha_inicio,contenedor_fecha_final])),
-                    boton_guardar,
+                    ft.Row([boton_guardar, progreso_carga]),
                     estado_registro,
                     informacion_para_actualizar,
                     boton_actualizar,
@@ -229,6 +239,7 @@ def formulario_registro_empleados(page: ft.Page, tabla_empleado: TablaEmpleados)
 
 
     estado_registro = ft.Text(value="", color=ft.colors.GREEN_600)
+    progreso_carga = ft.ProgressRing(visible=False, width=20, height=20)
 
     id_empleado_actualizar = ft.TextField(label="ID empleado actualizar",expand=1)
 
@@ -249,8 +260,11 @@ def formulario_registro_empleados(page: ft.Page, tabla_empleado: TablaEmpleados)
                     empleado = Empleados(nombre.value, correo.value, telefono.value, id_empleado=id_empleado_actualizar.value)
                     
 
-                    empleado.actualizar_registro()
-                    tabla_empleado.actualizar_tabla()
+                    progreso_carga.visible = True
+                    page.update()
+                    await Asincrono(empleado).actualizar_registro() # Se ejecuta en un hilo, sin bloquear la interfaz
+                    tabla_empleado.reemplazar(await Asincrono(Empleados).obtener_por_id(empleado.id_empleado)) # Solo la fila editada
+                    progreso_carga.visible = False
 
                     estado_registro.value = "Empleado actualizado exitosamente"
                     estado_registro.color = ft.colors.GREEN
@@ -272,6 +286,7 @@ def formulario_registro_empleados(page: ft.Page, tabla_empleado: TablaEmpleados)
 
             except Exception as ex:
                 estado_registro.value = f"Error: {ex}"
+                progreso_carga.visible = False
 
         page.update()
 
@@ -293,8 +308,11 @@ def formulario_registro_empleados(page: ft.Page, tabla_empleado: TablaEmpleados)
                     nuevo_empleado = Empleados(nombre.value, correo.value, telefono.value)
                     
 
-                    nuevo_empleado.guardar_registro()
-                    tabla_empleado.actualizar_tabla()
+                    progreso_carga.visible = True
+                    page.update()
+                    await Asincrono(nuevo_empleado).guardar_registro() # Se ejecuta en un hilo, sin bloquear la interfaz
+                    tabla_empleado.agregar(await Asincrono(Empleados).obtener_por_id(nuevo_empleado.id_empleado)) # Solo la fila nueva
+                    progreso_carga.visible = False
 
                     estado_registro.value = "Empleado registrado exitosamente"
                     estado_registro.color = ft.colors.GREEN
@@ -316,6 +334,7 @@ def formulario_registro_empleados(page: ft.Page, tabla_empleado: TablaEmpleados)
 
             except Exception as ex:
                 estado_registro.value = f"Error: {ex}"
+                progreso_carga.visible = False
 
         page.update()
 
@@ -349,7 +368,7 @@ def formulario_registro_empleados(page: ft.Page, tabla_empleado: TablaEmpleados)
                     ft.Text("Registrar Empleado", size=24, weight="bold"),
                     ft.Container(content=ft.Row([nombre])),
                     ft.Container(content=ft.Row([correo,telefono])),
-                    boton_guardar,
+                    ft.Row([boton_guardar, progreso_carga]),
                     estado_registro,
                     informacion_para_actualizar,
                     boton_actualizar,
@@ -397,6 +416,7 @@ def formulario_registro_proyecto(page: ft.Page, tabla_proyecto: TablaProyectos):
     
 
     estado_registro = ft.Text(value="", color=ft.colors.GREEN_600)
+    progreso_carga = ft.ProgressRing(visible=False, width=20, height=20)
 
     id_proyecto_actualizar = ft.TextField(label="ID proyecto actualizar",expand=1)
 
@@ -432,8 +452,11 @@ def formulario_registro_proyecto(page: ft.Page, tabla_proyecto: TablaProyectos):
                     nuevo_proyecto = Proyecto(nombre.value, descripcion.value, fecha_inicio, fecha_fin, id_proyecto=id_proyecto_actualizar.value)
                     
 
-                    nuevo_proyecto.actualizar_registro()
-                    tabla_proyecto.actualizar_tabla()
+                    progreso_carga.visible = True
+                    page.update()
+                    await Asincrono(nuevo_proyecto).actualizar_registro() # Se ejecuta en un hilo, sin bloquear la interfaz
+                    tabla_proyecto.reemplazar(await Asincrono(Proyecto).obtener_por_id(nuevo_proyecto.id_proyecto)) # Solo la fila editada
+                    progreso_carga.visible = False
 
                     estado_registro.value = "Proyecto actualizado exitosamente"
                     estado_registro.color = ft.colors.GREEN
@@ -459,6 +482,7 @@ def formulario_registro_proyecto(page: ft.Page, tabla_proyecto: TablaProyectos):
 
             except Exception as ex:
                 estado_registro.value = f"Error: {ex}"
+                progreso_carga.visible = False
 
         page.update()
 
@@ -496,8 +520,11 @@ def formulario_registro_proyecto(page: ft.Page, tabla_proyecto: TablaProyectos):
                     nuevo_proyecto = Proyecto(nombre.value, descripcion.value, fecha_inicio, fecha_fin)
                     
 
-                    nuevo_proyecto.guardar_registro()
-                    tabla_proyecto.actualizar_tabla()
+                    progreso_carga.visible = True
+                    page.update()
+                    await Asincrono(nuevo_proyecto).guardar_registro() # Se ejecuta en un hilo, sin bloquear la interfaz
+                    tabla_proyecto.agregar(await Asincrono(Proyecto).obtener_por_id(nuevo_proyecto.id_proyecto)) # Solo la fila nueva
+                    progreso_carga.visible = False
 
                     estado_registro.value = "Proyecto registrado exitosamente"
                     estado_registro.color = ft.colors.GREEN
@@ -524,6 +551,7 @@ def formulario_registro_proyecto(page: ft.Page, tabla_proyecto: TablaProyectos):
 
             except Exception as ex:
                 estado_registro.value = f"Error: {ex}"
+                progreso_carga.visible = False
 
         page.update()
 
@@ -559,7 +587,7 @@ def formulario_registro_proyecto(page: ft.Page, tabla_proyecto: TablaProyectos):
                     
                     ft.Container(content=ft.Row([ft.Text("Fecha de inicio:",expand=1), ft.Text("Fecha de Fin:",expand=1)])),
                     ft.Container(content=ft.Row([contenedor_fecha_inicio,contenedor_fecha_final])),
-                    boton_guardar,
+                    ft.Row([boton_guardar, progreso_carga]),
                     estado_registro,
                     informacion_para_actualizar,
                     boton_actualizar,
@@ -2,212 +2,222 @@ import flet as ft
 from database import Proyecto, Empleados, Tarea
 
 
-class TablaTareas:
-    
-    def __init__(self, page: ft.Page):
+def mostrar_error(page: ft.Page, dialogo: ft.AlertDialog, mensaje: str):
+    """
+    Muestra un mensaje de error en el diálogo modal de una tabla.
+
+    Args:
+        page (ft.Page): La página de Flet.
+        dialogo (ft.AlertDialog): El diálogo de la tabla.
+        mensaje (str): Texto a mostrar.
+    """
+    def cerrar(e):
+        dialogo.open = False
+        page.update()
+
+    dialogo.title = ft.Text("Error", color=ft.Colors.RED)
+    dialogo.content = ft.Text(mensaje)
+    dialogo.actions = [ft.TextButton("Cerrar", on_click=cerrar)]
+    if dialogo not in page.overlay:
+        page.overlay.append(dialogo)
+    dialogo.open = True
+    page.update()
+
+
+class TablaBase:
+    """
+    Tabla de registros con un índice id -> fila, para agregar, reemplazar o quitar solo la fila
+    afectada y enviar al cliente únicamente la tabla (`table.update()`).
+
+    Cada tabla define sus columnas y `_celdas`; la columna de acciones (eliminar) la agrega la base.
+    """
+    def __init__(self, page: ft.Page, columnas, consultar, eliminar, error_eliminar: str, tooltip_eliminar: str):
         """
-        Inicializa la tabla de empleados.
-
         Args:
             page (ft.Page): La página de Flet en la que se mostrará la tabla.
+            columnas (list): Títulos de las columnas de datos.
+            consultar: Función sin argumentos que retorna todos los registros (el ID en la primera posición).
+            eliminar: Función del modelo que recibe el ID y retorna True si lo eliminó.
+            error_eliminar (str): Mensaje a mostrar si no se pudo eliminar.
+            tooltip_eliminar (str): Texto del botón de eliminar.
         """
         self.page = page
         self.dlg_modal = ft.AlertDialog(modal=True)
+        self.consultar = consultar
+        self.eliminar = eliminar
+        self.error_eliminar = error_eliminar
+        self.tooltip_eliminar = tooltip_eliminar
+        self.filas = {} # id -> fila, para actualizar solo la fila afectada
         self.table = ft.DataTable(
-            columns=[
-                ft.DataColumn(label=ft.Text("ID")),
-                ft.DataColumn(label=ft.Text("Tarea")),
-                ft.DataColumn(label=ft.Text("estado")),
-                ft.DataColumn(label=ft.Text("fecha_inicio")),
-                ft.DataColumn(label=ft.Text("fecha_fin")),
-                ft.DataColumn(label=ft.Text("Proyecto")),
-                ft.DataColumn(label=ft.Text("empleado")),
-                ft.DataColumn(label=ft.Text("Acciones")),
-            ],
+            columns=[ft.DataColumn(label=ft.Text(columna)) for columna in [*columnas, "Acciones"]],
             border=ft.border.all(1, ft.Colors.GREY),
         )
         self.actualizar_tabla() # Carga inicial de la tabla
 
-
     def actualizar_tabla(self):
-        data = Tarea.obtener_todos()
+        data = self.consultar()
         self._actualizar_filas(data)
 
     def _actualizar_filas(self, data):
-        new_rows = []
+        self.filas = {}
         for e in data:
-            new_rows.append(
-                ft.DataRow(
-                    cells=[
-                        ft.DataCell(ft.Text(str(e[0]))),
-                        ft.DataCell(ft.Text(f"{e[1]}")),
-                        ft.DataCell(ft.Text(f"{e[2]}")),
-                        ft.DataCell(ft.Text(e[3])),
-                        ft.DataCell(ft.Text(e[4])),
-                        ft.DataCell(ft.Text(Proyecto.obtener_nombre_proyecto(e[5]))),#Proyecto
-                        ft.DataCell(ft.Text(Empleados.obtener_nombre_empleado(e[6]))),#Empleado
-                        ft.DataCell(
-                            ft.IconButton(
-                                icon=ft.Icons.DELETE,
-                                tooltip="Eliminar Empleado",
-                                on_click=lambda ev, id=e[0]: self.eliminar_registro(ev, id),
-                            )
-                        )
-                    ]
-                )
-            )
-        self.table.rows = new_rows
+            self.filas[e[0]] = self._crear_fila(e)
+        self.table.rows = list(self.filas.values())
         self.page.update()
 
+    def _celdas(self, e):
+        """Celdas de datos de la fila de un registro (sin la de acciones)."""
+        raise NotImplementedError
+
+    def _crear_fila(self, e):
+        """Crea la fila de la tabla para un registro."""
+        return ft.DataRow(
+            cells=[
+                *self._celdas(e),
+                ft.DataCell(
+                    ft.IconButton(
+                        icon=ft.Icons.DELETE,
+                        tooltip=self.tooltip_eliminar,
+                        on_click=lambda ev, id=e[0]: self.eliminar_registro(ev, id),
+                    )
+                )
+            ]
+        )
+
+    def agregar(self, registro):
+        """
+        Agrega al final la fila de un registro recién guardado.
+
+        Args:
+            registro (tuple): Registro con el ID en la primera posición; None no hace nada.
+        """
+        if registro is None:
+            return
+        fila = self._crear_fila(registro)
+        self.filas[registro[0]] = fila
+        self.table.rows.append(fila)
+        self.table.update()
+
+    def reemplazar(self, registro):
+        """
+        Reemplaza la fila de un registro actualizado (o la agrega si no estaba en la tabla).
+
+        Args:
+            registro (tuple): Registro con el ID en la primera posición; None no hace nada.
+        """
+        if registro is None:
+            return
+        anterior = self.filas.get(registro[0])
+        if anterior is None:
+            self.agregar(registro)
+            return
+        fila = self._crear_fila(registro)
+        self.filas[registro[0]] = fila
+        self.table.rows[self.table.rows.index(anterior)] = fila
+        self.table.update()
+
     def eliminar_registro(self, e, id):
         """
-        Elimina pryecto de la base de datos y actualiza la tabla.
+        Elimina el registro de la base de datos y quita solo su fila de la tabla.
 
         """
-        Tarea.eliminar_registro(id)
-        self.actualizar_tabla()  # Llamada para actualizar la tabla
+        if not self.eliminar(id):
+            # Sigue en la base de datos: la fila se queda
+            mostrar_error(self.page, self.dlg_modal, self.error_eliminar)
+            return
+        fila = self.filas.pop(id, None)
+        if fila is not None:
+            self.table.rows.remove(fila)
+            self.table.update()
 
-    
     def construir_tabla(self):
         return ft.Container(content=self.table,expand=1)
-    
 
 
-class TablaEmpleados:
-    
+class TablaTareas(TablaBase):
+
     def __init__(self, page: ft.Page):
         """
-        Inicializa la tabla de empleados.
+        Inicializa la tabla de tareas.
 
         Args:
             page (ft.Page): La página de Flet en la que se mostrará la tabla.
         """
-        self.page = page
-        self.dlg_modal = ft.AlertDialog(modal=True)
-        self.table = ft.DataTable(
-            columns=[
-                ft.DataColumn(label=ft.Text("ID")),
-                ft.DataColumn(label=ft.Text("Empleado")),
-                ft.DataColumn(label=ft.Text("Correo")),
-                ft.DataColumn(label=ft.Text("telefono")),
-                ft.DataColumn(label=ft.Text("Acciones")),
-            ],
-            border=ft.border.all(1, ft.Colors.GREY),
+        super().__init__(
+            page,
+            columnas=["ID", "Tarea", "estado", "fecha_inicio", "fecha_fin", "Proyecto", "empleado"],
+            consultar=Tarea.obtener_todos_detallado,
+            eliminar=Tarea.eliminar_registro,
+            error_eliminar="No se pudo eliminar la tarea.",
+            tooltip_eliminar="Eliminar Tarea",
         )
-        self.actualizar_tabla() # Carga inicial de la tabla
 
+    def _celdas(self, e):
+        return [
+            ft.DataCell(ft.Text(str(e[0]))),
+            ft.DataCell(ft.Text(f"{e[1]}")),
+            ft.DataCell(ft.Text(f"{e[2]}")),
+            ft.DataCell(ft.Text(e[3])),
+            ft.DataCell(ft.Text(e[4])),
+            ft.DataCell(ft.Text(e[5] or "")),#Proyecto
+            ft.DataCell(ft.Text(e[6] or "")),#Empleado
+        ]
 
-    def actualizar_tabla(self):
-        data = Empleados.obtener_todos()
-        self._actualizar_filas(data)
 
-    def _actualizar_filas(self, data):
-        new_rows = []
-        for e in data:
-            new_rows.append(
-                ft.DataRow(
-                    cells=[
-                        ft.DataCell(ft.Text(str(e[0]))),
-                        ft.DataCell(ft.Text(f"{e[1]}")),
-                        ft.DataCell(ft.Text(f"{e[2]}")),
-                        ft.DataCell(ft.Text(e[3])),
-                        ft.DataCell(
-                            ft.IconButton(
-                                icon=ft.Icons.DELETE,
-                                tooltip="Eliminar Empleado",
-                                on_click=lambda ev, id=e[0]: self.eliminar_registro(ev, id),
-                            )
-                        )
-                    ]
-                )
-            )
-        self.table.rows = new_rows
-        self.page.update()
+class TablaEmpleados(TablaBase):
 
-  
-
-    def eliminar_registro(self, e, id):
-        """
-        Elimina pryecto de la base de datos y actualiza la tabla.
-
-        """
-        Empleados.eliminar_registro(id)
-        self.actualizar_tabla()  # Llamada para actualizar la tabla
-
-    
-    def construir_tabla(self):
-       
-        return ft.Container(content=self.table,expand=1)
-    
-
-class TablaProyectos:
-    
     def __init__(self, page: ft.Page):
         """
-        Inicializa la tabla de proyectos.
+        Inicializa la tabla de empleados.
 
         Args:
             page (ft.Page): La página de Flet en la que se mostrará la tabla.
         """
-        self.page = page
-        self.dlg_modal = ft.AlertDialog(modal=True)
-        self.table = ft.DataTable(
-            columns=[
-                ft.DataColumn(label=ft.Text("ID")),
-                ft.DataColumn(label=ft.Text("Proyecto")),
-                ft.DataColumn(label=ft.Text("Descripcion")),
-                ft.DataColumn(label=ft.Text("fecha inicio")),
-                ft.DataColumn(label=ft.Text("fecha fin")),
-                ft.DataColumn(label=ft.Text("Acciones")),
-            ],
-            border=ft.border.all(1, ft.Colors.GREY),
+        super().__init__(
+            page,
+            columnas=["ID", "Empleado", "Correo", "telefono"],
+            consultar=Empleados.obtener_todos,
+            eliminar=Empleados.eliminar_registro,
+            error_eliminar="No se pudo eliminar el empleado. Si tiene tareas asignadas, elimínelas primero.",
+            tooltip_eliminar="Eliminar Empleado",
         )
-        self.actualizar_tabla() # Carga inicial de la tabla
 
+    def _celdas(self, e):
+        return [
+            ft.DataCell(ft.Text(str(e[0]))),
+            ft.DataCell(ft.Text(f"{e[1]}")),
+            ft.DataCell(ft.Text(f"{e[2]}")),
+            ft.DataCell(ft.Text(e[3])),
+        ]
 
-    def actualizar_tabla(self):
-        data = Proyecto.obtener_todos()
-        self._actualizar_filas(data)
 
-    def _actualizar_filas(self, data):
-        new_rows = []
-        for e in data:
-            new_rows.append(
-                ft.DataRow(
-                    cells=[
-                        ft.DataCell(ft.Text(str(e[0]))),
-                        ft.DataCell(ft.Text(f"{e[1]}")),
-                        ft.DataCell(ft.Text(f"{e[2]}")),
-                        ft.DataCell(ft.Text(e[3])),
-                        ft.DataCell(ft.Text(e[4])),
-                        ft.DataCell(
-                            ft.IconButton(
-                                icon=ft.Icons.DELETE,
-                                tooltip="Eliminar Proyecto",
-                                on_click=lambda ev, id=e[0]: self.eliminar_registro(ev, id),
-                            )
-                        )
-                    ]
-                )
-            )
-        self.table.rows = new_rows
-        self.page.update()
+class TablaProyectos(TablaBase):
 
-  
-
-    def eliminar_registro(self, e, id):
+    def __init__(self, page: ft.Page):
         """
-        Elimina pryecto de la base de datos y actualiza la tabla.
+        Inicializa la tabla de proyectos.
 
+        Args:
+            page (ft.Page): La página de Flet en la que se mostrará la tabla.
         """
-        Proyecto.eliminar_registro(id)
-        self.actualizar_tabla()  # Llamada para actualizar la tabla
+        super().__init__(
+            page,
+            columnas=["ID", "Proyecto", "Descripcion", "fecha inicio", "fecha fin"],
+            consultar=Proyecto.obtener_todos,
+            eliminar=Proyecto.eliminar_registro,
+            error_eliminar="No se pudo eliminar el proyecto. Si tiene tareas, elimínelas primero.",
+            tooltip_eliminar="Eliminar Proyecto",
+        )
+
+    def _celdas(self, e):
+        return [
+            ft.DataCell(ft.Text(str(e[0]))),
+            ft.DataCell(ft.Text(f"{e[1]}")),
+            ft.DataCell(ft.Text(f"{e[2]}")),
+            ft.DataCell(ft.Text(e[3])),
+            ft.DataCell(ft.Text(e[4])),
+        ]
 
-    
-    def construir_tabla(self):
-       
-        return ft.Container(content=self.table,expand=1)
-    
 
 
 
@@ -1,69 +0,0 @@
-
-
-CREATE DATABASE IF NOT EXISTS colegio;
-USE colegio;
-
--- Tabla curso
-CREATE TABLE curso (
-    id_curso INT AUTO_INCREMENT PRIMARY KEY,
-    nombre VARCHAR(100) NOT NULL,
-    descripcion TEXT
-);
-
--- Tabla estudiante
-CREATE TABLE estudiante (
-    id_estudiante INT AUTO_INCREMENT PRIMARY KEY,
-    nombre VARCHAR(100) NOT NULL,
-    apellido VARCHAR(100) NOT NULL,
-    fecha_nacimiento DATE,
-    direccion VARCHAR(255),
-    telefono VARCHAR(20),
-    email VARCHAR(100),
-    id_curso INT,
-    FOREIGN KEY (id_curso) REFERENCES curso(id_curso) ON DELETE CASCADE
-);
-
--- Tabla materia
-CREATE TABLE materia (
-    id_materia INT AUTO_INCREMENT PRIMARY KEY,
-    nombre_materia VARCHAR(100) NOT NULL,
-    descripcion TEXT
-);
-
--- Tabla profesor
-CREATE TABLE profesor (
-    id_profesor INT AUTO_INCREMENT PRIMARY KEY,
-    nombre VARCHAR(100) NOT NULL,
-    apellido VARCHAR(100) NOT NULL,
-    email VARCHAR(100),
-    telefono VARCHAR(20)
-);
-
--- Tabla profesor_materia (relación muchos a muchos)
-CREATE TABLE profesor_materia (
-    id_profesor INT,
-    id_materia INT,
-    PRIMARY KEY (id_profesor, id_materia),
-    FOREIGN KEY (id_profesor) REFERENCES profesor(id_profesor),
-    FOREIGN KEY (id_materia) REFERENCES materia(id_materia)
-);
-
--- Tabla asistencia
-CREATE TABLE asistencia (
-    id_asistencia INT AUTO_INCREMENT PRIMARY KEY,
-    id_estudiante INT,
-    fecha DATE NOT NULL,
-    estado_asistencia ENUM('Presente', 'Ausente', 'Tarde') DEFAULT 'Presente',
-    FOREIGN KEY (id_estudiante) REFERENCES estudiante(id_estudiante) ON DELETE CASCADE
-);
-
--- Tabla notas
-CREATE TABLE notas (
-    id_nota INT AUTO_INCREMENT PRIMARY KEY,
-    id_estudiante INT,
-    id_materia INT,
-    nota DECIMAL(5,2) NOT NULL,
-    fecha DATE NOT NULL,
-    FOREIGN KEY (id_estudiante) REFERENCES estudiante(id_estudiante),
-    FOREIGN KEY (id_materia) REFERENCES materia(id_materia)
-);
\ No newline at end of file
@@ -1,17 +1,22 @@
+import os
+import time
+
+# Modo de medición del arranque: con XENTHRALL_MEDIR_ARRANQUE=1 se imprime cuánto tarda
+# cada etapa, desde que se carga este módulo hasta el primer frame de la ventana.
+MEDIR_ARRANQUE = os.environ.get("XENTHRALL_MEDIR_ARRANQUE") == "1"
+_inicio_arranque = time.perf_counter()
+
+def reportar_arranque(etapa: str):
+    """Imprime el tiempo transcurrido desde el inicio del arranque (solo en modo de medición)."""
+    if MEDIR_ARRANQUE:
+        print(f"[arranque] {etapa}: {(time.perf_counter() - _inicio_arranque) * 1000:.0f} ms")
+
 import flet as ft
-from models.conexion_sqlite import inicializar_db_colegio
-
-# VIEWS - Asegúrate de que estas importaciones funcionen según tu estructura de proyecto.
-from views.inicio import inicio 
-from views.cursos import cursos
-from views.materias import materias
-from views.estudiantes import estudiantes
-from views.profesores import profesores
-from views.notas_view import notas_view
-from views.asistencias_view import asistencias_view
-from views.reportes import reportes_view
-# Asegúrate que views/acerca_de.py contiene la versión flet_acerca_de_stateful_v3
-from views.acerca_de import acerca_de_view 
+# Las vistas no se importan aquí: cada constructor de main() importa su módulo en la primera visita.
+# models.conexion tampoco (carga el conector del motor elegido): se importa después del primer frame.
+from views.registro_vistas import RegistroVistas
+
+reportar_arranque("imports")
 
 # Lista de opciones del menú lateral
 def menu_lateral():
@@ -49,7 +54,7 @@ def menu_lateral():
     ]
 
 def main(page: ft.Page):
-    inicializar_db_colegio()
+    reportar_arranque("ventana creada")
     page.title = "Xenthrall - Academy"
     page.vertical_alignment = ft.MainAxisAlignment.CENTER
     page.horizontal_alignment = ft.CrossAxisAlignment.CENTER
@@ -58,10 +63,7 @@ def main(page: ft.Page):
 
     # Estado global de la aplicación
     app_state = {
-        "audio_control": ft.Audio( # ft.Audio está obsoleto, considerar migrar a flet_audio
-            src="assets/song.mp3", 
-            autoplay=False,
-        ),
+        "audio_control": None, # ft.Audio se crea recién al reproducir por primera vez (ver acerca_de.py)
         "is_music_playing": False,
         "acerca_de_view_is_active": False,
         "acerca_de_animation_task": None,
@@ -71,11 +73,60 @@ def main(page: ft.Page):
         "current_view_index": -1, 
     }
 
-    if app_state["audio_control"] not in page.overlay:
-        page.overlay.append(app_state["audio_control"])
-
     contenido_principal = ft.Column([], expand=True, alignment=ft.MainAxisAlignment.CENTER, horizontal_alignment=ft.CrossAxisAlignment.CENTER)
 
+    # --- Constructores de las vistas ---
+    # Cada uno importa su módulo recién en la primera visita, así el primer frame no espera
+    # a cargar todas las vistas (y PyInstaller sigue detectando los imports).
+    def vista_inicio():
+        from views.inicio import inicio
+        return inicio()
+
+    def vista_cursos():
+        from views.cursos import cursos
+        return cursos(page)
+
+    def vista_materias():
+        from views.materias import materias
+        return materias(page)
+
+    def vista_estudiantes():
+        from views.estudiantes import estudiantes
+        return estudiantes(page)
+
+    def vista_profesores():
+        from views.profesores import profesores
+        return profesores(page)
+
+    def vista_asistencias():
+        from views.asistencias_view import asistencias_view
+        return asistencias_view(page)
+
+    def vista_notas():
+        from views.notas_view import notas_view
+        return notas_view(page)
+
+    def vista_reportes():
+        from views.reportes import reportes_view
+        return reportes_view(page)
+
+    def vista_acerca_de():
+        from views.acerca_de import acerca_de_view
+        return acerca_de_view(page, app_state)
+
+    # Cada vista se construye en su primera visita y luego se reutiliza (ver RegistroVistas)
+    vistas = RegistroVistas(page)
+    vistas.registrar(0, vista_inicio)
+    vistas.registrar(1, vista_cursos)
+    vistas.registrar(2, vista_materias)
+    vistas.registrar(3, vista_estudiantes)
+    vistas.registrar(4, vista_profesores)
+    vistas.registrar(5, vista_asistencias)
+    vistas.registrar(6, vista_notas)
+    vistas.registrar(7, vista_reportes)
+    # "Acerca de" maneja su propia animación y estado en app_state: se construye en cada visita
+    vistas.registrar(8, vista_acerca_de, cachear=False)
+
     def close_app_action(): # Renombrada en versiones anteriores, puedes usar close_app si prefieres
         if app_state.get("is_music_playing"): # Usar .get() para seguridad
             audio_ctrl = app_state.get("audio_control")
@@ -85,6 +136,10 @@ def main(page: ft.Page):
         animation_task = app_state.get("acerca_de_animation_task")
         if animation_task and not animation_task.done():
             animation_task.cancel()
+        from models.asincrono import cerrar_ejecutor
+        from models.conexion import cerrar_conexiones
+        cerrar_ejecutor()
+        cerrar_conexiones()
         page.window_close()
 
     def cambiar_vista(index):
@@ -109,26 +164,11 @@ def main(page: ft.Page):
         app_state["current_view_index"] = index 
         contenido_principal.controls.clear()
 
-        # --- Cargar la nueva vista ---
-        if index == 0:
-            contenido_principal.controls.append(inicio()) # Asumiendo que inicio() no necesita app_state
-        elif index == 1:
-            contenido_principal.controls.append(cursos(page)) # Asumiendo que cursos() no necesita app_state
-        elif index == 2:
-            contenido_principal.controls.append(materias(page)) # Asumiendo que materias() no necesita app_state
-        elif index == 3:
-            contenido_principal.controls.append(estudiantes(page)) # Asumiendo que estudiantes() no necesita app_state
-        elif index == 4:
-            contenido_principal.controls.append(profesores(page)) # Asumiendo que profesores() no necesita app_state
-        elif index == 5:
-            contenido_principal.controls.append(asistencias_view(page)) # Asumiendo que asistencias_view() no necesita app_state
-        elif index == 6:
-            contenido_principal.controls.append(notas_view(page)) # Asumiendo que notas_view() no necesita app_state
-        elif index == 7:
-            contenido_principal.controls.append(reportes_view(page)) # Asumiendo que reportes_view() no necesita app_state
-        elif index == 8: # Vista "Acerca de"
+        # --- Cargar la nueva vista (construida solo en la primera visita) ---
+        if index == 8: # Vista "Acerca de"
             app_state["acerca_de_view_is_active"] = True 
-            contenido_principal.controls.append(acerca_de_view(page, app_state))
+        if index in vistas:
+            contenido_principal.controls.append(vistas.obtener(index))
         elif index == 9: # Salir
             close_app_action() # Usar el nombre corregido de la función
             return 
@@ -144,6 +184,7 @@ def main(page: ft.Page):
         label_type=ft.NavigationRailLabelType.ALL,
         bgcolor=ft.Colors.TEAL_200, # Corregido
         extended=False,
+        disabled=True, # Se habilita cuando la base de datos está lista (ver final de main)
         on_change=lambda e: cambiar_vista(e.control.selected_index),
     )
     
@@ -164,6 +205,23 @@ def main(page: ft.Page):
     )
 
     page.add(layout) 
+    reportar_arranque("primer frame")
+
+    # La base de datos se prepara con la ventana ya visible (la vista de inicio no la usa)
+    from models.conexion import inicializar_db_colegio
+    if not inicializar_db_colegio():
+        # Sin conexión o con una migración fallida las vistas abrirían sobre un esquema incompleto
+        contenido_principal.controls.clear()
+        contenido_principal.controls.append(ft.Text(
+            "No se pudo preparar la base de datos (ver el error en la consola). "
+            "Revise la conexión y vuelva a iniciar la aplicación.",
+            color=ft.Colors.RED, size=16,
+        ))
+        page.update()
+        return
+    nav.disabled = False
+    page.update()
+    reportar_arranque("base de datos lista")
 
 
 ft.app(target=main)
\ No newline at end of file
@@ -0,0 +1,181 @@
+from collections import deque
+from datetime import date, timedelta
+
+from models.conexion import conexion_db, Error
+
+# -----------------------------------
+# * Análisis de asistencia
+# -----------------------------------
+# Recorre una sola vez la asistencia de un curso, ordenada por estudiante y fecha (el orden del índice
+# idx_asistencia_estudiante_fecha_estado), y en esa misma pasada calcula:
+#   - por estudiante: ausencias y tardanzas, la racha más larga de ausencias seguidas y la racha actual
+#     (días con registro consecutivos), y el porcentaje de ausencia de los últimos 7 y 30 días;
+#   - por día: totales del curso, con los que se arman las tendencias semanales y las ventanas móviles.
+# En memoria quedan solo los totales por día y, por estudiante, sus registros de los últimos 30 días.
+
+TAMANO_BLOQUE = 5000 # Filas por fetchmany
+VENTANAS = (7, 30) # Días de las ventanas móviles
+UMBRAL_AUSENTISMO_CRONICO = 10.0 # % de días con registro en que faltó (criterio habitual: 10% o más)
+
+
+def _consulta_asistencia_curso(id_curso: int, fecha_inicio: date = None, fecha_fin: date = None):
+    sql = (
+        "SELECT id_estudiante, fecha, estado_asistencia FROM asistencia "
+        "WHERE id_estudiante IN (SELECT id_estudiante FROM estudiante WHERE id_curso = ?)"
+    )
+    params = [id_curso]
+    if fecha_inicio:
+        sql += " AND fecha >= ?"
+        params.append(str(fecha_inicio))
+    if fecha_fin:
+        sql += " AND fecha <= ?"
+        params.append(str(fecha_fin))
+    return sql + " ORDER BY id_estudiante, fecha", tuple(params)
+
+
+class _Estudiante:
+    """Acumulador de la pasada por los registros de un estudiante (en orden de fecha)."""
+    __slots__ = ("registros", "ausencias", "tardanzas", "racha", "racha_maxima", "recientes")
+
+    def __init__(self):
+        self.registros = self.ausencias = self.tardanzas = 0
+        self.racha = self.racha_maxima = 0
+        self.recientes = deque() # (fecha, estado) de los últimos max(VENTANAS) días
+
+    def agregar(self, fecha: date, estado: str):
+        self.registros += 1
+        if estado == "Ausente":
+            self.ausencias += 1
+            self.racha += 1
+            self.racha_maxima = max(self.racha_maxima, self.racha)
+        else:
+            self.racha = 0
+            if estado == "Tarde":
+                self.tardanzas += 1
+        self.recientes.append((fecha, estado))
+        limite = fecha - timedelta(days=max(VENTANAS))
+        while self.recientes[0][0] <= limite:
+            self.recientes.popleft()
+
+    def metricas(self, referencia: date) -> dict:
+        """Métricas del estudiante; las ventanas terminan en la fecha `referencia`."""
+        metricas = {
+            "registros": self.registros,
+            "ausencias": self.ausencias,
+            "tardanzas": self.tardanzas,
+            "ausencia": self.ausencias * 100 / self.registros if self.registros else 0.0,
+            "racha_maxima": self.racha_maxima,
+            "racha_actual": self.racha,
+        }
+        for dias in VENTANAS:
+            # Los registros del estudiante terminan en su última fecha, que puede ser anterior a la referencia
+            ventana = [estado for fecha, estado in self.recientes if fecha > referencia - timedelta(days=dias)]
+            metricas[f"ausencia_{dias}"] = (
+                ventana.count("Ausente") * 100 / len(ventana) if ventana else None
+            )
+        metricas["cronico"] = metricas["ausencia"] >= UMBRAL_AUSENTISMO_CRONICO
+        return metricas
+
+
+def _tendencias(dias):
+    """
+    Totales por semana con ventanas móviles.
+    :param dias: Lista ordenada de (fecha, registros, ausentes, tardes) del curso
+    :return: Lista de diccionarios {"semana" (lunes), "registros", "ausencia", "tardanza", y por cada ventana
+             "ausencia_N" y "tardanza_N"}; las ventanas terminan en el último día con registro de la semana.
+    """
+    semanas = []
+    inicio = {dias_ventana: 0 for dias_ventana in VENTANAS} # Primer día dentro de cada ventana
+    sumas = {dias_ventana: [0, 0, 0] for dias_ventana in VENTANAS} # registros, ausentes, tardes
+    for fecha, registros, ausentes, tardes in dias:
+        for dias_ventana in VENTANAS:
+            suma = sumas[dias_ventana]
+            suma[0] += registros
+            suma[1] += ausentes
+            suma[2] += tardes
+            limite = fecha - timedelta(days=dias_ventana)
+            while dias[inicio[dias_ventana]][0] <= limite:
+                _, r, a, t = dias[inicio[dias_ventana]]
+                suma[0] -= r
+                suma[1] -= a
+                suma[2] -= t
+                inicio[dias_ventana] += 1
+
+        lunes = fecha - timedelta(days=fecha.weekday())
+        if not semanas or semanas[-1]["semana"] != lunes:
+            semanas.append({"semana": lunes, "registros": 0, "ausentes": 0, "tardes": 0})
+        semana = semanas[-1]
+        semana["registros"] += registros
+        semana["ausentes"] += ausentes
+        semana["tardes"] += tardes
+        # Se sobrescribe en cada día: queda el valor del último día de la semana
+        for dias_ventana, (r, a, t) in sumas.items():
+            semana[f"ausencia_{dias_ventana}"] = a * 100 / r
+            semana[f"tardanza_{dias_ventana}"] = t * 100 / r
+
+    for semana in semanas:
+        semana["ausencia"] = semana.pop("ausentes") * 100 / semana["registros"]
+        semana["tardanza"] = semana.pop("tardes") * 100 / semana["registros"]
+    return semanas
+
+
+def analizar_asistencia_curso(id_curso: int, rango=None):
+    """
+    Analiza la asistencia de un curso con una consulta de sus estudiantes y un recorrido ordenado de sus registros.
+    :param id_curso: ID del curso
+    :param rango: Tupla opcional (fecha_inicio, fecha_fin), cualquiera puede ser None. Las ventanas móviles
+                  de cada estudiante terminan en fecha_fin o, si no se indica, en el último registro del curso.
+    :return: Diccionario {"estudiantes": [(id_estudiante, nombre, apellido, métricas)] ordenado de mayor a menor
+             ausencia, "semanas": [tendencia por semana] (ver _tendencias)}; None si hay error.
+    """
+    fecha_inicio, fecha_fin = rango or (None, None)
+    acumulados = {}
+    dias = {} # fecha -> [registros, ausentes, tardes]
+    fechas = {} # Texto de la fecha -> date (cada fecha se repite en todos los estudiantes)
+    with conexion_db() as (conn, cursor):
+        if not conn:
+            return None
+        try:
+            cursor.execute(
+                "SELECT id_estudiante, nombre, apellido FROM estudiante WHERE id_curso = ?", (id_curso,)
+            )
+            estudiantes = cursor.fetchall()
+
+            cursor.execute(*_consulta_asistencia_curso(id_curso, fecha_inicio, fecha_fin))
+            id_actual, actual = None, None
+            while True:
+                bloque = cursor.fetchmany(TAMANO_BLOQUE)
+                if not bloque:
+                    break
+                for id_estudiante, fecha, estado in bloque:
+                    if id_estudiante != id_actual:
+                        id_actual, actual = id_estudiante, _Estudiante()
+                        acumulados[id_estudiante] = actual
+                    dia = fechas.get(fecha)
+                    if dia is None:
+                        # SQLite devuelve texto y MySQL objetos date
+                        dia = fechas[fecha] = fecha if isinstance(fecha, date) else date.fromisoformat(fecha)
+                    actual.agregar(dia, estado)
+                    totales = dias.get(dia)
+                    if totales is None:
+                        totales = dias[dia] = [0, 0, 0]
+                    totales[0] += 1
+                    if estado == "Ausente":
+                        totales[1] += 1
+                    elif estado == "Tarde":
+                        totales[2] += 1
+        except Error as e:
+            print(f"Error en analizar_asistencia_curso: {e}")
+            return None
+
+    referencia = fecha_fin or (max(dias) if dias else date.today())
+    sin_registros = _Estudiante()
+    resultado = [
+        (id_estudiante, nombre, apellido, acumulados.get(id_estudiante, sin_registros).metricas(referencia))
+        for id_estudiante, nombre, apellido in estudiantes
+    ]
+    resultado.sort(key=lambda fila: (-fila[3]["ausencia"], -fila[3]["racha_maxima"], fila[2] or "", fila[1] or ""))
+    return {
+        "estudiantes": resultado,
+        "semanas": _tendencias(sorted((fecha, *totales) for fecha, totales in dias.items())),
+    }
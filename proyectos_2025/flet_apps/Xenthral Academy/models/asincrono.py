@@ -0,0 +1,48 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from models.conexion import TAMANO_POOL
+
+# Hilos dedicados a la base de datos: tantos como conexiones tiene el pool,
+# así ninguna consulta ocupa un hilo esperando a que se libere una conexión.
+_ejecutor = ThreadPoolExecutor(max_workers=TAMANO_POOL, thread_name_prefix="db")
+
+
+async def ejecutar(funcion, *args, **kwargs):
+    """
+    Ejecuta una función bloqueante de la base de datos en el pool de hilos
+    sin bloquear el event loop de Flet.
+
+    :param funcion: Función o método a ejecutar
+    :return: Lo que retorne la función
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_ejecutor, functools.partial(funcion, *args, **kwargs))
+
+
+class Asincrono:
+    """
+    Fachada asíncrona sobre un modelo (clase o instancia).
+
+    Cada método del objeto envuelto se expone como una corrutina que corre en el pool de hilos:
+
+        cursos = await Asincrono(Curso).obtener_todos()
+        await Asincrono(nuevo_curso).guardar_registro()
+    """
+    def __init__(self, objetivo):
+        self._objetivo = objetivo
+
+    def __getattr__(self, nombre):
+        atributo = getattr(self._objetivo, nombre)
+        if not callable(atributo):
+            return atributo
+
+        async def llamada(*args, **kwargs):
+            return await ejecutar(atributo, *args, **kwargs)
+        return llamada
+
+
+def cerrar_ejecutor():
+    """Detiene el pool de hilos (al cerrar la aplicación)."""
+    _ejecutor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,161 @@
+import threading
+from collections import OrderedDict
+
+# Cachés registradas, por nombre de tabla (ver estadisticas_cache)
+CACHES = {}
+
+
+class CacheTabla:
+    """
+    Caché en memoria (read-through) de todas las filas de una tabla pequeña que cambia poco,
+    como curso, materia o profesor.
+
+    La primera lectura consulta la base de datos y guarda el resultado; las siguientes lo reutilizan
+    hasta que un método de escritura del modelo llama a `invalidar()`. Cuenta aciertos y fallos.
+    """
+    def __init__(self, nombre: str):
+        """
+        Args:
+            nombre (str): Nombre de la tabla (clave en CACHES).
+        """
+        self.nombre = nombre
+        self.aciertos = 0
+        self.fallos = 0
+        self._filas = None
+        self._version = 0 # Cambia en cada invalidación
+        self._lock = threading.Lock()
+        CACHES[nombre] = self
+
+    def obtener(self, consultar):
+        """
+        Retorna las filas guardadas o, si no hay, las consulta y las guarda.
+
+        Args:
+            consultar: Función sin argumentos que consulta la tabla; retorna la lista de filas
+                o None si no pudo conectarse (en ese caso no se guarda nada).
+
+        Returns:
+            list: Copia de la lista de filas (tuplas), vacía si la consulta falló.
+        """
+        with self._lock:
+            if self._filas is not None:
+                self.aciertos += 1
+                return list(self._filas)
+            self.fallos += 1
+            version = self._version
+
+        filas = consultar()
+        if filas is None:
+            return []
+        with self._lock:
+            # Si hubo una escritura mientras se consultaba, el resultado puede estar desactualizado
+            if version == self._version:
+                self._filas = tuple(filas)
+        return list(filas)
+
+    def invalidar(self):
+        """Descarta las filas guardadas; la próxima lectura vuelve a consultar la base de datos."""
+        with self._lock:
+            self._filas = None
+            self._version += 1
+
+    def estadisticas(self) -> dict:
+        """Retorna los contadores de la caché: aciertos, fallos, tasa de aciertos y filas guardadas."""
+        with self._lock:
+            total = self.aciertos + self.fallos
+            return {
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "tasa_aciertos": self.aciertos / total if total else 0.0,
+                "filas": len(self._filas) if self._filas is not None else 0,
+            }
+
+
+class CacheLRU:
+    """
+    Caché acotada clave -> valor con desalojo del usado hace más tiempo (LRU), para resolver
+    IDs a nombres sin consultar la base de datos en cada pulsación o en cada fila de una tabla.
+
+    También guarda los IDs que no existen (valor None). Los métodos de escritura del modelo
+    la mantienen al día con `guardar` (alta o edición) e `invalidar` (baja).
+    """
+    def __init__(self, nombre: str, max_elementos: int = 1024):
+        """
+        Args:
+            nombre (str): Nombre de la caché (clave en CACHES).
+            max_elementos (int): Cantidad máxima de claves guardadas.
+        """
+        self.nombre = nombre
+        self.max_elementos = max_elementos
+        self.aciertos = 0
+        self.fallos = 0
+        self._valores = OrderedDict() # clave -> valor, de la menos a la más usada
+        self._version = 0
+        self._lock = threading.Lock()
+        CACHES[nombre] = self
+
+    def obtener(self, clave, consultar):
+        """
+        Retorna el valor guardado para la clave o lo consulta y lo guarda.
+
+        Args:
+            clave: Normalmente el ID.
+            consultar: Función que recibe la clave y retorna su valor (None si no existe).
+        """
+        with self._lock:
+            if clave in self._valores:
+                self._valores.move_to_end(clave)
+                self.aciertos += 1
+                return self._valores[clave]
+            self.fallos += 1
+            version = self._version
+
+        valor = consultar(clave)
+        with self._lock:
+            # Una escritura durante la consulta puede haber dejado el valor desactualizado
+            if version == self._version:
+                self._guardar(clave, valor)
+        return valor
+
+    def guardar(self, clave, valor):
+        """Escritura directa (write-through): guarda el valor nuevo de una clave."""
+        with self._lock:
+            self._version += 1
+            self._guardar(clave, valor)
+
+    def _guardar(self, clave, valor):
+        self._valores[clave] = valor
+        self._valores.move_to_end(clave)
+        while len(self._valores) > self.max_elementos:
+            self._valores.popitem(last=False)
+
+    def invalidar(self, clave=None):
+        """Descarta una clave, o todas si no se indica ninguna."""
+        with self._lock:
+            self._version += 1
+            if clave is None:
+                self._valores.clear()
+            else:
+                self._valores.pop(clave, None)
+
+    def estadisticas(self) -> dict:
+        """Retorna los contadores de la caché: aciertos, fallos, tasa de aciertos y claves guardadas."""
+        with self._lock:
+            total = self.aciertos + self.fallos
+            return {
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "tasa_aciertos": self.aciertos / total if total else 0.0,
+                "filas": len(self._valores),
+            }
+
+
+def estadisticas_cache() -> dict:
+    """Retorna {tabla: estadísticas} de todas las cachés registradas."""
+    return {nombre: cache.estadisticas() for nombre, cache in CACHES.items()}
+
+
+def invalidar_todo():
+    """Descarta todas las cachés (p. ej. después de modificar la base de datos por fuera de los modelos)."""
+    for cache in CACHES.values():
+        cache.invalidar()
@@ -0,0 +1,34 @@
+# Punto único de acceso a la base de datos, independiente del motor.
+#
+# El motor se elige con la variable de entorno XENTHRALL_BACKEND ("sqlite" por defecto, o "mysql").
+# Cada motor es un módulo (driver) que expone los mismos nombres:
+#
+# - TAMANO_POOL, Error (excepción base del conector)
+# - conexion_db() -> context manager que presta (conn, cursor), o (None, None) si no hay conexión
+# - cerrar_conexiones(), inicializar_db_colegio(), version_esquema()
+# - sql_upsert(tabla, columnas, claves, actualizar) -> INSERT ... con actualización si la fila existe
+# - explicar_consulta(query, params) -> plan de ejecución en formato de texto de SQLite
+#
+# Los modelos escriben sus consultas con marcadores `?`; el driver de MySQL los traduce a `%s`.
+import os
+
+BACKENDS = ("sqlite", "mysql")
+BACKEND = os.environ.get("XENTHRALL_BACKEND", "sqlite").lower()
+
+# Solo se importa el conector del motor elegido (mysql.connector no es necesario con SQLite)
+if BACKEND == "mysql":
+    from models import conexion_mysql as driver
+elif BACKEND == "sqlite":
+    from models import conexion_sqlite as driver
+else:
+    raise ValueError(f"XENTHRALL_BACKEND='{BACKEND}' no es válido; opciones: {', '.join(BACKENDS)}")
+
+TAMANO_POOL = driver.TAMANO_POOL
+Error = driver.Error
+
+conexion_db = driver.conexion_db
+cerrar_conexiones = driver.cerrar_conexiones
+inicializar_db_colegio = driver.inicializar_db_colegio
+version_esquema = driver.version_esquema
+sql_upsert = driver.sql_upsert
+explicar_consulta = driver.explicar_consulta
@@ -0,0 +1,265 @@
+import functools
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+import mysql.connector
+
+from models.migraciones_mysql import aplicar_migraciones, version_actual
+
+db_name = "colegio"
+
+# Parámetros de conexión
+DB_CONFIG = {
+    "host": "localhost",
+    "user": "root",
+    "password": "xenthrall1@",
+    "database": db_name,
+}
+
+# Configuración del pool de conexiones
+TAMANO_POOL = 5                 # Conexiones máximas abiertas a la vez
+VERIFICAR_SI_INACTIVA_SEG = 30  # Hacer ping al prestar una conexión que lleva este tiempo sin usarse
+INTENTOS_RECONEXION = 3
+ESPERA_RECONEXION_SEG = 1
+ESPERA_MAXIMA_POOL_SEG = 10     # Tiempo máximo esperando una conexión libre
+
+# Excepción base de este motor (ver models/conexion.py)
+Error = mysql.connector.Error
+
+
+def conectar_db():
+    conn = mysql.connector.connect(**DB_CONFIG)
+    cursor = conn.cursor()
+
+    return conn, cursor
+
+
+@functools.lru_cache(maxsize=256)
+def _traducir(query: str) -> str:
+    """Cambia los marcadores `?` de los modelos por los `%s` de mysql.connector."""
+    return query.replace("?", "%s")
+
+
+class CursorMySQL:
+    """
+    Cursor de mysql.connector que acepta las consultas de los modelos escritas con `?`.
+    El resto de atributos (fetchall, lastrowid, rowcount...) se delegan al cursor original.
+    Los `?` dentro de literales de texto no se admiten: los valores siempre van como parámetros.
+    """
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def execute(self, query, params=()):
+        return self._cursor.execute(_traducir(query), params)
+
+    def executemany(self, query, seq_params):
+        return self._cursor.executemany(_traducir(query), seq_params)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __getattr__(self, nombre):
+        return getattr(self._cursor, nombre)
+
+
+class PoolConexiones:
+    """
+    Pool acotado de conexiones MySQL reutilizables.
+
+    Evita el handshake TCP + autenticación en cada consulta. Al prestar una conexión
+    que estuvo inactiva se verifica con ping y, si el servidor la cerró, se reconecta.
+    """
+    def __init__(self, tamano: int = TAMANO_POOL):
+        self.tamano = tamano
+        self._libres = queue.LifoQueue(maxsize=tamano)
+        self._creadas = 0
+        self._lock = threading.Lock()
+
+    def _crear(self):
+        with self._lock:
+            if self._creadas >= self.tamano:
+                return None
+            self._creadas += 1
+        try:
+            conn, cursor = conectar_db()
+            cursor.close()
+            return conn
+        except mysql.connector.Error:
+            with self._lock:
+                self._creadas -= 1
+            raise
+
+    def _verificar(self, conn, ultimo_uso):
+        """Health-check al prestar: ping (con reconexión) si la conexión estuvo inactiva."""
+        if time.monotonic() - ultimo_uso < VERIFICAR_SI_INACTIVA_SEG:
+            return conn
+        try:
+            conn.ping(reconnect=True, attempts=INTENTOS_RECONEXION, delay=ESPERA_RECONEXION_SEG)
+            return conn
+        except mysql.connector.Error as e:
+            print(f"Conexión del pool descartada: {e}")
+            self._descartar(conn)
+            return self._crear()
+
+    def _tomar(self):
+        try:
+            conn, ultimo_uso = self._libres.get_nowait()
+            conn = self._verificar(conn, ultimo_uso)
+            if conn:
+                return conn
+        except queue.Empty:
+            pass
+
+        conn = self._crear()
+        if conn:
+            return conn
+
+        try:
+            conn, ultimo_uso = self._libres.get(timeout=ESPERA_MAXIMA_POOL_SEG)
+        except queue.Empty:
+            raise mysql.connector.errors.PoolError("No hay conexiones disponibles en el pool")
+        return self._verificar(conn, ultimo_uso) or self._crear()
+
+    def _devolver(self, conn):
+        try:
+            if conn.in_transaction:
+                conn.rollback() # No dejar transacciones (ni snapshots de lectura) abiertas
+            self._libres.put_nowait((conn, time.monotonic()))
+        except (mysql.connector.Error, queue.Full):
+            self._descartar(conn)
+
+    def _descartar(self, conn):
+        with self._lock:
+            self._creadas -= 1
+        try:
+            conn.close()
+        except mysql.connector.Error:
+            pass
+
+    @contextmanager
+    def conexion(self):
+        """
+        Presta una conexión del pool.
+        Uso:
+            with pool.conexion() as (conn, cursor):
+                ...
+        Entrega (None, None) si no fue posible conectar, igual que el pool de SQLite.
+        """
+        try:
+            conn = self._tomar()
+        except mysql.connector.Error as e:
+            print(f"Error al conectar a la base de datos: {e}")
+            yield None, None
+            return
+
+        cursor = conn.cursor()
+        try:
+            yield conn, CursorMySQL(cursor)
+        except BaseException:
+            try:
+                conn.rollback()
+            except mysql.connector.Error:
+                pass
+            raise
+        finally:
+            try:
+                cursor.close()
+            except mysql.connector.Error:
+                pass
+            self._devolver(conn)
+
+    def cerrar(self):
+        """Cierra las conexiones libres del pool."""
+        while True:
+            try:
+                conn, _ = self._libres.get_nowait()
+            except queue.Empty:
+                break
+            self._descartar(conn)
+
+
+_pool = PoolConexiones()
+
+
+def conexion_db():
+    """Context manager que presta (conn, cursor) del pool compartido."""
+    return _pool.conexion()
+
+
+def cerrar_conexiones():
+    """Cierra las conexiones abiertas por el pool."""
+    _pool.cerrar()
+
+
+def sql_upsert(tabla: str, columnas, claves, actualizar) -> str:
+    """
+    Arma un INSERT que actualiza la fila si ya existe una con la misma clave única.
+    :param tabla: Nombre de la tabla
+    :param columnas: Columnas del INSERT (un `?` por cada una)
+    :param claves: Columnas del índice único (MySQL lo deduce del índice, se reciben por compatibilidad)
+    :param actualizar: Columnas que se sobrescriben si la fila ya existe
+    :return: Consulta SQL
+    """
+    marcadores = ", ".join("?" for _ in columnas)
+    cambios = ", ".join(f"{c} = VALUES({c})" for c in actualizar)
+    return f"INSERT INTO {tabla} ({', '.join(columnas)}) VALUES ({marcadores}) ON DUPLICATE KEY UPDATE {cambios}"
+
+
+def explicar_consulta(query, params=()):
+    """
+    Devuelve el plan de ejecución de una consulta (EXPLAIN) con el mismo formato de texto que
+    EXPLAIN QUERY PLAN de SQLite ("SCAN t" / "SEARCH t USING INDEX i"), así Reportes.verificar_planes
+    sirve para los dos motores.
+    :return: Lista con el detalle de cada tabla del plan o None si hay error.
+    """
+    with conexion_db() as (conn, cursor):
+        if not conn:
+            return None
+        try:
+            cursor.execute(f"EXPLAIN {query}", params)
+            columnas = [c[0] for c in cursor.description]
+            plan = []
+            for fila in cursor.fetchall():
+                paso = dict(zip(columnas, fila))
+                tabla, tipo, indice = paso["table"], paso["type"], paso["key"]
+                if tipo == "ALL":
+                    plan.append(f"SCAN {tabla}")
+                elif tipo == "index":
+                    plan.append(f"SCAN {tabla} USING COVERING INDEX {indice}")
+                else:
+                    plan.append(f"SEARCH {tabla} USING INDEX {indice}")
+            return plan
+        except mysql.connector.Error as e:
+            print(f"Error obteniendo el plan de la consulta: {e}")
+            return None
+
+
+def version_esquema():
+    """
+    Lee la última versión del esquema registrada en schema_migrations.
+    :return: La versión, 0 si la base es nueva o anterior al control de versiones, None si hay error.
+    """
+    with conexion_db() as (conn, cursor):
+        if not conn:
+            return None
+        try:
+            return version_actual(cursor)
+        except mysql.connector.Error as e:
+            print(f"Error leyendo la versión del esquema: {e}")
+            return None
+
+
+def inicializar_db_colegio():
+    """
+    Aplica las migraciones pendientes del esquema (ver models/migraciones_mysql.py).
+    La base de datos `db_name` debe existir (ver models/script_crear_db.sql).
+    En los arranques normales el esquema ya está al día y solo se consulta schema_migrations.
+    :return: True si el esquema quedó al día, False si hubo un error
+    """
+    with conexion_db() as (conn, cursor):
+        if not conn:
+            print("No se pudo conectar a la base de datos para aplicar las migraciones.")
+            return False
+        return aplicar_migraciones(conn, cursor) is not None
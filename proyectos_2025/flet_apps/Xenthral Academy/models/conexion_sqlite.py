@@ -0,0 +1,310 @@
+import sqlite3
+import queue
+import threading
+from contextlib import contextmanager
+
+from models.migraciones_sqlite import aplicar_migraciones, version_actual
+
+# Nombre del archivo de la base de datos
+DB_NAME = "colegio_db.sqlite"
+# Ruta completa al archivo de la base de datos en la raíz del proyecto
+# __file__ se refiere al archivo actual (donde se ejecuta este código)
+
+# Tamaño máximo del pool de conexiones reutilizables
+TAMANO_POOL = 5
+ESPERA_MAXIMA_POOL_SEG = 10 # Tiempo máximo esperando una conexión libre (igual que en MySQL)
+
+# Perfiles de durabilidad/rendimiento. journal_mode queda guardado en el archivo y se aplica
+# una vez en inicializar_db_colegio(); el resto se aplica a cada conexión del pool al crearla.
+PERFILES_SQLITE = {
+    # WAL: las lecturas no bloquean a la escritura ni al revés. Con synchronous=NORMAL
+    # un corte de luz puede perder los últimos commits, pero la base no se corrompe.
+    "equilibrado": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,       # ms de espera si otra conexión está escribiendo
+        "cache_size": -16000,       # negativo = KiB (16 MB por conexión)
+        "mmap_size": 67108864,      # 64 MB de lectura mapeada en memoria
+        "temp_store": "DEFAULT",    # MEMORY resultó más lento en los GROUP BY de los reportes
+    },
+    # WAL con cada commit sincronizado a disco (más lento al escribir, nada se pierde).
+    "seguro": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "busy_timeout": 5000,
+        "cache_size": -16000,
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+    },
+    # Comportamiento por defecto de SQLite (journal de reversión).
+    "compatible": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "busy_timeout": 5000,
+        "cache_size": -2000,
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+    },
+}
+# Perfil activo
+PERFIL_SQLITE = "equilibrado"
+
+# Excepción base de este motor (ver models/conexion.py)
+Error = sqlite3.Error
+
+
+def conectar_db():
+    """
+    Crea la conexión a la base de datos, activa las claves foráneas y aplica
+    los PRAGMAs por conexión del perfil PERFIL_SQLITE.
+    Returns:
+        tuple: (conn, cursor) si la conexión es exitosa, de lo contrario (None, None).
+    """
+    conn = None
+    cursor = None
+    try:
+        # check_same_thread=False: el pool entrega cada conexión a un solo hilo a la vez,
+        # pero no siempre al mismo hilo que la creó (Flet ejecuta los eventos en un ThreadPool).
+        conn = sqlite3.connect(DB_NAME, check_same_thread=False)
+        conn.execute("PRAGMA foreign_keys = ON;") # Habilitar claves foráneas
+        perfil = PERFILES_SQLITE[PERFIL_SQLITE]
+        for pragma in ("synchronous", "busy_timeout", "cache_size", "mmap_size", "temp_store"):
+            conn.execute(f"PRAGMA {pragma} = {perfil[pragma]};")
+        cursor = conn.cursor()
+        # No imprimimos aquí para evitar mensajes repetitivos desde execute_query
+        return conn, cursor
+    except sqlite3.Error as e:
+        print(f"Error al conectar a la base de datos: {e}")
+        if conn:
+            conn.close()
+        return None, None
+
+
+class PoolConexiones:
+    """
+    Pool pequeño y acotado de conexiones SQLite.
+
+    Las conexiones se crean bajo demanda (hasta `tamano`), se configuran una sola vez
+    (PRAGMAs) y se reutilizan entre consultas en lugar de abrir el archivo cada vez.
+    """
+    def __init__(self, tamano: int = TAMANO_POOL):
+        self.tamano = tamano
+        self._libres = queue.LifoQueue(maxsize=tamano)
+        self._creadas = 0
+        self._lock = threading.Lock()
+
+    def _tomar(self):
+        """
+        Retorna una conexión libre, crea una nueva si hay cupo o espera a que se libere una.
+        Si después de ESPERA_MAXIMA_POOL_SEG no se liberó ninguna lanza sqlite3.OperationalError.
+        """
+        try:
+            return self._libres.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            crear = self._creadas < self.tamano
+            if crear:
+                self._creadas += 1
+        if crear:
+            conn, _ = conectar_db()
+            if not conn:
+                with self._lock:
+                    self._creadas -= 1
+            return conn
+
+        try:
+            return self._libres.get(timeout=ESPERA_MAXIMA_POOL_SEG)
+        except queue.Empty:
+            raise sqlite3.OperationalError("No hay conexiones disponibles en el pool")
+
+    def _devolver(self, conn):
+        """Deja la conexión limpia (sin transacción abierta) y la devuelve al pool."""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            self._libres.put_nowait(conn)
+        except (sqlite3.Error, queue.Full):
+            self._descartar(conn)
+
+    def _descartar(self, conn):
+        with self._lock:
+            self._creadas -= 1
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    @contextmanager
+    def conexion(self):
+        """
+        Presta una conexión del pool.
+        Uso:
+            with pool.conexion() as (conn, cursor):
+                ...
+        Entrega (None, None) si no fue posible conectar y lanza sqlite3.OperationalError si el pool
+        sigue agotado después de ESPERA_MAXIMA_POOL_SEG. Si el bloque lanza una excepción
+        se revierte la transacción pendiente; los commits siguen siendo explícitos.
+        """
+        conn = self._tomar()
+        if not conn:
+            yield None, None
+            return
+
+        cursor = conn.cursor()
+        try:
+            yield conn, cursor
+        except BaseException:
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                pass
+            raise
+        finally:
+            cursor.close()
+            self._devolver(conn)
+
+    def cerrar(self):
+        """Cierra todas las conexiones libres del pool (al salir de la aplicación)."""
+        while True:
+            try:
+                conn = self._libres.get_nowait()
+            except queue.Empty:
+                break
+            self._descartar(conn)
+
+
+_pool = PoolConexiones()
+
+
+def conexion_db():
+    """
+    Context manager que presta una conexión reutilizable del pool global.
+    Returns:
+        tuple: (conn, cursor), o (None, None) si la conexión falla.
+    """
+    return _pool.conexion()
+
+
+def cerrar_conexiones():
+    """
+    Cierra las conexiones abiertas por el pool. Antes ejecuta PRAGMA optimize, que actualiza
+    solo las estadísticas del planificador que hagan falta (SQLite recomienda hacerlo al cerrar).
+    """
+    with conexion_db() as (conn, cursor):
+        if conn:
+            try:
+                cursor.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                print(f"Error ejecutando PRAGMA optimize: {e}")
+    _pool.cerrar()
+
+
+def execute_query(query, params=None):
+    """
+    Ejecuta una consulta en la base de datos usando una conexión del pool.
+    """
+    with conexion_db() as (conn, cursor):
+        if not conn or not cursor:
+            print("No se pudo conectar a la base de datos para ejecutar la consulta.")
+            return False # Indicar fallo
+
+        try:
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+            conn.commit()
+            # print(f"Consulta ejecutada exitosamente: {query[:60]}...") # Opcional para depuración
+            return True # Indicar éxito
+        except sqlite3.Error as e:
+            print(f"Error ejecutando la consulta: {e}")
+            print(f"Consulta: {query}")
+            conn.rollback() # Revertir cambios en caso de error
+            return False # Indicar fallo
+
+def aplicar_modo_journal():
+    """
+    Aplica el journal_mode del perfil activo. El modo queda guardado en el archivo
+    de la base de datos, así que basta con hacerlo una vez al iniciar.
+    :return: El modo de journal resultante o None si hay error.
+    """
+    modo = PERFILES_SQLITE[PERFIL_SQLITE]["journal_mode"]
+    with conexion_db() as (conn, cursor):
+        if not conn:
+            return None
+        try:
+            cursor.execute(f"PRAGMA journal_mode = {modo};")
+            resultado = cursor.fetchone()[0]
+            if resultado.upper() != modo.upper():
+                print(f"No se pudo activar journal_mode={modo}; se mantiene '{resultado}'.")
+            return resultado
+        except sqlite3.Error as e:
+            print(f"Error aplicando journal_mode: {e}")
+            return None
+
+def sql_upsert(tabla: str, columnas, claves, actualizar) -> str:
+    """
+    Arma un INSERT que actualiza la fila si ya existe una con la misma clave única.
+    :param tabla: Nombre de la tabla
+    :param columnas: Columnas del INSERT (un `?` por cada una)
+    :param claves: Columnas del índice único que detecta el conflicto
+    :param actualizar: Columnas que se sobrescriben si la fila ya existe
+    :return: Consulta SQL
+    """
+    marcadores = ", ".join("?" for _ in columnas)
+    cambios = ", ".join(f"{c} = excluded.{c}" for c in actualizar)
+    return (
+        f"INSERT INTO {tabla} ({', '.join(columnas)}) VALUES ({marcadores}) "
+        f"ON CONFLICT({', '.join(claves)}) DO UPDATE SET {cambios}"
+    )
+
+def explicar_consulta(query, params=()):
+    """
+    Devuelve el plan de ejecución de una consulta (EXPLAIN QUERY PLAN).
+    :return: Lista con el detalle de cada paso del plan o None si hay error.
+    """
+    with conexion_db() as (conn, cursor):
+        if not conn:
+            return None
+        try:
+            cursor.execute(f"EXPLAIN QUERY PLAN {query}", params)
+            return [fila[3] for fila in cursor.fetchall()]
+        except sqlite3.Error as e:
+            print(f"Error obteniendo el plan de la consulta: {e}")
+            return None
+
+def version_esquema():
+    """
+    Lee la versión del esquema guardada en el archivo (PRAGMA user_version).
+    :return: La versión, 0 si la base es nueva o anterior al control de versiones, None si hay error.
+    """
+    with conexion_db() as (conn, cursor):
+        if not conn:
+            return None
+        try:
+            return version_actual(cursor)
+        except sqlite3.Error as e:
+            print(f"Error leyendo la versión del esquema: {e}")
+            return None
+
+
+def inicializar_db_colegio():
+    """
+    Inicializa la base de datos del colegio.
+    Aplica el modo de journal del perfil activo y las migraciones pendientes (ver models/migraciones_sqlite.py).
+    En los arranques normales el esquema ya está al día y solo se lee PRAGMA user_version.
+    :return: True si el esquema quedó al día, False si hubo un error
+    """
+    aplicar_modo_journal() # Perfil de durabilidad/rendimiento (ver PERFILES_SQLITE)
+    with conexion_db() as (conn, cursor):
+        if not conn:
+            print("No se pudo conectar a la base de datos para aplicar las migraciones.")
+            return False
+        return aplicar_migraciones(conn, cursor) is not None
+
+if __name__ == "__main__":
+
+    inicializar_db_colegio()
+    print("Inicialización de la base de datos del colegio finalizada.")
\ No newline at end of file
@@ -0,0 +1,1118 @@
+import re
+from models.conexion import conexion_db, explicar_consulta, sql_upsert, Error
+from models.cache import CacheTabla, CacheLRU
+from datetime import date, timedelta # Asegúrate de que date esté importado
+
+# Tablas de referencia pequeñas que se leen completas a menudo (autocompletados, listas de cursos).
+# Los métodos de escritura de cada modelo invalidan su caché.
+CACHE_CURSOS = CacheTabla("curso")
+CACHE_MATERIAS = CacheTabla("materia")
+CACHE_PROFESORES = CacheTabla("profesor")
+
+# Resolvedores ID -> nombre (LRU) usados al escribir un ID en los formularios y al dibujar tablas.
+# Las altas y ediciones guardan el nombre nuevo (write-through) y las bajas lo descartan.
+NOMBRES_ESTUDIANTES = CacheLRU("nombre_estudiante")
+NOMBRES_PROFESORES = CacheLRU("nombre_profesor")
+NOMBRES_MATERIAS = CacheLRU("nombre_materia")
+CURSOS_POR_ID = CacheLRU("curso_por_id")
+
+
+def _normalizar_id(valor):
+    """Usa el ID como entero en las cachés, así 7 y "7" son la misma clave."""
+    try:
+        return int(valor)
+    except (TypeError, ValueError):
+        return valor
+
+
+class Reportes:
+    """
+    Clase para generar diferentes reportes del sistema escolar.
+    Cada reporte arma su consulta en un método `_consulta_*` que devuelve (sql, params);
+    así `verificar_planes` puede revisar con EXPLAIN exactamente las mismas consultas.
+    """
+    # Tablas que crecen con el tiempo: un SCAN sobre ellas indica que falta un índice
+    TABLAS_GRANDES = ("asistencia", "notas", "estudiante")
+
+    @staticmethod
+    def _consulta_inscripcion_cursos():
+        sql = (
+            "SELECT c.id_curso, c.nombre, COUNT(e.id_estudiante) "
+            "FROM curso c "
+            "LEFT JOIN estudiante e ON c.id_curso = e.id_curso "
+            "GROUP BY c.id_curso, c.nombre"
+        )
+        return sql, ()
+
+    @staticmethod
+    def _meses_completos(fecha_inicio: date = None, fecha_fin: date = None):
+        """
+        Parte un rango de fechas en los meses enteros que contiene, que se leen de
+        resumen_asistencia_mensual, y los días sueltos de los extremos, que se leen de asistencia.
+        :return: Tupla (inicio, fin) de la parte que cubren los meses enteros: inicio es el día 1 de un mes
+                 y fin el último día de un mes (None = sin límite), o None si el rango no contiene un mes entero.
+        """
+        inicio = fin = None
+        if fecha_inicio:
+            inicio = fecha_inicio if fecha_inicio.day == 1 else (fecha_inicio.replace(day=1) + timedelta(days=32)).replace(day=1)
+        if fecha_fin:
+            fin = fecha_fin if (fecha_fin + timedelta(days=1)).day == 1 else fecha_fin.replace(day=1) - timedelta(days=1)
+        if inicio and fin and inicio > fin:
+            return None
+        return inicio, fin
+
+    @staticmethod
+    def _consulta_asistencia_resumida(condicion: str, valor, fecha_inicio: date = None, fecha_fin: date = None):
+        """
+        Conteo de asistencia por estado de los estudiantes que cumplen `condicion` (sobre id_estudiante).
+        Los meses enteros del rango salen de resumen_asistencia_mensual (una fila por estudiante, mes y estado);
+        solo los días sueltos de los extremos se cuentan en asistencia.
+        """
+        partes, params = [], []
+
+        def contar_dias(desde, hasta, incluir_desde=True, incluir_hasta=True):
+            sql = f"SELECT estado_asistencia, 1 AS total FROM asistencia WHERE {condicion}"
+            params.append(valor)
+            if desde:
+                sql += " AND fecha >= ?" if incluir_desde else " AND fecha > ?"
+                params.append(str(desde)) # Fechas como strings ISO (válidas en SQLite y MySQL)
+            if hasta:
+                sql += " AND fecha <= ?" if incluir_hasta else " AND fecha < ?"
+                params.append(str(hasta))
+            partes.append(sql)
+
+        meses = Reportes._meses_completos(fecha_inicio, fecha_fin)
+        if meses is None:
+            contar_dias(fecha_inicio, fecha_fin)
+        else:
+            inicio, fin = meses
+            sql = f"SELECT estado_asistencia, total FROM resumen_asistencia_mensual WHERE {condicion}"
+            params.append(valor)
+            if inicio:
+                sql += " AND mes >= ?"
+                params.append(inicio.isoformat()[:7])
+            if fin:
+                sql += " AND mes <= ?"
+                params.append(fin.isoformat()[:7])
+            partes.append(sql)
+            if fecha_inicio and fecha_inicio < inicio:
+                contar_dias(fecha_inicio, inicio, incluir_hasta=False)
+            if fecha_fin and fecha_fin > fin:
+                contar_dias(fin, fecha_fin, incluir_desde=False)
+
+        sql = (
+            "SELECT estado_asistencia, SUM(total) FROM ("
+            + " UNION ALL ".join(partes)
+            + ") t GROUP BY estado_asistencia"
+        )
+        return sql, tuple(params)
+
+    @staticmethod
+    def _consulta_asistencia_por_estudiante(id_estudiante: int, fecha_inicio: date = None, fecha_fin: date = None):
+        return Reportes._consulta_asistencia_resumida("id_estudiante = ?", id_estudiante, fecha_inicio, fecha_fin)
+
+    @staticmethod
+    def _consulta_asistencia_por_curso(id_curso: int, fecha_inicio: date = None, fecha_fin: date = None):
+        return Reportes._consulta_asistencia_resumida(
+            "id_estudiante IN (SELECT id_estudiante FROM estudiante WHERE id_curso = ?)", id_curso, fecha_inicio, fecha_fin
+        )
+
+    @staticmethod
+    def _consulta_promedio_notas_por_estudiante(id_estudiante: int):
+        sql = (
+            "SELECT n.id_materia, AVG(n.nota), m.nombre_materia "
+            "FROM notas n "
+            "LEFT JOIN materia m ON n.id_materia = m.id_materia "
+            "WHERE n.id_estudiante = ? "
+            "GROUP BY n.id_materia, m.nombre_materia"
+        )
+        return sql, (id_estudiante,)
+
+    @staticmethod
+    def _consulta_promedio_notas_por_materia(id_materia: int):
+        return "SELECT AVG(nota) FROM notas WHERE id_materia = ?", (id_materia,)
+
+    @staticmethod
+    def _consulta_estadisticas_notas_por_curso(id_curso: int):
+        # Una fila por materia en resumen_notas_curso, sin recorrer las notas
+        sql = (
+            "SELECT r.id_materia, r.suma / r.cantidad, r.minimo, r.maximo, m.nombre_materia "
+            "FROM resumen_notas_curso r "
+            "LEFT JOIN materia m ON r.id_materia = m.id_materia "
+            "WHERE r.id_curso = ? "
+            "ORDER BY r.id_materia"
+        )
+        return sql, (id_curso,)
+
+    @staticmethod
+    def _consulta_resumen_curso(id_curso: int, fecha_inicio: date = None, fecha_fin: date = None):
+        # Una sola consulta: los estudiantes del curso se resuelven una vez (CTE alumnos) y cada
+        # bloque del resumen sale como filas (tipo, id_materia, etiqueta, total, promedio, minimo, maximo).
+        # Se filtra con IN (SELECT ... FROM alumnos) y no con JOIN: así asistencia y notas se buscan
+        # por id_estudiante en sus índices aunque el motor materialice la CTE (sin índice propio).
+        filtro_asistencia, filtro_notas, params_fechas = "", "", []
+        if fecha_inicio:
+            filtro_asistencia += " AND a.fecha >= ?"
+            filtro_notas += " AND n.fecha >= ?"
+            params_fechas.append(str(fecha_inicio))
+        if fecha_fin:
+            filtro_asistencia += " AND a.fecha <= ?"
+            filtro_notas += " AND n.fecha <= ?"
+            params_fechas.append(str(fecha_fin))
+        sql = (
+            "WITH alumnos AS ("
+            "SELECT id_estudiante FROM estudiante WHERE id_curso = ?"
+            "), asistencias AS ("
+            "SELECT a.estado_asistencia AS estado, COUNT(*) AS total "
+            "FROM asistencia a "
+            f"WHERE a.id_estudiante IN (SELECT id_estudiante FROM alumnos){filtro_asistencia} "
+            "GROUP BY a.estado_asistencia"
+            "), notas_materia AS ("
+            "SELECT n.id_materia, COUNT(*) AS total, AVG(n.nota) AS promedio, MIN(n.nota) AS minimo, MAX(n.nota) AS maximo "
+            "FROM notas n "
+            f"WHERE n.id_estudiante IN (SELECT id_estudiante FROM alumnos){filtro_notas} "
+            "GROUP BY n.id_materia"
+            ") "
+            "SELECT 'curso', NULL, c.nombre, (SELECT COUNT(*) FROM alumnos), NULL, NULL, NULL "
+            "FROM curso c WHERE c.id_curso = ? "
+            "UNION ALL "
+            "SELECT 'asistencia', NULL, estado, total, NULL, NULL, NULL FROM asistencias "
+            "UNION ALL "
+            "SELECT 'notas', nm.id_materia, m.nombre_materia, nm.total, nm.promedio, nm.minimo, nm.maximo "
+            "FROM notas_materia nm LEFT JOIN materia m ON m.id_materia = nm.id_materia"
+        )
+        # Los marcadores van en el orden del texto: CTE alumnos, fechas de asistencia, fechas de notas, curso
+        return sql, (id_curso, *params_fechas, *params_fechas, id_curso)
+
+    @staticmethod
+    def reporte_inscripcion_cursos():
+        """
+        Retorna el número de estudiantes inscritos en cada curso.
+        :return: Lista de tuplas (id_curso, nombre_curso, total_estudiantes) o None si hay error.
+        """
+        with conexion_db() as (conn, cursor):
+            if not conn:
+                return None
+            try:
+                cursor.execute(*Reportes._consulta_inscripcion_cursos())
+                return cursor.fetchall()
+            except Error as e:
+                print(f"Error en reporte_inscripcion_cursos: {e}")
+                return None
+
+    @staticmethod
+    def reporte_asistencia_por_estudiante(id_estudiante: int, fecha_inicio: date = None, fecha_fin: date = None):
+        """
+        Retorna conteo de estados de asistencia ('Presente','Ausente','Tarde') para un estudiante
+        en un rango de fechas opcional.
+        :return: Diccionario {estado: conteo} o None si hay error.
+        """
+        with conexion_db() as (conn, cursor):
+            if not conn:
+                return None
+            try:
+                cursor.execute(*Reportes._consulta_asistencia_por_estudiante(id_estudiante, fecha_inicio, fecha_fin))
+                return {row[0]: int(row[1]) for row in cursor.fetchall()}
+            except Error as e:
+                print(f"Error en reporte_asistencia_por_estudiante: {e}")
+                return None
+
+    @staticmethod
+    def reporte_asistencia_por_curso(id_curso: int, fecha_inicio: date = None, fecha_fin: date = None):
+        """
+        Retorna resumen de asistencia por curso (agrupado por estado).
+        :return: Diccionario {estado: conteo} o None si hay error.
+        """
+        with conexion_db() as (conn, cursor):
+            if not conn:
+                return None
+            try:
+                cursor.execute(*Reportes._consulta_asistencia_por_curso(id_curso, fecha_inicio, fecha_fin))
+                return {row[0]: int(row[1]) for row in cursor.fetchall()}
+            except Error as e:
+                print(f"Error en reporte_asistencia_por_curso: {e}")
+                return None
+
+    @staticmethod
+    def reporte_promedio_notas_por_estudiante(id_estudiante: int):
+        """
+        Retorna el promedio de notas de un estudiante por materia.
+        :return: Lista de tuplas (id_materia, promedio_nota, nombre_materia) o None si hay error.
+        """
+        with conexion_db() as (conn, cursor):
+            if not conn:
+                return None
+            try:
+                cursor.execute(*Reportes._consulta_promedio_notas_por_estudiante(id_estudiante))
+                return cursor.fetchall()
+            except Error as e:
+                print(f"Error en reporte_promedio_notas_por_estudiante: {e}")
+                return None
+
+    @staticmethod
+    def reporte_promedio_notas_por_materia(id_materia: int):
+        """
+        Retorna el promedio de notas de todos los estudiantes en una materia.
+        :return: Float promedio o None si hay error o no hay notas.
+        """
+        with conexion_db() as (conn, cursor):
+            if not conn:
+                return None
+            try:
+                cursor.execute(*Reportes._consulta_promedio_notas_por_materia(id_materia))
+                result = cursor.fetchone()
+                return result[0] if result and result[0] is not None else None
+            except Error as e:
+                print(f"Error en reporte_promedio_notas_por_materia: {e}")
+                return None
+
+    @staticmethod
+    def reporte_estadisticas_notas_por_curso(id_curso: int):
+        """
+        Retorna promedio, nota máxima y mínima por materia para un curso.
+        :return: Lista de tuplas (id_materia, avg, min, max, nombre_materia) o None si hay error.
+        """
+        with conexion_db() as (conn, cursor):
+            if not conn:
+                return None
+            try:
+                cursor.execute(*Reportes._consulta_estadisticas_notas_por_curso(id_curso))
+                return cursor.fetchall()
+            except Error as e:
+                print(f"Error en reporte_estadisticas_notas_por_curso: {e}")
+                return None
+
+    @staticmethod
+    def resumen_curso(id_curso: int, rango=None):
+        """
+        Resumen de un curso en una sola consulta: inscritos, distribución de la asistencia y
+        estadísticas de notas por materia (reemplaza generar tres reportes seguidos).
+        :param id_curso: ID del curso
+        :param rango: Tupla opcional (fecha_inicio, fecha_fin), cualquiera puede ser None.
+                      Filtra la asistencia y las notas por fecha.
+        :return: Diccionario {"curso": nombre, "inscritos": n, "asistencia": {estado: conteo},
+                 "notas": [(id_materia, nombre_materia, cantidad, avg, min, max)]},
+                 diccionario vacío si el curso no existe o None si hay error.
+        """
+        fecha_inicio, fecha_fin = rango or (None, None)
+        with conexion_db() as (conn, cursor):
+            if not conn:
+                return None
+            try:
+                cursor.execute(*Reportes._consulta_resumen_curso(id_curso, fecha_inicio, fecha_fin))
+                resumen = {}
+                asistencia, notas = {}, []
+                for tipo, id_materia, etiqueta, total, promedio, minimo, maximo in cursor.fetchall():
+                    if tipo == "curso":
+                        resumen["curso"] = etiqueta
+                        resumen["inscritos"] = total
+                    elif tipo == "asistencia":
+                        asistencia[etiqueta] = total
+                    else:
+                        notas.append((id_materia, etiqueta, total, promedio, minimo, maximo))
+                if not resumen:
+                    return {}
+                resumen["asistencia"] = asistencia
+                resumen["notas"] = sorted(notas, key=lambda fila: fila[0])
+                return resumen
+            except Error as e:
+                print(f"Error en resumen_curso: {e}")
+                return None
+
+    @staticmethod
+    def verificar_planes():
+        """
+        Revisa con EXPLAIN QUERY PLAN que cada reporte use índices en las tablas grandes.
+        Los reportes se evalúan con valores de ejemplo y con ambos filtros de fecha.
+        :return: Diccionario {reporte: (usa_indices, [detalle del plan])} o None si hay error.
+        """
+        hoy = date.today()
+        consultas = {
+            "reporte_inscripcion_cursos": Reportes._consulta_inscripcion_cursos(),
+            "reporte_asistencia_por_estudiante": Reportes._consulta_asistencia_por_estudiante(1, hoy, hoy),
+            "reporte_asistencia_por_curso": Reportes._consulta_asistencia_por_curso(1, hoy, hoy),
+            "reporte_asistencia_por_curso (resumen mensual)": Reportes._consulta_asistencia_por_curso(1, hoy - timedelta(days=400), hoy),
+            "reporte_promedio_notas_por_estudiante": Reportes._consulta_promedio_notas_por_estudiante(1),
+            "reporte_promedio_notas_por_materia": Reportes._consulta_promedio_notas_por_materia(1),
+            "reporte_estadisticas_notas_por_curso": Reportes._consulta_estadisticas_notas_por_curso(1),
+            "resumen_curso": Reportes._consulta_resumen_curso(1, hoy, hoy),
+        }
+        resultado = {}
+        for nombre, (sql, params) in consultas.items():
+            plan = explicar_consulta(sql, params)
+            if plan is None:
+                return None
+            resultado[nombre] = (not Reportes._recorridos_completos(sql, plan), plan)
+        return resultado
+
+    @staticmethod
+    def _recorridos_completos(sql: str, plan):
+        """
+        Devuelve las tablas grandes que el plan recorre completas (SCAN sin índice).
+        :param sql: Consulta analizada, usada para resolver los alias de las tablas.
+        :param plan: Detalle del plan devuelto por explicar_consulta.
+        """
+        alias = {}
+        for tabla, nombre in re.findall(r"(?:FROM|JOIN)\s+(\w+)(?:\s+(\w+))?", sql):
+            alias[tabla] = tabla
+            if nombre and nombre.upper() not in ("WHERE", "JOIN", "LEFT", "INNER", "ON", "GROUP", "ORDER"):
+                alias[nombre] = tabla
+        recorridas = []
+        for detalle in plan:
+            # "SCAN a" en SQLite reciente, "SCAN TABLE asistencia AS a" en versiones antiguas.
+            # Un índice AUTOMATIC se construye en cada ejecución, así que también cuenta como recorrido.
+            m = re.match(r"^(SCAN|SEARCH) (?:TABLE )?(\w+)(?: AS (\w+))?(.*)$", detalle)
+            if not m:
+                continue
+            operacion, nombre, nombre_alias, resto = m.groups()
+            if (operacion == "SCAN" and not resto.strip()) or "AUTOMATIC" in resto:
+                tabla = alias.get(nombre_alias or nombre, nombre)
+                if tabla in Reportes.TABLAS_GRANDES:
+                    recorridas.append(tabla)
+        return recorridas
+
+
+class Asistencia:
+    """
+    Clase para gestionar la asistencia de estudiantes.
+    """
+    @staticmethod
+    def registrar_asistencia(id_estudiante: int, fecha_asistencia: date, estado: str) -> bool:
+        """
+        Registra la asistencia de un estudiante en una fecha dada.
+        :param id_estudiante: ID del estudiante
+        :param fecha_asistencia: Fecha de la asistencia (objeto datetime.date)
+        :param estado: Uno de 'Presente', 'Ausente', 'Tarde'
+        :return: True si fue exitoso, False en caso contrario.
+        """
+        with conexion_db() as (conn, cursor):
+            if not conn:
+                return False
+            try:
+                sql = (
+                    "INSERT INTO asistencia (id_estudiante, fecha, estado_asistencia) "
+                    "VALUES (?, ?, ?)"
+                )
+                cursor.execute(sql, (id_estudiante, str(fecha_asistencia), estado))
+                conn.commit()
+                return True
+            except Error as e: # IntegrityError es una subclase de Error
+                print(f"Error al registrar asistencia: {e}")
+                return False
+    
+    @staticmethod
+    def guardar_lote(fecha_asistencia: date, registros) -> bool:
+        """
+        Guarda la asistencia de varios estudiantes en una sola transacción:
+        inserta los registros nuevos y actualiza el estado de los que ya existen para esa fecha.
+        :param fecha_asistencia: Fecha de la asistencia (objeto datetime.date)
+        :param registros: Lista de tuplas (id_estudiante, estado)
+        :return: True si fue exitoso, False en caso contrario.
+        """
+        if not registros:
+            return True
+        with conexion_db() as (conn, cursor):
+            if not conn:
+                return False
+            try:
+                fecha = str(fecha_asistencia)
+                # Upsert apoyado en el índice único ux_asistencia_estudiante_fecha
+                cursor.executemany(
+                    sql_upsert("asistencia", ("id_estudiante", "fecha", "estado_asistencia"),
+                               claves=("id_estudiante", "fecha"), actualizar=("estado_asistencia",)),
+                    [(id_est, fecha, estado) for id_est, estado in registros]
+                )
+                conn.commit()
+                return True
+            except Error as e:
+                conn.rollback()
+                print(f"Error al guardar lote de asistencia: {e}")
+                return False
+
+    @staticmethod
+    def obtener_asistencia_por_estudiante_y_fecha(id_estudiante: int, fecha_asistencia: date):
+        """
+        Obtiene un registro de asistencia específico.
+        :return: Tupla (id_asistencia, estado_asistencia) o None.
+        """
+        with conexion_db() as (conn, cursor):
+            if not conn:
+                return None
+            try:
+                sql = "SELECT id_asistencia, estado_asistencia FROM asistencia WHERE id_estudiante = ? AND fecha = ?"
+                cursor.execute(sql, (id_estudiante, str(fecha_asistencia)))
+                return cursor.fetchone()
+            except Error as e:
+                print(f"Error en obtener_asistencia_por_estudiante_y_fecha: {e}")
+                return None
+
+    @staticmethod
+    def obtener_roster_con_asistencia(id_curso: int, fecha_asistencia: date):
+        """
+        Obtiene los estudiantes de un curso junto con su asistencia en una fecha (una sola consulta).
+        :return: Lista de tuplas (id_estudiante, nombre, apellido, id_asistencia, estado_asistencia) o None.
+                 id_asistencia y estado_asistencia son None si no hay registro para esa fecha.
+        """
+        with conexion_db() as (conn, cursor):
+            if not conn:
+                return None
+            try:
+                sql = (
+                    "SELECT e.id_estudiante, e.nombre, e.apellido, a.id_asistencia, a.estado_asistencia "
+                    "FROM estudiante e "
+                    "LEFT JOIN asistencia a ON a.id_estudiante = e.id_estudiante AND a.fecha = ? "
+                    "WHERE e.id_curso = ? "
+                    "ORDER BY e.id_estudiante"
+                )
+                cursor.execute(sql, (str(fecha_asistencia), id_curso))
+                return cursor.fetchall()
+            except Error as e:
+                print(f"Error en obtener_roster_con_asistencia: {e}")
+                return None
+
+    @staticmethod
+    def obtener_asistencias_por_estudiante(id_estudiante: int):
+        """
+        Obtiene todas las asistencias de un estudiante.
+        :param id_estudiante: ID del estudiante
+        :return: Lista de tuplas (id_asistencia, id_estudiante, fecha, estado_asistencia) o None.
+        """
+        with conexion_db() as (conn, cursor):
+            if not conn:
+                return None
+            try:
+                sql = "SELECT id_asistencia, id_estudiante, fecha, estado_asistencia FROM asistencia WHERE id_estudiante = ?"
+                cursor.execute(sql, (id_estudiante,))
+                return cursor.fetchall()
+            except Error as e:
+                print(f"Error en obtener_asistencias_por_estudiante: {e}")
+                return None
+
+    @staticmethod
+    def actualizar_asistencia(id_asistencia: int, estado: str) -> bool:
+        """
+        Actualiza el estado de asistencia de un registro existente.
+        :param id_asistencia: ID del registro de asistencia
+        :param estado: Nuevo estado ('Presente', 'Ausente', 'Tarde')
+        :return: True si fue exitoso, False en caso contrario.
+        """
+        with conexion_db() as (conn, cursor):
+            if not conn:
+                return False
+            try:
+                sql = "UPDATE asistencia SET estado_asistencia = ? WHERE id_asistencia = ?"
+                cursor.execute(sql, (estado, id_asistencia))
+                conn.commit()
+                return cursor.rowcount > 0 # Verifica si alguna fila fue afectada
+            except Error as e:
+                print(f"Error al actualizar asistencia: {e}")
+                return False
+
+    @staticmethod
+    def eliminar_asistencia(id_asistencia: int) -> bool:
+        """
+        Elimina un registro de asistencia.
+        :param id_asistencia: ID del registro de asistencia
+        :return: True si fue exitoso, False en caso contrario.
+        """
+        with conexion_db() as (conn, cursor):
+            if not conn:
+                return False
+            try:
+                sql = "DELETE FROM asistencia WHERE id_asistencia = ?"
+                cursor.execute(sql, (id_asistencia,))
+                conn.commit()
+                return cursor.rowcount > 0
+            except Error as e:
+                print(f"Error al eliminar asistencia: {e}")
+                return False
+
+
+class Nota:
+    """
+    Clase para gestionar las notas de los estudiantes en distintas materias.
+    """
+    # Escala de calificación que validan las vistas y los registros por lote
+    MINIMA = 0
+    MAXIMA = 5
+    APROBATORIA = 3 # Nota mínima para aprobar (las menores cuentan como reprobadas en las estadísticas)
+
+    @staticmethod
+    def validar_notas(valores):
+        """
+        Convierte y valida de una pasada todas las notas escritas en una planilla.
+        :param valores: Lista de textos o números (vacío o None = sin nota)
+        :return: Tupla (notas, errores): la lista de floats (None donde no hay nota)
+                 y un diccionario {posición: motivo} con las que no son válidas.
+        """
+        notas, errores = [], {}
+        for posicion, valor in enumerate(valores):
+            texto = "" if valor is None else str(valor).strip().replace(",", ".")
+            nota = None
+            if texto:
+                try:
+                    nota = float(texto)
+                    if not Nota.MINIMA <= nota <= Nota.MAXIMA:
+                        errores[posicion] = f"Debe estar entre {Nota.MINIMA} y {Nota.MAXIMA}"
+                except ValueError:
+                    errores[posicion] = "No es un número"
+            notas.append(nota)
+        return notas, errores
+    @staticmethod
+    def registrar_nota(id_estudiante: int, id_materia: int, valor_nota: float, fecha_nota: date) -> bool:
+        """
+        Registra una nueva nota para un estudiante en una materia.
+        :param id_estudiante: ID del estudiante
+        :param id_materia: ID de la materia
+        :param valor_nota: Calificación (decimal)
+        :param fecha_nota: Fecha de la nota (objeto datetime.date)
+        :return: True si fue exitoso, False en caso contrario.
+        """
+        with conexion_db() as (conn, cursor):
+            if not conn:
+                return False
+            try:
+                sql = (
+                    "INSERT INTO notas (id_estudiante, id_materia, nota, fecha) "
+                    "VALUES (?, ?, ?, ?)"
+                )
+                cursor.execute(sql, (id_estudiante, id_materia, valor_nota, str(fecha_nota)))
+                conn.commit()
+                return True
+            except Error as e:
+                print(f"Error al registrar nota: {e}")
+                return False
+
+    @staticmethod
+    def obtener_planilla(id_curso: int, id_materia: int, fecha_nota: date):
+        """
+        Obtiene en una sola consulta los estudiantes de un curso con su nota en una materia y fecha
+        (la última registrada si hay varias), para calificar a todo el curso de una vez.
+        :return: Lista de tuplas (id_estudiante, nombre, apellido, id_nota, nota) ordenada por apellido;
+                 id_nota y nota son None si el estudiante aún no tiene nota. None si hay error.
+        """
+        with conexion_db() as (conn, cursor):
+            if not conn:
+                return None
+            try:
+                sql = (
+                    "SELECT e.id_estudiante, e.nombre, e.apellido, n.id_nota, n.nota "
+                    "FROM estudiante e "
+                    "LEFT JOIN notas n ON n.id_nota = ("
+                    "SELECT MAX(n2.id_nota) FROM notas n2 "
+                    "WHERE n2.id_estudiante = e.id_estudiante AND n2.id_materia = ? AND n2.fecha = ?"
+                    ") "
+                    "WHERE e.id_curso = ? "
+                    "ORDER BY e.apellido, e.nombre, e.id_estudiante"
+                )
+                cursor.execute(sql, (id_materia, str(fecha_nota), id_curso))
+                return cursor.fetchall()
+            except Error as e:
+                print(f"Error en obtener_planilla: {e}")
+                return None
+
+    @staticmethod
+    def registrar_lote(id_materia: int, fecha_nota: date, notas):
+        """
+        Guarda las notas de una planilla en una sola transacción: un executemany para las nuevas
+        y otro para las que cambian.
+        :param id_materia: ID de la materia
+        :param fecha_nota: Fecha de las notas
+        :param notas: Lista de tuplas (id_estudiante, nota, id_nota); id_nota None = nota nueva
+        :return: Tupla (insertadas, actualizadas) o None si hay error (no se guarda ninguna).
+        :raises ValueError: Si alguna nota está fuera de la escala (se valida antes de escribir).
+        """
+        valores, errores = Nota.validar_notas([nota for _, nota, _ in notas])
+        if errores or None in valores:
+            raise ValueError(f"Hay notas vacías o fuera de la escala {Nota.MINIMA}-{Nota.MAXIMA}.")
+
+        nuevas = [(id_est, nota, id_materia, str(fecha_nota))
+                  for (id_est, _, id_nota), nota in zip(notas, valores) if id_nota is None]
+        cambios = [(nota, id_nota) for (_, _, id_nota), nota in zip(notas, valores) if id_nota is not None]
+        with conexion_db() as (conn, cursor):
+            if not conn:
+                return None
+            try:
+                if nuevas:
+                    cursor.executemany(
+                        "INSERT INTO notas (id_estudiante, nota, id_materia, fecha) VALUES (?, ?, ?, ?)", nuevas
+                    )
+                if cambios:
+                    cursor.executemany("UPDATE notas SET nota = ? WHERE id_nota = ?", cambios)
+                conn.commit()
+                return len(nuevas), len(cambios)
+            except Error as e:
+                conn.rollback()
+                print(f"Error al registrar lote de notas: {e}")
+                return None
+
+    @staticmethod
+    def obtener_notas_por_estudiante(id_estudiante: int):
+        """
+        Obtiene todas las notas de un estudiante.
+        :param id_estudiante: ID del estudiante
+        :return: Lista de tuplas (id_nota, id_estudiante, id_materia, nota, fecha, nombre_materia) o None.
+        """
+        with conexion_db() as (conn, cursor):
+            if not conn:
+                return None
+            try:
+                sql = (
+                    "SELECT n.id_nota, n.id_estudiante, n.id_materia, n.nota, n.fecha, m.nombre_materia "
+                    "FROM notas n "
+                    "LEFT JOIN materia m ON n.id_materia = m.id_materia "
+                    "WHERE n.id_estudiante = ?"
+                )
+                cursor.execute(sql, (id_estudiante,))
+                return cursor.fetchall()
+            except Error as e:
+                print(f"Error en obtener_notas_por_estudiante: {e}")
+                return None
+
+    @staticmethod
+    def actualizar_nota(id_nota: int, nueva_nota: float) -> bool:
+        """
+        Actualiza el valor de una nota existente.
+        :param id_nota: ID del registro de nota
+        :param nueva_nota: Nuevo valor de la calificación
+        :return: True si fue exitoso, False en caso contrario.
+        """
+        with conexion_db() as (conn, cursor):
+            if not conn:
+                return False
+            try:
+                sql = "UPDATE notas SET nota = ? WHERE id_nota = ?"
+                cursor.execute(sql, (nueva_nota, id_nota))
+                conn.commit()
+                return cursor.rowcount > 0
+            except Error as e:
+                print(f"Error al actualizar nota: {e}")
+                return False
+
+    @staticmethod
+    def eliminar_nota(id_nota: int) -> bool:
+        """
+        Elimina un registro de nota.
+        :param id_nota: ID del registro de nota
+        :return: True si fue exitoso, False en caso contrario.
+        """
+        with conexion_db() as (conn, cursor):
+            if not conn:
+                return False
+            try:
+                sql = "DELETE FROM notas WHERE id_nota = ?"
+                cursor.execute(sql, (id_nota,))
+                conn.commit()
+                return cursor.rowcount > 0
+            except Error as e:
+                print(f"Error al eliminar nota: {e}")
+                return False
+
+
+class MateriaProfesor:
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def asociar_materia_a_profesor(id_profesor, id_materia):
+        """
+        Asocia una materia a un profesor.
+
+        :param id_profesor: ID del profesor
+        :param id_materia: ID de la materia
+        """
+        with conexion_db() as (conn, cursor):
+            query = "INSERT INTO profesor_materia (id_profesor, id_materia) VALUES (?, ?)"
+            cursor.execute(query, (id_profesor, id_materia))
+            conn.commit()
+
+    @staticmethod
+    def obtener_materias_por_profesor(id_profesor):
+        with conexion_db() as (conn, cursor):
+            query = """
+                SELECT m.id_materia, m.nombre_materia
+                FROM materia m
+                INNER JOIN profesor_materia pm ON m.id_materia = pm.id_materia
+                WHERE pm.id_profesor = ?
+            """
+            
+            cursor.execute(query, (id_profesor,))
+            materias = cursor.fetchall()
+        
+        # Retorna lista de diccionarios (opcional) [{"id": m[0], "nombre": m[1]} for m in materias]
+        return materias
+    
+
+    @staticmethod
+    def eliminar_materias_de_profesor(id_profesor, ids_materias):
+        """
+        Elimina una o varias materias asociadas a un profesor.
+        
+        :param id_profesor: ID del profesor
+        :param ids_materias: Lista de IDs de materias a eliminar
+        """
+        with conexion_db() as (conn, cursor):
+            query = """
+                DELETE FROM profesor_materia
+                WHERE id_profesor = ? AND id_materia = ?
+            """
+            
+            cursor.executemany(query, [(id_profesor, id_materia) for id_materia in ids_materias])
+            
+            conn.commit()
+
+
+
+class Profesor:
+    def __init__(self, nombre, apellido, email = None, telefono = None, id_profesor = None):
+        self.id_profesor = id_profesor
+        self.nombre = nombre
+        self.apellido = apellido
+        self.email = email
+        self.telefono = telefono
+        
+    @staticmethod
+    def obtener_nombre_completo_profesor(id_profesor):
+        """
+        Retorna el nombre y apellido de un profesor dado su ID.
+
+        :param id_profesor: ID del profesor
+        :return: "nombre apellido" o None si no existe
+        """
+        return NOMBRES_PROFESORES.obtener(_normalizar_id(id_profesor), Profesor._consultar_nombre)
+
+    @staticmethod
+    def _consultar_nombre(id_profesor):
+        with conexion_db() as (conn, cursor):
+            query = "SELECT nombre, apellido FROM profesor WHERE id_profesor = ?"
+            cursor.execute(query, (id_profesor,))
+            resultado = cursor.fetchone()
+            return f"{resultado[0]} {resultado[1]}" if resultado else None
+
+    def guardar_registro(self):
+        with conexion_db() as (conn, cursor):
+            if conn:
+                sql = "INSERT INTO profesor (nombre, apellido, email, telefono) VALUES (?, ?, ?, ?)"
+                valores = (self.nombre, self.apellido, self.email, self.telefono)
+                cursor.execute(sql, valores)
+                conn.commit()
+                self.id_profesor = cursor.lastrowid
+                CACHE_PROFESORES.invalidar()
+                NOMBRES_PROFESORES.guardar(self.id_profesor, f"{self.nombre} {self.apellido}")
+
+    def actualizar_registro(self):
+        with conexion_db() as (conn, cursor):
+            if conn:
+                sql = "UPDATE profesor SET nombre=?, apellido=?, email=?, telefono=? WHERE id_profesor=?"
+                valores = (self.nombre, self.apellido, self.email, self.telefono, self.id_profesor)
+                cursor.execute(sql, valores)
+                conn.commit()
+                CACHE_PROFESORES.invalidar()
+                NOMBRES_PROFESORES.guardar(_normalizar_id(self.id_profesor), f"{self.nombre} {self.apellido}")
+
+    def eliminar_registro(self):
+        with conexion_db() as (conn, cursor):
+            if conn:
+                sql = "DELETE FROM profesor WHERE id_profesor=?"
+                valores = (self.id_profesor,)
+                cursor.execute(sql, valores)
+                conn.commit()
+                CACHE_PROFESORES.invalidar()
+                NOMBRES_PROFESORES.invalidar(_normalizar_id(self.id_profesor))
+
+    @staticmethod
+    def obtener_pagina(after_id: int = 0, limit: int = 50):
+        """
+        Obtiene una página de profesores ordenada por ID (paginación por clave).
+
+        :param after_id: Se devuelven los registros con ID mayor a este valor
+        :param limit: Cantidad máxima de filas
+        :return: Lista de tuplas (id_profesor, nombre, apellido, email, telefono)
+        """
+        with conexion_db() as (conn, cursor):
+            sql = "SELECT id_profesor, nombre, apellido, email, telefono FROM profesor WHERE id_profesor > ? ORDER BY id_profesor LIMIT ?"
+            cursor.execute(sql, (after_id, limit))
+            return cursor.fetchall()
+
+    @staticmethod
+    def obtener_todos():
+        """Todos los profesores (id_profesor, nombre, apellido, email, telefono), desde la caché si es posible."""
+        return CACHE_PROFESORES.obtener(Profesor._consultar_todos)
+
+    @staticmethod
+    def _consultar_todos():
+        with conexion_db() as (conn, cursor):
+            if not conn:
+                return None
+            cursor.execute("SELECT * FROM profesor")
+            return cursor.fetchall()
+
+
+
+class Estudiante:
+    def __init__(self, nombre, apellido, id_curso, fecha_nacimiento = None, direccion = None, telefono = None, email = None, id_estudiante = None):
+        self.id_estudiante = id_estudiante
+        self.nombre = nombre
+        self.apellido = apellido
+        self.fecha_nacimiento = fecha_nacimiento
+        self.direccion = direccion
+        self.telefono = telefono
+        self.email = email
+        self.id_curso = id_curso
+
+    def guardar_registro(self):
+        with conexion_db() as (conn, cursor):
+            if conn:
+                sql = "INSERT INTO estudiante (nombre, apellido, fecha_nacimiento, direccion, telefono, email, id_curso) VALUES (?, ?, ?, ?, ?, ?, ?)"
+                self.email = self.email.lower() if self.email else self.email # Igual que la importación masiva
+                valores = (self.nombre, self.apellido, self.fecha_nacimiento, self.direccion, self.telefono, self.email, self.id_curso)
+                cursor.execute(sql, valores)
+                conn.commit()
+                self.id_estudiante = cursor.lastrowid
+                NOMBRES_ESTUDIANTES.guardar(self.id_estudiante, f"{self.nombre} {self.apellido}")
+
+    def actualizar_registro(self):
+        with conexion_db() as (conn, cursor):
+            if conn:
+                sql = "UPDATE estudiante SET nombre=?, apellido=?, fecha_nacimiento=?, direccion=?, telefono=?, email=?, id_curso=? WHERE id_estudiante=?"
+                self.email = self.email.lower() if self.email else self.email
+                valores = (self.nombre, self.apellido, self.fecha_nacimiento, self.direccion, self.telefono, self.email, self.id_curso, self.id_estudiante)
+                cursor.execute(sql, valores)
+                conn.commit()
+                NOMBRES_ESTUDIANTES.guardar(_normalizar_id(self.id_estudiante), f"{self.nombre} {self.apellido}")
+
+    @staticmethod
+    def eliminar_registro(id_estudiante):
+        with conexion_db() as (conn, cursor):
+            if conn:
+                sql = "DELETE FROM estudiante WHERE id_estudiante=?"
+                valores = (id_estudiante,)
+                cursor.execute(sql, valores)
+                conn.commit()
+                NOMBRES_ESTUDIANTES.invalidar(_normalizar_id(id_estudiante))
+
+    @staticmethod
+    def obtener_todos():
+        resultados = []
+        with conexion_db() as (conn, cursor):
+            if conn:
+                cursor.execute("SELECT * FROM estudiante")
+                resultados = cursor.fetchall()
+        return resultados
+
+    @staticmethod
+    def obtener_pagina(after_id: int = 0, limit: int = 50, id_curso: int = None):
+        """
+        Obtiene una página de estudiantes ordenada por ID (paginación por clave).
+
+        :param after_id: Se devuelven los estudiantes con ID mayor a este valor
+        :param limit: Cantidad máxima de filas
+        :param id_curso: Si se indica, solo los estudiantes de ese curso
+        :return: Lista de tuplas (id_estudiante, nombre, apellido, fecha_nacimiento, direccion, telefono, email, id_curso)
+        """
+        with conexion_db() as (conn, cursor):
+            sql = "SELECT id_estudiante, nombre, apellido, fecha_nacimiento, direccion, telefono, email, id_curso FROM estudiante WHERE id_estudiante > ?"
+            valores = [after_id]
+            if id_curso is not None:
+                sql += " AND id_curso = ?"
+                valores.append(id_curso)
+            sql += " ORDER BY id_estudiante LIMIT ?"
+            valores.append(limit)
+            cursor.execute(sql, tuple(valores))
+            return cursor.fetchall()
+
+    @staticmethod
+    def obtener_por_id_curso(id_curso):
+        """
+        Objetivo:Filtrar estudiantes por curso.
+
+        Args:
+            (id_curso).
+
+        Returns:
+            Lista: de estudiantes.
+        """
+        with conexion_db() as (conn, cursor):
+            sql = "SELECT * FROM estudiante WHERE id_curso=?"
+            valores = (id_curso,)
+            cursor.execute(sql, valores)
+            resultado = cursor.fetchall()
+        return resultado
+    
+    @staticmethod
+    def obtener_nombre_completo(id_estudiante: int) -> str:
+        """Obtiene nombre completo de un estudiante por su ID (con caché LRU)"""
+        return NOMBRES_ESTUDIANTES.obtener(_normalizar_id(id_estudiante), Estudiante._consultar_nombre)
+
+    @staticmethod
+    def _consultar_nombre(id_estudiante: int):
+        with conexion_db() as (conn, cursor):
+            cursor.execute(
+                "SELECT nombre, apellido FROM estudiante WHERE id_estudiante = ?",
+                (id_estudiante,)
+            )
+            if resultado := cursor.fetchone():
+                return f"{resultado[0]} {resultado[1]}"
+            return None
+
+
+class Materia:
+    def __init__(self, nombre: str, descripcion: str = None, id_materia: int = None):
+        self.id_materia = id_materia
+        self.nombre = nombre
+        self.descripcion = descripcion
+
+    @staticmethod
+    def obtener_nombre_materia(id_materia):
+        """
+        Retorna el nombre de la materia dado su ID.
+
+        :param id_materia: ID de la materia
+        :return: Nombre de la materia o None si no existe
+        """
+        return NOMBRES_MATERIAS.obtener(_normalizar_id(id_materia), Materia._consultar_nombre)
+
+    @staticmethod
+    def _consultar_nombre(id_materia):
+        with conexion_db() as (conn, cursor):
+            query = "SELECT nombre_materia FROM materia WHERE id_materia = ?"
+            cursor.execute(query, (id_materia,))
+            resultado = cursor.fetchone()
+            return resultado[0] if resultado else None
+
+    def guardar_registro(self):
+        with conexion_db() as (conn, cursor):
+            sql = "INSERT INTO materia (nombre_materia,descripcion) VALUES (?, ?)"
+            valores = (self.nombre,self.descripcion)
+            cursor.execute(sql,valores)
+            conn.commit()
+            self.id_materia = cursor.lastrowid
+        CACHE_MATERIAS.invalidar()
+        NOMBRES_MATERIAS.guardar(self.id_materia, self.nombre)
+
+    def actualizar_registro(self):
+        if self.id_materia is None:
+            raise ValueError("ID requerido para actualizar")
+        with conexion_db() as (conn, cursor):
+            sql = "UPDATE materia SET nombre_materia = ?, descripcion = ? WHERE id_materia = ?"
+            valores = (self.nombre, self.descripcion, self.id_materia)
+
+            cursor.execute(sql,valores)
+            conn.commit()
+        CACHE_MATERIAS.invalidar()
+        NOMBRES_MATERIAS.guardar(_normalizar_id(self.id_materia), self.nombre)
+    
+    def eliminar_registro(self):
+        if self.id_materia is None:
+            raise ValueError("ID requerido para eliminar")
+        with conexion_db() as (conn, cursor):
+            cursor.execute("DELETE FROM materia WHERE id_materia = ?", (self.id_materia,))
+            conn.commit()
+        CACHE_MATERIAS.invalidar()
+        NOMBRES_MATERIAS.invalidar(_normalizar_id(self.id_materia))
+
+    @staticmethod
+    def obtener_pagina(after_id: int = 0, limit: int = 50):
+        """
+        Obtiene una página de materias ordenada por ID (paginación por clave).
+
+        :param after_id: Se devuelven los registros con ID mayor a este valor
+        :param limit: Cantidad máxima de filas
+        :return: Lista de tuplas (id_materia, nombre_materia, descripcion)
+        """
+        with conexion_db() as (conn, cursor):
+            sql = "SELECT id_materia, nombre_materia, descripcion FROM materia WHERE id_materia > ? ORDER BY id_materia LIMIT ?"
+            cursor.execute(sql, (after_id, limit))
+            return cursor.fetchall()
+
+    @staticmethod
+    def obtener_todos():
+        """Todas las materias (id_materia, nombre_materia, descripcion), desde la caché si es posible."""
+        return CACHE_MATERIAS.obtener(Materia._consultar_todos)
+
+    @staticmethod
+    def _consultar_todos():
+        with conexion_db() as (conn, cursor):
+            if not conn:
+                return None
+            cursor.execute("SELECT * FROM materia")
+            return cursor.fetchall()
+
+
+class Curso:
+    def __init__(self, nombre: str, descripcion: str = None, id_curso: int = None):
+        self.id_curso = id_curso
+        self.nombre = nombre
+        self.descripcion = descripcion
+
+    def guardar_registro(self):
+        with conexion_db() as (conn, cursor):
+            sql = "INSERT INTO curso (nombre, descripcion) VALUES (?, ?)"
+            valores = (self.nombre, self.descripcion)
+            cursor.execute(sql, valores)
+            conn.commit()
+            self.id_curso = cursor.lastrowid
+        CACHE_CURSOS.invalidar()
+        CURSOS_POR_ID.guardar(self.id_curso, (self.id_curso, self.nombre, self.descripcion))
+
+    def actualizar_registro(self):
+        if self.id_curso is None:
+            raise ValueError("ID requerido para actualizar")
+        with conexion_db() as (conn, cursor):
+            sql = "UPDATE curso SET nombre = ?, descripcion = ? WHERE id_curso = ?"
+            valores = (self.nombre, self.descripcion, self.id_curso)
+            cursor.execute(sql, valores)
+            conn.commit()
+        CACHE_CURSOS.invalidar()
+        CURSOS_POR_ID.guardar(_normalizar_id(self.id_curso), (self.id_curso, self.nombre, self.descripcion))
+
+    def eliminar_registro(self):
+        if self.id_curso is None:
+            raise ValueError("ID requerido para eliminar")
+        with conexion_db() as (conn, cursor):
+            cursor.execute("DELETE FROM curso WHERE id_curso = ?", (self.id_curso,))
+            conn.commit()
+        CACHE_CURSOS.invalidar()
+        CURSOS_POR_ID.invalidar(_normalizar_id(self.id_curso))
+        NOMBRES_ESTUDIANTES.invalidar() # Los estudiantes del curso se borran en cascada
+
+    @staticmethod
+    def obtener_pagina(after_id: int = 0, limit: int = 50):
+        """
+        Obtiene una página de cursos ordenada por ID (paginación por clave).
+
+        :param after_id: Se devuelven los registros con ID mayor a este valor
+        :param limit: Cantidad máxima de filas
+        :return: Lista de tuplas (id_curso, nombre, descripcion)
+        """
+        with conexion_db() as (conn, cursor):
+            sql = "SELECT id_curso, nombre, descripcion FROM curso WHERE id_curso > ? ORDER BY id_curso LIMIT ?"
+            cursor.execute(sql, (after_id, limit))
+            return cursor.fetchall()
+
+    @staticmethod
+    def obtener_todos():
+        """Todos los cursos (id_curso, nombre, descripcion), desde la caché si es posible."""
+        return CACHE_CURSOS.obtener(Curso._consultar_todos)
+
+    @staticmethod
+    def _consultar_todos():
+        with conexion_db() as (conn, cursor):
+            if not conn:
+                return None
+            cursor.execute("SELECT id_curso, nombre, descripcion FROM curso")
+            return cursor.fetchall()
+    
+    @staticmethod
+    def obtener_por_id(id_curso):
+        """Retorna el Curso con ese ID o None si no existe (la fila sale de una caché LRU)."""
+        row = CURSOS_POR_ID.obtener(_normalizar_id(id_curso), Curso._consultar_por_id)
+        if row:
+            return Curso(id_curso=row[0], nombre=row[1], descripcion=row[2])
+        return None
+
+    @staticmethod
+    def _consultar_por_id(id_curso):
+        with conexion_db() as (conn, cursor):
+            cursor.execute("SELECT id_curso, nombre, descripcion FROM curso WHERE id_curso = ?", (id_curso,))
+            return cursor.fetchone()
@@ -0,0 +1,141 @@
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+
+from models.conexion import conexion_db, Error
+from models.database import Materia, Nota
+
+# -----------------------------------
+# * Estadísticas de notas
+# -----------------------------------
+# Trae las notas de un curso (o de todo el colegio) en un período, ordenadas por materia y nota,
+# y las guarda por materia en arreglos compactos (array de doubles, 8 bytes por nota en lugar de
+# un objeto float por fila). Como cada arreglo ya viene ordenado desde la base de datos:
+#   - mínima, máxima, mediana y percentiles son accesos por posición,
+#   - el histograma y el porcentaje de reprobados salen de búsquedas binarias (bisect),
+#   - promedio y desviación estándar son una pasada con math.fsum cada uno.
+
+TAMANO_BLOQUE = 5000 # Filas por fetchmany
+INTERVALOS_HISTOGRAMA = 5 # Intervalos iguales entre Nota.MINIMA y Nota.MAXIMA
+PERCENTILES = (25, 50, 75, 90)
+
+
+def _consulta_notas(id_curso: int = None, fecha_inicio: date = None, fecha_fin: date = None):
+    condiciones, params = [], []
+    if id_curso is not None:
+        condiciones.append("id_estudiante IN (SELECT id_estudiante FROM estudiante WHERE id_curso = ?)")
+        params.append(id_curso)
+    if fecha_inicio:
+        condiciones.append("fecha >= ?")
+        params.append(str(fecha_inicio))
+    if fecha_fin:
+        condiciones.append("fecha <= ?")
+        params.append(str(fecha_fin))
+    sql = "SELECT id_materia, nota FROM notas"
+    if condiciones:
+        sql += " WHERE " + " AND ".join(condiciones)
+    return sql + " ORDER BY id_materia, nota", tuple(params)
+
+
+def _cargar_notas(cursor, id_curso: int = None, fecha_inicio: date = None, fecha_fin: date = None):
+    """
+    Lee las notas por bloques y las agrupa por materia.
+    :return: Diccionario {id_materia: array('d') de notas ordenadas de menor a mayor}
+    """
+    cursor.execute(*_consulta_notas(id_curso, fecha_inicio, fecha_fin))
+    notas = {}
+    materia_actual, columna = None, None
+    while True:
+        bloque = cursor.fetchmany(TAMANO_BLOQUE)
+        if not bloque:
+            break
+        for id_materia, nota in bloque:
+            if id_materia != materia_actual:
+                materia_actual = id_materia
+                columna = notas.setdefault(id_materia, array("d"))
+            columna.append(float(nota)) # DECIMAL en MySQL
+    return notas
+
+
+def percentil(ordenadas, p: float) -> float:
+    """
+    Percentil p (0-100) de una secuencia ordenada, con interpolación lineal entre las dos
+    posiciones vecinas (el mismo criterio que numpy.percentile por defecto).
+    """
+    posicion = (len(ordenadas) - 1) * p / 100
+    abajo = math.floor(posicion)
+    arriba = min(abajo + 1, len(ordenadas) - 1)
+    return ordenadas[abajo] + (ordenadas[arriba] - ordenadas[abajo]) * (posicion - abajo)
+
+
+def histograma(ordenadas, intervalos: int = INTERVALOS_HISTOGRAMA):
+    """
+    Cuenta las notas de cada intervalo [desde, hasta) de la escala; el último incluye la nota máxima.
+    Las notas fuera de la escala no entran en ningún intervalo (ver fuera_de_escala).
+    :return: Lista de tuplas (desde, hasta, cantidad)
+    """
+    ancho = (Nota.MAXIMA - Nota.MINIMA) / intervalos
+    resultado = []
+    for i in range(intervalos):
+        desde = Nota.MINIMA + i * ancho
+        hasta = Nota.MINIMA + (i + 1) * ancho
+        fin = bisect_right(ordenadas, hasta) if i == intervalos - 1 else bisect_left(ordenadas, hasta)
+        resultado.append((desde, hasta, fin - bisect_left(ordenadas, desde)))
+    return resultado
+
+
+def fuera_de_escala(ordenadas) -> int:
+    """
+    Cantidad de notas fuera de Nota.MINIMA..Nota.MAXIMA (en SQLite pueden quedar notas
+    anteriores a la escala actual, que la columna todavía admite hasta 100).
+    """
+    return bisect_left(ordenadas, Nota.MINIMA) + len(ordenadas) - bisect_right(ordenadas, Nota.MAXIMA)
+
+
+def calcular(ordenadas) -> dict:
+    """
+    Métricas de un grupo de notas ya ordenadas.
+    :return: Diccionario {"cantidad", "promedio", "desviacion", "minimo", "maximo", "percentiles": {p: valor},
+             "reprobados" (porcentaje con nota menor a Nota.APROBATORIA), "histograma": [(desde, hasta, cantidad)],
+             "fuera_escala" (notas que no entran en el histograma; con ellas los conteos suman "cantidad")}
+    """
+    cantidad = len(ordenadas)
+    promedio = math.fsum(ordenadas) / cantidad
+    return {
+        "cantidad": cantidad,
+        "promedio": promedio,
+        # Desviación estándar poblacional: describe al grupo calificado, no a una muestra
+        "desviacion": math.sqrt(math.fsum((nota - promedio) ** 2 for nota in ordenadas) / cantidad),
+        "minimo": ordenadas[0],
+        "maximo": ordenadas[-1],
+        "percentiles": {p: percentil(ordenadas, p) for p in PERCENTILES},
+        "reprobados": bisect_left(ordenadas, Nota.APROBATORIA) * 100 / cantidad,
+        "histograma": histograma(ordenadas),
+        "fuera_escala": fuera_de_escala(ordenadas),
+    }
+
+
+def estadisticas_notas(id_curso: int = None, rango=None):
+    """
+    Estadísticas de las notas por materia de un curso o de todo el colegio.
+    :param id_curso: ID del curso; None = todos los estudiantes
+    :param rango: Tupla opcional (fecha_inicio, fecha_fin) del período, cualquiera puede ser None
+    :return: Lista de tuplas (id_materia, nombre_materia, métricas) ordenada por materia, donde métricas
+             es el diccionario de `calcular`; None si hay error.
+    """
+    fecha_inicio, fecha_fin = rango or (None, None)
+    with conexion_db() as (conn, cursor):
+        if not conn:
+            return None
+        try:
+            notas = _cargar_notas(cursor, id_curso, fecha_inicio, fecha_fin)
+        except Error as e:
+            print(f"Error en estadisticas_notas: {e}")
+            return None
+
+    nombres = {materia[0]: materia[1] for materia in Materia.obtener_todos() or []}
+    return [
+        (id_materia, nombres.get(id_materia) or f"Materia {id_materia}", calcular(columna))
+        for id_materia, columna in notas.items()
+    ]
@@ -0,0 +1,300 @@
+import csv
+import os
+import re
+from datetime import date, datetime
+from decimal import Decimal
+
+from models.conexion import conexion_db, Error
+from models.database import Reportes, Curso, Materia, Estudiante
+
+# -----------------------------------
+# * Exportación de reportes
+# -----------------------------------
+# Ejecuta las mismas consultas de Reportes (`_consulta_*`) y escribe las filas en el archivo a medida
+# que llegan, por bloques de fetchmany: la memoria usada no depende del tamaño del reporte y no se
+# arma ninguna tabla en pantalla. Con MySQL el cursor no almacena el resultado (lo va leyendo del servidor).
+#
+# Formatos según la extensión del archivo:
+#   .csv  sin dependencias
+#   .xlsx necesita openpyxl (pip install openpyxl); se usa el modo write_only, que no guarda las filas en memoria
+#   .pdf  escritor propio mínimo (tabla de texto con las fuentes estándar del PDF), sin dependencias
+#
+# Los reportes por curso o por materia sin ID se exportan para todos los cursos o materias
+# en un mismo archivo (p. ej. las estadísticas de notas de fin de período de todo el colegio).
+
+FORMATOS = ("csv", "xlsx", "pdf")
+TAMANO_BLOQUE = 1000 # Filas por fetchmany
+
+# Reportes exportables (los de la vista de reportes): nombre -> (columnas, alcance, consulta, fila)
+#   alcance: qué ID recibe la consulta ("estudiante", "curso", "materia" o None). El nombre del
+#            estudiante, curso o materia se agrega como primera columna.
+#   consulta(id, fecha_inicio, fecha_fin): (sql, params) de Reportes
+#   fila(tupla): valores que se exportan de cada fila de la consulta
+REPORTES = {
+    "Inscripción por cursos": (
+        ("ID curso", "Curso", "Estudiantes"), None,
+        lambda *_: Reportes._consulta_inscripcion_cursos(),
+        tuple,
+    ),
+    "Asistencia por estudiante": (
+        ("Estado", "Cantidad"), "estudiante",
+        Reportes._consulta_asistencia_por_estudiante,
+        tuple,
+    ),
+    "Asistencia por curso": (
+        ("Estado", "Cantidad"), "curso",
+        Reportes._consulta_asistencia_por_curso,
+        tuple,
+    ),
+    "Promedio notas por estudiante": (
+        ("Materia", "Promedio"), "estudiante",
+        lambda id_estudiante, *_: Reportes._consulta_promedio_notas_por_estudiante(id_estudiante),
+        lambda fila: (fila[2] or f"Materia {fila[0]}", fila[1]),
+    ),
+    "Promedio notas por materia": (
+        ("Promedio general",), "materia",
+        lambda id_materia, *_: Reportes._consulta_promedio_notas_por_materia(id_materia),
+        tuple,
+    ),
+    "Estadísticas notas por curso": (
+        ("Materia", "Promedio", "Mínima", "Máxima"), "curso",
+        lambda id_curso, *_: Reportes._consulta_estadisticas_notas_por_curso(id_curso),
+        lambda fila: (fila[4] or f"Materia {fila[0]}", fila[1], fila[2], fila[3]),
+    ),
+    "Resumen de curso": (
+        ("Bloque", "Detalle", "Cantidad", "Promedio", "Mínima", "Máxima"), "curso",
+        Reportes._consulta_resumen_curso,
+        lambda fila: (fila[0], fila[2] or f"Materia {fila[1]}", *fila[3:]),
+    ),
+}
+
+TITULOS_ALCANCE = {"estudiante": "Estudiante", "curso": "Curso", "materia": "Materia"}
+
+
+def _valor(valor):
+    """Normaliza un valor de la base de datos para escribirlo (DECIMAL de MySQL, promedios, fechas)."""
+    if isinstance(valor, Decimal):
+        valor = float(valor)
+    if isinstance(valor, float):
+        return round(valor, 2)
+    if isinstance(valor, (date, datetime)):
+        return valor.isoformat()
+    return valor
+
+
+class _EscritorCSV:
+    def __init__(self, ruta: str, titulo: str, columnas):
+        self._archivo = open(ruta, "w", newline="", encoding="utf-8-sig") # Con BOM para que Excel lea los acentos
+        self._escritor = csv.writer(self._archivo)
+        self._escritor.writerow(columnas)
+
+    def escribir(self, fila):
+        self._escritor.writerow(["" if v is None else v for v in fila])
+
+    def cerrar(self):
+        self._archivo.close()
+
+
+class _EscritorXLSX:
+    def __init__(self, ruta: str, titulo: str, columnas):
+        try:
+            from openpyxl import Workbook
+        except ImportError:
+            raise ValueError("Para exportar archivos .xlsx instala openpyxl (pip install openpyxl) o exporta a CSV.")
+        self._ruta = ruta
+        self._libro = Workbook(write_only=True)
+        # Excel no admite estos caracteres ni más de 31 en el nombre de una hoja
+        self._hoja = self._libro.create_sheet(title=re.sub(r"[\[\]:*?/\\]", " ", titulo)[:31])
+        self._hoja.append(list(columnas))
+
+    def escribir(self, fila):
+        self._hoja.append(list(fila))
+
+    def cerrar(self):
+        self._libro.save(self._ruta)
+
+
+class _EscritorPDF:
+    """
+    PDF mínimo con una tabla de texto: A4 apaisado, Helvetica (fuente estándar, no se incrusta)
+    y el encabezado de columnas repetido en cada página. Cada página se escribe en el archivo
+    apenas se llena; en memoria solo quedan la página en curso y las posiciones de los objetos.
+    """
+    ANCHO, ALTO = 842, 595 # Puntos
+    MARGEN = 36
+    INTERLINEA = 14
+    TAMANO_LETRA = 9
+
+    def __init__(self, ruta: str, titulo: str, columnas):
+        self._archivo = open(ruta, "wb")
+        self._titulo = titulo
+        self._columnas = list(columnas)
+        self._ancho_columna = (self.ANCHO - 2 * self.MARGEN) / len(self._columnas)
+        # Ancho promedio de un carácter en Helvetica: ~0.5 del tamaño de la letra
+        self._maximo_caracteres = max(int(self._ancho_columna / (self.TAMANO_LETRA * 0.5)) - 2, 3)
+        self._posiciones = {} # Número de objeto -> posición en el archivo (para la tabla xref)
+        self._paginas = []    # Números de objeto de las páginas
+        self._siguiente = 5   # 1 catálogo, 2 árbol de páginas, 3 y 4 fuentes
+        self._contenido = []
+        self._y = 0
+
+        self._archivo.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        self._objeto(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        self._objeto(3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+        self._objeto(4, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>")
+        self._nueva_pagina()
+
+    def _objeto(self, numero: int, cuerpo: bytes):
+        self._posiciones[numero] = self._archivo.tell()
+        self._archivo.write(b"%d 0 obj\n" % numero + cuerpo + b"\nendobj\n")
+
+    @staticmethod
+    def _texto(valor) -> bytes:
+        texto = str(valor).encode("cp1252", errors="replace") # WinAnsiEncoding: cubre acentos y ñ
+        return texto.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+    def _linea(self, valores, fuente: bytes = b"F1"):
+        for indice, valor in enumerate(valores):
+            texto = "" if valor is None else str(valor)
+            if len(texto) > self._maximo_caracteres:
+                texto = texto[:self._maximo_caracteres - 1] + "…"
+            x = self.MARGEN + indice * self._ancho_columna
+            self._contenido.append(
+                b"BT /%s %d Tf %.1f %.1f Td (%s) Tj ET" % (fuente, self.TAMANO_LETRA, x, self._y, self._texto(texto))
+            )
+        self._y -= self.INTERLINEA
+
+    def _nueva_pagina(self):
+        self._contenido = []
+        self._y = self.ALTO - self.MARGEN - 12
+        x = self.MARGEN
+        self._contenido.append(b"BT /F2 14 Tf %d %.1f Td (%s) Tj ET" % (x, self._y, self._texto(self._titulo)))
+        self._contenido.append(
+            b"BT /F1 8 Tf %d %d Td (%s) Tj ET" % (x, self.MARGEN - 16, self._texto(f"Página {len(self._paginas) + 1}"))
+        )
+        self._y -= 2 * self.INTERLINEA
+        self._linea(self._columnas, b"F2")
+
+    def _cerrar_pagina(self):
+        contenido = b"\n".join(self._contenido)
+        numero_contenido, numero_pagina = self._siguiente, self._siguiente + 1
+        self._siguiente += 2
+        self._objeto(numero_contenido, b"<< /Length %d >>\nstream\n%s\nendstream" % (len(contenido), contenido))
+        self._objeto(numero_pagina, (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] "
+            b"/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents %d 0 R >>"
+        ) % (self.ANCHO, self.ALTO, numero_contenido))
+        self._paginas.append(numero_pagina)
+
+    def escribir(self, fila):
+        if self._y < self.MARGEN:
+            self._cerrar_pagina()
+            self._nueva_pagina()
+        self._linea(fila)
+
+    def cerrar(self):
+        try:
+            self._cerrar_pagina()
+            hijos = b" ".join(b"%d 0 R" % numero for numero in self._paginas)
+            self._objeto(2, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (hijos, len(self._paginas)))
+            inicio_xref = self._archivo.tell()
+            total = self._siguiente
+            self._archivo.write(b"xref\n0 %d\n0000000000 65535 f \n" % total)
+            for numero in range(1, total):
+                self._archivo.write(b"%010d 00000 n \n" % self._posiciones[numero])
+            self._archivo.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (total, inicio_xref))
+        finally:
+            self._archivo.close()
+
+
+ESCRITORES = {"csv": _EscritorCSV, "xlsx": _EscritorXLSX, "pdf": _EscritorPDF}
+
+
+def _secciones(alcance, id_filtro):
+    """
+    Lista de (id, nombre) para las que se ejecuta la consulta del reporte.
+    Sin ID, los reportes por curso o por materia abarcan todos los cursos o materias.
+    :raises ValueError: Si falta el ID de estudiante o el ID no existe.
+    """
+    if alcance is None:
+        return [(None, None)]
+    if alcance == "estudiante":
+        if id_filtro is None:
+            raise ValueError("Indique el ID del estudiante.")
+        nombre = Estudiante.obtener_nombre_completo(id_filtro)
+        if not nombre:
+            raise ValueError(f"No existe un estudiante con ID {id_filtro}.")
+        return [(id_filtro, nombre)]
+
+    registros = (Curso.obtener_todos() if alcance == "curso" else Materia.obtener_todos()) or []
+    secciones = [(registro[0], registro[1]) for registro in registros]
+    if id_filtro is None:
+        return secciones
+    secciones = [seccion for seccion in secciones if seccion[0] == id_filtro]
+    if not secciones:
+        raise ValueError(f"No existe {'un curso' if alcance == 'curso' else 'una materia'} con ID {id_filtro}.")
+    return secciones
+
+
+def exportar_reporte(ruta: str, tipo: str, id_filtro: int = None, rango=None, progreso=None):
+    """
+    Exporta un reporte a CSV, XLSX o PDF (según la extensión de `ruta`) sin cargarlo en memoria.
+
+    :param ruta: Ruta del archivo a crear
+    :param tipo: Nombre del reporte (una clave de REPORTES)
+    :param id_filtro: ID del estudiante, curso o materia del reporte. None en un reporte por curso
+                      o por materia exporta todos los cursos o materias.
+    :param rango: Tupla opcional (fecha_inicio, fecha_fin) para los reportes de asistencia y el resumen
+    :param progreso: Función opcional (filas_escritas, secciones_listas, total_secciones) llamada
+                     después de cada bloque de filas
+    :return: Diccionario {"filas", "secciones", "ruta"}, o None si no se pudo conectar o falló una consulta
+             (en ese caso se borra el archivo incompleto).
+    :raises ValueError: Si el formato o el reporte no existen, falta un ID obligatorio o no existe.
+    """
+    formato = os.path.splitext(ruta)[1].lower().lstrip(".")
+    if formato not in ESCRITORES:
+        raise ValueError(f"Formato no admitido: '{formato}'. Use {', '.join('.' + f for f in FORMATOS)}.")
+    if tipo not in REPORTES:
+        raise ValueError(f"El reporte '{tipo}' no se puede exportar.")
+    columnas, alcance, consulta, convertir = REPORTES[tipo]
+    fecha_inicio, fecha_fin = rango or (None, None)
+
+    secciones = _secciones(alcance, id_filtro)
+    if alcance:
+        columnas = (TITULOS_ALCANCE[alcance], *columnas)
+    titulo = tipo
+    if fecha_inicio or fecha_fin:
+        titulo += f" ({fecha_inicio or '...'} a {fecha_fin or '...'})"
+
+    filas = 0
+    completo = False
+    with conexion_db() as (conn, cursor):
+        if not conn:
+            return None
+        escritor = ESCRITORES[formato](ruta, titulo, columnas)
+        try:
+            for numero, (id_seccion, nombre) in enumerate(secciones, start=1):
+                prefijo = (nombre,) if alcance else ()
+                cursor.execute(*consulta(id_seccion, fecha_inicio, fecha_fin))
+                while True:
+                    bloque = cursor.fetchmany(TAMANO_BLOQUE)
+                    if not bloque:
+                        break
+                    for fila in bloque:
+                        escritor.escribir([_valor(v) for v in (*prefijo, *convertir(fila))])
+                    filas += len(bloque)
+                    if progreso:
+                        progreso(filas, numero - 1, len(secciones))
+                if progreso:
+                    progreso(filas, numero, len(secciones))
+            completo = True
+        except Error as e:
+            print(f"Error al exportar '{tipo}': {e}")
+        finally:
+            escritor.cerrar()
+            if not completo:
+                os.remove(ruta)
+
+    if not completo:
+        return None
+    return {"filas": filas, "secciones": len(secciones), "ruta": ruta}
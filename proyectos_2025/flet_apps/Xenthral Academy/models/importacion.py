@@ -0,0 +1,304 @@
+import csv
+import os
+import re
+from datetime import date, datetime
+from itertools import islice
+
+from models.conexion import conexion_db, Error
+from models.database import Curso, NOMBRES_ESTUDIANTES
+
+# -----------------------------------
+# * Importación masiva de estudiantes
+# -----------------------------------
+# Lee un archivo CSV o XLSX fila por fila (sin cargarlo entero en memoria), valida cada fila
+# y guarda las válidas por lotes con executemany, un commit por lote. Las filas rechazadas
+# se escriben en un reporte CSV junto al archivo importado.
+#
+# Columnas (la primera fila es el encabezado, sin importar mayúsculas ni el orden):
+#   nombre*, apellido*, id_curso*, fecha_nacimiento, direccion, telefono, email
+# Las fechas se aceptan como YYYY-MM-DD o DD/MM/YYYY (o como fecha de Excel).
+# Para XLSX se necesita openpyxl (pip install openpyxl); los CSV no tienen dependencias.
+
+COLUMNAS = ("nombre", "apellido", "fecha_nacimiento", "direccion", "telefono", "email", "id_curso")
+COLUMNAS_OBLIGATORIAS = ("nombre", "apellido", "id_curso")
+TAMANO_LOTE = 2000          # Filas por executemany / commit
+TAMANO_CONSULTA_EMAILS = 500 # Emails por consulta IN (...) al buscar los ya registrados
+
+# Largo máximo de cada columna de texto (el de las columnas VARCHAR de MySQL)
+LARGO_MAXIMO = {"nombre": 100, "apellido": 100, "direccion": 255, "telefono": 20, "email": 100}
+
+PATRON_EMAIL = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _leer_csv(ruta: str):
+    with open(ruta, newline="", encoding="utf-8-sig") as archivo:
+        muestra = archivo.read(4096)
+        archivo.seek(0)
+        try:
+            dialecto = csv.Sniffer().sniff(muestra, delimiters=",;\t")
+        except csv.Error:
+            dialecto = csv.excel
+        yield from csv.reader(archivo, dialecto)
+
+
+def _leer_xlsx(ruta: str):
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ValueError("Para importar archivos .xlsx instala openpyxl (pip install openpyxl) o guarda el archivo como CSV.")
+    libro = load_workbook(ruta, read_only=True, data_only=True)
+    try:
+        yield from libro.active.iter_rows(values_only=True)
+    finally:
+        libro.close()
+
+
+def leer_filas(ruta: str):
+    """
+    Recorre las filas de un archivo CSV o XLSX (la primera es el encabezado).
+    :param ruta: Ruta del archivo
+    :return: Generador de filas (tuplas o listas de valores)
+    """
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == ".csv":
+        return _leer_csv(ruta)
+    if extension == ".xlsx":
+        return _leer_xlsx(ruta)
+    raise ValueError(f"Formato no admitido: '{extension}'. Use un archivo .csv o .xlsx.")
+
+
+def _texto(valor) -> str:
+    return "" if valor is None else str(valor).strip()
+
+
+def _convertir_fecha(valor):
+    """Convierte la fecha de nacimiento a texto ISO; None si está vacía. Lanza ValueError si no es válida."""
+    if isinstance(valor, datetime):
+        fecha = valor.date()
+    elif isinstance(valor, date):
+        fecha = valor
+    else:
+        texto = _texto(valor)
+        if not texto:
+            return None
+        try:
+            fecha = date.fromisoformat(texto[:10])
+        except ValueError:
+            try:
+                fecha = datetime.strptime(texto, "%d/%m/%Y").date()
+            except ValueError:
+                raise ValueError(f"fecha_nacimiento '{texto}' no es válida (use YYYY-MM-DD o DD/MM/YYYY)")
+    if fecha > date.today():
+        raise ValueError(f"fecha_nacimiento {fecha} es futura")
+    return fecha.isoformat()
+
+
+def validar_fila(datos: dict, cursos_validos) -> tuple:
+    """
+    Valida y normaliza los datos de un estudiante.
+    :param datos: Diccionario {columna: valor} de una fila
+    :param cursos_validos: Conjunto de IDs de curso existentes
+    :return: Tupla lista para el INSERT, en el orden de COLUMNAS
+    :raises ValueError: Con la lista de problemas de la fila
+    """
+    problemas = []
+    fila = {}
+    for columna in ("nombre", "apellido", "direccion", "telefono", "email"):
+        valor = _texto(datos.get(columna))
+        if len(valor) > LARGO_MAXIMO[columna]:
+            problemas.append(f"{columna} supera {LARGO_MAXIMO[columna]} caracteres")
+        fila[columna] = valor or None
+
+    for columna in ("nombre", "apellido"):
+        if not fila[columna]:
+            problemas.append(f"{columna} es obligatorio")
+
+    if fila["email"]:
+        fila["email"] = fila["email"].lower()
+        if not PATRON_EMAIL.match(fila["email"]):
+            problemas.append(f"email '{fila['email']}' no es válido")
+
+    try:
+        fila["fecha_nacimiento"] = _convertir_fecha(datos.get("fecha_nacimiento"))
+    except ValueError as e:
+        problemas.append(str(e))
+
+    id_curso = _texto(datos.get("id_curso"))
+    try:
+        numero = float(id_curso) # Excel guarda los números como float (3 -> 3.0)
+        if not numero.is_integer():
+            raise ValueError
+        fila["id_curso"] = int(numero)
+        if fila["id_curso"] not in cursos_validos:
+            problemas.append(f"el curso {fila['id_curso']} no existe")
+    except ValueError:
+        problemas.append("id_curso es obligatorio" if not id_curso else f"id_curso '{id_curso}' no es un número entero")
+
+    if problemas:
+        raise ValueError("; ".join(problemas))
+    return tuple(fila[columna] for columna in COLUMNAS)
+
+
+class ReporteErrores:
+    """
+    Reporte CSV de las filas rechazadas (número de fila, motivo y valores originales).
+    El archivo se crea con el primer error; si no hay errores no se crea.
+    """
+    def __init__(self, ruta: str, encabezado):
+        """
+        Args:
+            ruta (str): Ruta del reporte.
+            encabezado: Encabezado del archivo importado (se copia tras las columnas fila y error).
+        """
+        self.ruta = ruta
+        self.encabezado = list(encabezado)
+        self.total = 0
+        self.primeros = [] # Los primeros errores, para mostrarlos en pantalla
+        self._archivo = None
+        self._escritor = None
+
+    def agregar(self, numero_fila: int, motivo: str, valores):
+        if self._archivo is None:
+            self._archivo = open(self.ruta, "w", newline="", encoding="utf-8-sig")
+            self._escritor = csv.writer(self._archivo)
+            self._escritor.writerow(["fila", "error", *self.encabezado])
+        self._escritor.writerow([numero_fila, motivo, *["" if v is None else v for v in valores]])
+        self.total += 1
+        if len(self.primeros) < 20:
+            self.primeros.append((numero_fila, motivo))
+
+    def cerrar(self):
+        if self._archivo is not None:
+            self._archivo.close()
+
+
+def _emails_registrados(cursor, emails):
+    """
+    Retorna cuáles de los emails (en minúsculas) ya pertenecen a un estudiante (consultas IN por bloques).
+    Los emails se guardan en minúsculas (migración v5), así la comparación directa usa el índice UNIQUE.
+    """
+    emails = list(emails)
+    registrados = set()
+    for inicio in range(0, len(emails), TAMANO_CONSULTA_EMAILS):
+        bloque = emails[inicio:inicio + TAMANO_CONSULTA_EMAILS]
+        marcadores = ", ".join("?" for _ in bloque)
+        cursor.execute(f"SELECT email FROM estudiante WHERE email IN ({marcadores})", tuple(bloque))
+        registrados.update(fila[0].lower() for fila in cursor.fetchall())
+    return registrados
+
+
+def _guardar_lote(conn, cursor, lote, reporte):
+    """
+    Inserta un lote de filas ya validadas en una transacción. Si el lote falla (p. ej. un email
+    registrado en paralelo) se reintenta fila por fila para rechazar solo las que fallan.
+    :param lote: Lista de (numero_fila, valores_originales, tupla_insert)
+    :return: Cantidad de filas insertadas
+    """
+    sql = f"INSERT INTO estudiante ({', '.join(COLUMNAS)}) VALUES ({', '.join('?' for _ in COLUMNAS)})"
+
+    # Emails repetidos contra la base de datos (los repetidos dentro del archivo ya se filtraron)
+    registrados = _emails_registrados(cursor, {fila[2][5] for fila in lote if fila[2][5]})
+    validas = []
+    for numero_fila, originales, valores in lote:
+        if valores[5] and valores[5] in registrados:
+            reporte.agregar(numero_fila, f"el email '{valores[5]}' ya está registrado", originales)
+        else:
+            validas.append((numero_fila, originales, valores))
+    if not validas:
+        return 0
+
+    try:
+        cursor.executemany(sql, [valores for _, _, valores in validas])
+        conn.commit()
+        return len(validas)
+    except Error:
+        conn.rollback()
+
+    insertadas = 0
+    for numero_fila, originales, valores in validas:
+        try:
+            cursor.execute(sql, valores)
+            insertadas += 1
+        except Error as e:
+            reporte.agregar(numero_fila, f"la base de datos rechazó la fila: {e}", originales)
+    conn.commit()
+    return insertadas
+
+
+def importar_estudiantes(ruta: str, tamano_lote: int = TAMANO_LOTE, progreso=None):
+    """
+    Importa estudiantes desde un archivo CSV o XLSX.
+
+    :param ruta: Ruta del archivo
+    :param tamano_lote: Filas válidas por executemany / commit
+    :param progreso: Función opcional (filas_leidas, insertados, rechazados) llamada después de cada lote
+    :return: Diccionario {"leidas", "insertados", "rechazados", "errores": [(fila, motivo)] (los primeros),
+             "reporte": ruta del CSV de errores o None si no hubo}, o None si no se pudo conectar o leer los cursos.
+    :raises ValueError: Si el archivo no tiene un formato admitido o le faltan columnas obligatorias.
+    """
+    filas = iter(leer_filas(ruta))
+    encabezado = next(filas, None)
+    if not encabezado:
+        raise ValueError("El archivo está vacío.")
+    nombres = [_texto(c).lower().replace(" ", "_") for c in encabezado]
+    faltantes = [c for c in COLUMNAS_OBLIGATORIAS if c not in nombres]
+    if faltantes:
+        raise ValueError(f"Faltan las columnas obligatorias: {', '.join(faltantes)}.")
+    posiciones = {c: nombres.index(c) for c in COLUMNAS if c in nombres}
+
+    cursos_validos = {curso[0] for curso in Curso.obtener_todos()} # Desde la caché de cursos
+    if not cursos_validos:
+        # La caché también devuelve una lista vacía si la lectura falló; sin cursos ninguna fila sería válida
+        print("No se pudieron leer los cursos; se cancela la importación.")
+        return None
+    base, _ = os.path.splitext(ruta)
+    reporte = ReporteErrores(f"{base}_errores.csv", encabezado)
+    emails_archivo = set()
+    leidas = insertados = 0
+
+    try:
+        with conexion_db() as (conn, cursor):
+            if not conn:
+                return None
+            numero_fila = 1 # El encabezado es la fila 1
+            while True:
+                bloque = list(islice(filas, tamano_lote))
+                if not bloque:
+                    break
+                lote = []
+                for originales in bloque:
+                    numero_fila += 1
+                    if not any(_texto(v) for v in originales):
+                        continue # Filas vacías (frecuentes al final de un Excel)
+                    leidas += 1
+                    datos = {c: originales[i] if i < len(originales) else None for c, i in posiciones.items()}
+                    try:
+                        valores = validar_fila(datos, cursos_validos)
+                    except ValueError as e:
+                        reporte.agregar(numero_fila, str(e), originales)
+                        continue
+                    email = valores[5]
+                    if email and email in emails_archivo:
+                        reporte.agregar(numero_fila, f"el email '{email}' está repetido en el archivo", originales)
+                        continue
+                    if email:
+                        emails_archivo.add(email)
+                    lote.append((numero_fila, originales, valores))
+
+                if lote:
+                    insertados += _guardar_lote(conn, cursor, lote, reporte)
+                if progreso:
+                    progreso(leidas, insertados, reporte.total)
+    finally:
+        reporte.cerrar()
+        if insertados:
+            # Los IDs nuevos pudieron quedar guardados como "no existe" en el resolvedor de nombres
+            NOMBRES_ESTUDIANTES.invalidar()
+
+    return {
+        "leidas": leidas,
+        "insertados": insertados,
+        "rechazados": reporte.total,
+        "errores": reporte.primeros,
+        "reporte": reporte.ruta if reporte.total else None,
+    }
@@ -0,0 +1,386 @@
+import mysql.connector
+from mysql.connector import errorcode
+
+# -----------------------------------
+# * Migraciones del esquema (MySQL)
+# -----------------------------------
+# Cada migración es (versión, descripción, pasos). Un paso es una sentencia SQL o una función
+# que recibe el cursor. Las versiones aplicadas se registran en la tabla schema_migrations.
+# Una migración ya publicada no se modifica: los cambios nuevos (índices, columnas)
+# se agregan al final de MIGRACIONES con la versión siguiente.
+#
+# En MySQL cada sentencia DDL confirma la transacción en curso, así que una migración no puede
+# revertirse completa: por eso cada paso es idempotente (IF NOT EXISTS o se consulta
+# information_schema antes) y repetir una migración que falló a medias es seguro.
+
+
+def crear_indice(tabla: str, nombre: str, columnas: str, unico: bool = False):
+    """
+    Paso de migración que crea un índice solo si la tabla todavía no lo tiene
+    (MySQL no admite CREATE INDEX IF NOT EXISTS).
+    :param tabla: Nombre de la tabla
+    :param nombre: Nombre del índice
+    :param columnas: Columnas separadas por comas, p. ej. "id_estudiante, fecha"
+    :param unico: True para un índice UNIQUE
+    :return: Función que recibe el cursor
+    """
+    def paso(cursor):
+        cursor.execute(
+            "SELECT 1 FROM information_schema.statistics "
+            "WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s LIMIT 1",
+            (tabla, nombre),
+        )
+        if cursor.fetchone() is None:
+            cursor.execute(f"ALTER TABLE {tabla} ADD {'UNIQUE ' if unico else ''}INDEX {nombre} ({columnas})")
+    return paso
+
+
+def eliminar_indice(tabla: str, nombre: str):
+    """
+    Paso de migración que borra un índice solo si la tabla todavía lo tiene
+    (MySQL no admite DROP INDEX IF EXISTS).
+    :param tabla: Nombre de la tabla
+    :param nombre: Nombre del índice
+    :return: Función que recibe el cursor
+    """
+    def paso(cursor):
+        cursor.execute(
+            "SELECT 1 FROM information_schema.statistics "
+            "WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s LIMIT 1",
+            (tabla, nombre),
+        )
+        if cursor.fetchone() is not None:
+            cursor.execute(f"ALTER TABLE {tabla} DROP INDEX {nombre}")
+    return paso
+
+
+def agregar_columna(tabla: str, columna: str, definicion: str):
+    """
+    Paso de migración que agrega una columna solo si la tabla todavía no la tiene.
+    :param tabla: Nombre de la tabla
+    :param columna: Nombre de la columna nueva
+    :param definicion: Tipo y restricciones, p. ej. "VARCHAR(20) DEFAULT NULL"
+    :return: Función que recibe el cursor
+    """
+    def paso(cursor):
+        cursor.execute(
+            "SELECT 1 FROM information_schema.columns "
+            "WHERE table_schema = DATABASE() AND table_name = %s AND column_name = %s LIMIT 1",
+            (tabla, columna),
+        )
+        if cursor.fetchone() is None:
+            cursor.execute(f"ALTER TABLE {tabla} ADD COLUMN {columna} {definicion}")
+    return paso
+
+
+def crear_trigger(nombre: str, definicion: str):
+    """
+    Paso de migración que (re)crea un trigger. Se borra antes si existe, así repetir
+    una migración que falló a medias es seguro.
+    :param nombre: Nombre del trigger
+    :param definicion: Lo que sigue al nombre en CREATE TRIGGER, p. ej. "AFTER INSERT ON t FOR EACH ROW BEGIN ... END"
+    :return: Función que recibe el cursor
+    """
+    def paso(cursor):
+        cursor.execute(f"DROP TRIGGER IF EXISTS {nombre}")
+        cursor.execute(f"CREATE TRIGGER {nombre} {definicion}")
+    return paso
+
+
+def _eliminar_asistencias_duplicadas(cursor):
+    """Deja un solo registro de asistencia por estudiante y fecha (el más reciente)."""
+    cursor.execute(
+        "DELETE a FROM asistencia a "
+        "JOIN asistencia b ON a.id_estudiante = b.id_estudiante AND a.fecha = b.fecha "
+        "AND a.id_asistencia < b.id_asistencia"
+    )
+    if cursor.rowcount > 0:
+        print(f"Se eliminaron {cursor.rowcount} registros de asistencia duplicados.")
+
+
+# --- Tablas de resumen (rollups) ---
+# resumen_asistencia_mensual: conteo por estudiante, mes (YYYY-MM) y estado.
+# resumen_notas_curso: suma, cantidad, mínima y máxima de las notas por curso y materia.
+# Las mantienen al día los triggers de asistencia, notas y estudiante. En MySQL los borrados en cascada
+# no disparan triggers: las filas de un estudiante, curso o materia borrados se quitan con las claves
+# foráneas ON DELETE CASCADE de las propias tablas de resumen.
+
+def _sumar_asistencia(fila: str) -> str:
+    return f"""
+        INSERT INTO resumen_asistencia_mensual (id_estudiante, mes, estado_asistencia, total)
+        SELECT {fila}.id_estudiante, SUBSTR({fila}.fecha, 1, 7), {fila}.estado_asistencia, 1 FROM DUAL
+        WHERE {fila}.id_estudiante IS NOT NULL AND {fila}.estado_asistencia IS NOT NULL
+        ON DUPLICATE KEY UPDATE total = total + 1;
+    """
+
+
+def _restar_asistencia(fila: str) -> str:
+    grupo = (f"id_estudiante = {fila}.id_estudiante AND mes = SUBSTR({fila}.fecha, 1, 7) "
+             f"AND estado_asistencia = {fila}.estado_asistencia")
+    return f"""
+        UPDATE resumen_asistencia_mensual SET total = total - 1 WHERE {grupo};
+        DELETE FROM resumen_asistencia_mensual WHERE {grupo} AND total <= 0;
+    """
+
+
+def _sumar_nota(fila: str) -> str:
+    return f"""
+        INSERT INTO resumen_notas_curso (id_curso, id_materia, suma, cantidad, minimo, maximo)
+        SELECT e.id_curso, {fila}.id_materia, {fila}.nota, 1, {fila}.nota, {fila}.nota
+        FROM estudiante e
+        WHERE e.id_estudiante = {fila}.id_estudiante AND e.id_curso IS NOT NULL AND {fila}.id_materia IS NOT NULL
+        ON DUPLICATE KEY UPDATE
+            suma = suma + VALUES(suma), cantidad = cantidad + 1,
+            minimo = LEAST(minimo, VALUES(minimo)), maximo = GREATEST(maximo, VALUES(maximo));
+    """
+
+
+def _restar_nota(fila: str) -> str:
+    grupo = (f"id_materia = {fila}.id_materia "
+             f"AND id_curso = (SELECT id_curso FROM estudiante WHERE id_estudiante = {fila}.id_estudiante)")
+    notas_grupo = (
+        "FROM notas n JOIN estudiante e ON e.id_estudiante = n.id_estudiante "
+        "WHERE e.id_curso = resumen_notas_curso.id_curso AND n.id_materia = resumen_notas_curso.id_materia"
+    )
+    return f"""
+        UPDATE resumen_notas_curso SET suma = suma - {fila}.nota, cantidad = cantidad - 1 WHERE {grupo};
+        DELETE FROM resumen_notas_curso WHERE {grupo} AND cantidad <= 0;
+        UPDATE resumen_notas_curso SET
+            minimo = (SELECT MIN(n.nota) {notas_grupo}),
+            maximo = (SELECT MAX(n.nota) {notas_grupo})
+        WHERE {grupo} AND ({fila}.nota <= minimo OR {fila}.nota >= maximo);
+    """
+
+
+def _recalcular_curso(id_curso: str) -> str:
+    return f"""
+        DELETE FROM resumen_notas_curso WHERE id_curso = {id_curso};
+        INSERT INTO resumen_notas_curso (id_curso, id_materia, suma, cantidad, minimo, maximo)
+        SELECT e.id_curso, n.id_materia, SUM(n.nota), COUNT(*), MIN(n.nota), MAX(n.nota)
+        FROM estudiante e JOIN notas n ON n.id_estudiante = e.id_estudiante
+        WHERE e.id_curso = {id_curso} AND n.id_materia IS NOT NULL
+        GROUP BY e.id_curso, n.id_materia;
+    """
+
+
+def _cargar_resumenes(cursor):
+    """Calcula las tablas de resumen desde los registros existentes."""
+    cursor.execute("DELETE FROM resumen_asistencia_mensual")
+    cursor.execute(
+        "INSERT INTO resumen_asistencia_mensual (id_estudiante, mes, estado_asistencia, total) "
+        "SELECT id_estudiante, SUBSTR(fecha, 1, 7), estado_asistencia, COUNT(*) FROM asistencia "
+        "WHERE id_estudiante IS NOT NULL AND estado_asistencia IS NOT NULL "
+        "GROUP BY id_estudiante, SUBSTR(fecha, 1, 7), estado_asistencia"
+    )
+    cursor.execute("DELETE FROM resumen_notas_curso")
+    cursor.execute(
+        "INSERT INTO resumen_notas_curso (id_curso, id_materia, suma, cantidad, minimo, maximo) "
+        "SELECT e.id_curso, n.id_materia, SUM(n.nota), COUNT(*), MIN(n.nota), MAX(n.nota) "
+        "FROM notas n JOIN estudiante e ON e.id_estudiante = n.id_estudiante "
+        "WHERE e.id_curso IS NOT NULL AND n.id_materia IS NOT NULL "
+        "GROUP BY e.id_curso, n.id_materia"
+    )
+
+
+MIGRACIONES = [
+    (1, "tablas del colegio", [
+        """
+        CREATE TABLE IF NOT EXISTS curso (
+            id_curso INT AUTO_INCREMENT PRIMARY KEY,
+            nombre VARCHAR(100) NOT NULL,
+            descripcion TEXT
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS estudiante (
+            id_estudiante INT AUTO_INCREMENT PRIMARY KEY,
+            nombre VARCHAR(100) NOT NULL,
+            apellido VARCHAR(100) NOT NULL,
+            fecha_nacimiento DATE,
+            direccion VARCHAR(255),
+            telefono VARCHAR(20),
+            email VARCHAR(100),
+            id_curso INT,
+            FOREIGN KEY (id_curso) REFERENCES curso(id_curso) ON DELETE CASCADE
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS materia (
+            id_materia INT AUTO_INCREMENT PRIMARY KEY,
+            nombre_materia VARCHAR(100) NOT NULL,
+            descripcion TEXT
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS profesor (
+            id_profesor INT AUTO_INCREMENT PRIMARY KEY,
+            nombre VARCHAR(100) NOT NULL,
+            apellido VARCHAR(100) NOT NULL,
+            email VARCHAR(100),
+            telefono VARCHAR(20)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS profesor_materia (
+            id_profesor INT,
+            id_materia INT,
+            PRIMARY KEY (id_profesor, id_materia),
+            FOREIGN KEY (id_profesor) REFERENCES profesor(id_profesor),
+            FOREIGN KEY (id_materia) REFERENCES materia(id_materia)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS asistencia (
+            id_asistencia INT AUTO_INCREMENT PRIMARY KEY,
+            id_estudiante INT,
+            fecha DATE NOT NULL,
+            estado_asistencia ENUM('Presente', 'Ausente', 'Tarde') DEFAULT 'Presente',
+            FOREIGN KEY (id_estudiante) REFERENCES estudiante(id_estudiante) ON DELETE CASCADE
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS notas (
+            id_nota INT AUTO_INCREMENT PRIMARY KEY,
+            id_estudiante INT,
+            id_materia INT,
+            nota DECIMAL(5,2) NOT NULL,
+            fecha DATE NOT NULL,
+            FOREIGN KEY (id_estudiante) REFERENCES estudiante(id_estudiante),
+            FOREIGN KEY (id_materia) REFERENCES materia(id_materia)
+        )
+        """,
+    ]),
+    # Índices de las consultas más frecuentes (reportes, listados y borrados en cascada).
+    # El índice único de asistencia permite además hacer upserts por (id_estudiante, fecha).
+    (2, "índices de reportes y listados", [
+        _eliminar_asistencias_duplicadas,
+        crear_indice("asistencia", "ux_asistencia_estudiante_fecha", "id_estudiante, fecha", unico=True),
+        crear_indice("asistencia", "idx_asistencia_estudiante_fecha_estado", "id_estudiante, fecha, estado_asistencia"),
+        crear_indice("notas", "idx_notas_estudiante_materia", "id_estudiante, id_materia, nota"),
+        crear_indice("notas", "idx_notas_materia", "id_materia, nota"),
+        crear_indice("estudiante", "idx_estudiante_curso", "id_curso"),
+        crear_indice("profesor_materia", "idx_profesor_materia_materia", "id_materia"),
+    ]),
+    # Tablas de resumen para los reportes de asistencia y notas por curso (ver _sumar_asistencia y siguientes)
+    (3, "tablas de resumen de asistencia y notas", [
+        """
+        CREATE TABLE IF NOT EXISTS resumen_asistencia_mensual (
+            id_estudiante INT NOT NULL,
+            mes CHAR(7) NOT NULL,
+            estado_asistencia ENUM('Presente', 'Ausente', 'Tarde') NOT NULL,
+            total INT NOT NULL,
+            PRIMARY KEY (id_estudiante, mes, estado_asistencia),
+            FOREIGN KEY (id_estudiante) REFERENCES estudiante(id_estudiante) ON DELETE CASCADE
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS resumen_notas_curso (
+            id_curso INT NOT NULL,
+            id_materia INT NOT NULL,
+            suma DECIMAL(14,2) NOT NULL,
+            cantidad INT NOT NULL,
+            minimo DECIMAL(5,2) NOT NULL,
+            maximo DECIMAL(5,2) NOT NULL,
+            PRIMARY KEY (id_curso, id_materia),
+            FOREIGN KEY (id_curso) REFERENCES curso(id_curso) ON DELETE CASCADE,
+            FOREIGN KEY (id_materia) REFERENCES materia(id_materia) ON DELETE CASCADE
+        )
+        """,
+        crear_trigger("trg_resumen_asistencia_insert",
+                      f"AFTER INSERT ON asistencia FOR EACH ROW BEGIN {_sumar_asistencia('NEW')} END"),
+        # Con INSERT ... ON DUPLICATE KEY UPDATE (Asistencia.guardar_lote) se dispara este y no el de INSERT
+        crear_trigger("trg_resumen_asistencia_update",
+                      f"AFTER UPDATE ON asistencia FOR EACH ROW BEGIN {_restar_asistencia('OLD')} {_sumar_asistencia('NEW')} END"),
+        crear_trigger("trg_resumen_asistencia_delete",
+                      f"AFTER DELETE ON asistencia FOR EACH ROW BEGIN {_restar_asistencia('OLD')} END"),
+        crear_trigger("trg_resumen_notas_insert",
+                      f"AFTER INSERT ON notas FOR EACH ROW BEGIN {_sumar_nota('NEW')} END"),
+        crear_trigger("trg_resumen_notas_update",
+                      f"AFTER UPDATE ON notas FOR EACH ROW BEGIN {_restar_nota('OLD')} {_sumar_nota('NEW')} END"),
+        crear_trigger("trg_resumen_notas_delete",
+                      f"AFTER DELETE ON notas FOR EACH ROW BEGIN {_restar_nota('OLD')} END"),
+        # Cambio de curso de un estudiante: sus notas pasan de un grupo a otro
+        crear_trigger("trg_resumen_estudiante_curso", f"""
+            AFTER UPDATE ON estudiante FOR EACH ROW BEGIN
+                IF NOT (OLD.id_curso <=> NEW.id_curso) THEN
+                    {_recalcular_curso("OLD.id_curso")}
+                    {_recalcular_curso("NEW.id_curso")}
+                END IF;
+            END
+        """),
+        _cargar_resumenes,
+    ]),
+    # Estadísticas de notas por período: recorren notas en orden (id_materia, nota) filtrando por fecha.
+    # Con fecha en el índice el recorrido no lee la tabla; reemplaza a idx_notas_materia (mismo prefijo,
+    # que también sirve a la clave foránea de id_materia, por eso se crea antes de borrar el anterior).
+    (4, "índice de notas por materia y fecha", [
+        crear_indice("notas", "idx_notas_materia_nota_fecha", "id_materia, nota, fecha"),
+        eliminar_indice("notas", "idx_notas_materia"),
+    ]),
+    # Los modelos y la importación guardan los emails en minúsculas; se unifican los anteriores
+    (5, "emails de estudiante en minúsculas", [
+        "UPDATE estudiante SET email = LOWER(email) "
+        "WHERE CAST(email AS BINARY) <> CAST(LOWER(email) AS BINARY)",
+    ]),
+]
+
+# Versión del esquema que espera esta versión de la aplicación
+VERSION_ESQUEMA = MIGRACIONES[-1][0]
+
+
+def version_actual(cursor) -> int:
+    """
+    Lee la última versión registrada en schema_migrations.
+    :return: 0 si la base es nueva o anterior al control de versiones
+    """
+    try:
+        cursor.execute("SELECT COALESCE(MAX(version), 0) FROM schema_migrations")
+        return cursor.fetchone()[0]
+    except mysql.connector.ProgrammingError as e:
+        if e.errno == errorcode.ER_NO_SUCH_TABLE:
+            return 0
+        raise
+
+
+def aplicar_migraciones(conn, cursor):
+    """
+    Aplica en orden las migraciones posteriores a la versión registrada. Cada migración se anota
+    en schema_migrations apenas termina, así un error solo deja pendientes la que falló y las
+    siguientes. Si el esquema ya está al día solo se consulta la versión.
+    :return: Lista de versiones aplicadas ([] si no había pendientes) o None si hubo error
+    """
+    aplicadas = []
+    try:
+        actual = version_actual(cursor)
+        if actual > VERSION_ESQUEMA:
+            print(f"La base de datos tiene el esquema v{actual}, más nuevo que el de esta versión (v{VERSION_ESQUEMA}).")
+            return []
+        pendientes = [m for m in MIGRACIONES if m[0] > actual]
+        if not pendientes:
+            return []
+
+        print(f"Actualizando el esquema de v{actual} a v{VERSION_ESQUEMA}...")
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INT PRIMARY KEY,
+                descripcion VARCHAR(255) NOT NULL,
+                aplicada_en TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+        for version, descripcion, pasos in pendientes:
+            for paso in pasos:
+                if callable(paso):
+                    paso(cursor)
+                else:
+                    cursor.execute(paso)
+            cursor.execute("INSERT INTO schema_migrations (version, descripcion) VALUES (%s, %s)", (version, descripcion))
+            conn.commit()
+            aplicadas.append(version)
+            print(f"  v{version}: {descripcion}")
+        return aplicadas
+    except mysql.connector.Error as e:
+        print(f"Error aplicando las migraciones del esquema: {e}")
+        conn.rollback()
+        return None
@@ -0,0 +1,351 @@
+import sqlite3
+
+# -----------------------------------
+# * Migraciones del esquema (SQLite)
+# -----------------------------------
+# Cada migración es (versión, descripción, pasos). Un paso es una sentencia SQL o una función
+# que recibe el cursor. La última versión aplicada se guarda en PRAGMA user_version.
+# Una migración ya publicada no se modifica: los cambios nuevos (índices, columnas)
+# se agregan al final de MIGRACIONES con la versión siguiente.
+
+
+def agregar_columna(tabla: str, columna: str, definicion: str):
+    """
+    Paso de migración que agrega una columna solo si la tabla todavía no la tiene
+    (SQLite no admite ADD COLUMN IF NOT EXISTS).
+    :param tabla: Nombre de la tabla
+    :param columna: Nombre de la columna nueva
+    :param definicion: Tipo y restricciones, p. ej. "TEXT DEFAULT ''"
+    :return: Función que recibe el cursor
+    """
+    def paso(cursor):
+        cursor.execute(f"PRAGMA table_info({tabla})")
+        if columna not in {fila[1] for fila in cursor.fetchall()}:
+            cursor.execute(f"ALTER TABLE {tabla} ADD COLUMN {columna} {definicion}")
+    return paso
+
+
+def _eliminar_asistencias_duplicadas(cursor):
+    """Deja un solo registro de asistencia por estudiante y fecha (el más reciente)."""
+    cursor.execute(
+        "DELETE FROM asistencia WHERE id_asistencia NOT IN ("
+        "SELECT MAX(id_asistencia) FROM asistencia GROUP BY id_estudiante, fecha)"
+    )
+    if cursor.rowcount > 0:
+        print(f"Se eliminaron {cursor.rowcount} registros de asistencia duplicados.")
+
+
+def _emails_en_minusculas(cursor):
+    """
+    Pasa a minúsculas los emails de estudiante guardados con mayúsculas (los modelos y la importación
+    ya los guardan así). Si dos registros solo difieren en mayúsculas se dejan como están: el índice
+    UNIQUE no permite unificarlos y hay que corregirlos a mano.
+    """
+    cursor.execute(
+        "UPDATE estudiante SET email = LOWER(email) WHERE email <> LOWER(email) AND NOT EXISTS ("
+        "SELECT 1 FROM estudiante otro WHERE LOWER(otro.email) = LOWER(estudiante.email) "
+        "AND otro.id_estudiante <> estudiante.id_estudiante)"
+    )
+    cursor.execute("SELECT id_estudiante, email FROM estudiante WHERE email <> LOWER(email)")
+    repetidos = cursor.fetchall()
+    if repetidos:
+        print(f"Emails de estudiante repetidos con otras mayúsculas (sin cambiar): {repetidos}")
+
+
+# --- Tablas de resumen (rollups) ---
+# resumen_asistencia_mensual: conteo por estudiante, mes (YYYY-MM) y estado.
+# resumen_notas_curso: suma, cantidad, mínima y máxima de las notas por curso y materia.
+# Las mantienen al día los triggers de asistencia, notas, estudiante, curso y materia, así cualquier
+# escritura (modelos, lotes, borrados en cascada) las actualiza. Las altas son incrementales;
+# al quitar una nota solo se recalculan la mínima y la máxima de su grupo si esa nota era una de ellas.
+
+def _sumar_asistencia(fila: str) -> str:
+    return f"""
+        INSERT INTO resumen_asistencia_mensual (id_estudiante, mes, estado_asistencia, total)
+        SELECT {fila}.id_estudiante, substr({fila}.fecha, 1, 7), {fila}.estado_asistencia, 1
+        WHERE {fila}.id_estudiante IS NOT NULL AND {fila}.estado_asistencia IS NOT NULL
+        ON CONFLICT (id_estudiante, mes, estado_asistencia) DO UPDATE SET total = total + 1;
+    """
+
+
+def _restar_asistencia(fila: str) -> str:
+    grupo = (f"id_estudiante = {fila}.id_estudiante AND mes = substr({fila}.fecha, 1, 7) "
+             f"AND estado_asistencia = {fila}.estado_asistencia")
+    return f"""
+        UPDATE resumen_asistencia_mensual SET total = total - 1 WHERE {grupo};
+        DELETE FROM resumen_asistencia_mensual WHERE {grupo} AND total <= 0;
+    """
+
+
+def _sumar_nota(fila: str) -> str:
+    return f"""
+        INSERT INTO resumen_notas_curso (id_curso, id_materia, suma, cantidad, minimo, maximo)
+        SELECT e.id_curso, {fila}.id_materia, {fila}.nota, 1, {fila}.nota, {fila}.nota
+        FROM estudiante e
+        WHERE e.id_estudiante = {fila}.id_estudiante AND e.id_curso IS NOT NULL AND {fila}.id_materia IS NOT NULL
+        ON CONFLICT (id_curso, id_materia) DO UPDATE SET
+            suma = suma + excluded.suma, cantidad = cantidad + 1,
+            minimo = min(minimo, excluded.minimo), maximo = max(maximo, excluded.maximo);
+    """
+
+
+def _restar_nota(fila: str) -> str:
+    grupo = (f"id_materia = {fila}.id_materia "
+             f"AND id_curso = (SELECT id_curso FROM estudiante WHERE id_estudiante = {fila}.id_estudiante)")
+    notas_grupo = (
+        "FROM notas n JOIN estudiante e ON e.id_estudiante = n.id_estudiante "
+        "WHERE e.id_curso = resumen_notas_curso.id_curso AND n.id_materia = resumen_notas_curso.id_materia"
+    )
+    return f"""
+        UPDATE resumen_notas_curso SET suma = suma - {fila}.nota, cantidad = cantidad - 1 WHERE {grupo};
+        DELETE FROM resumen_notas_curso WHERE {grupo} AND cantidad <= 0;
+        UPDATE resumen_notas_curso SET
+            minimo = (SELECT MIN(n.nota) {notas_grupo}),
+            maximo = (SELECT MAX(n.nota) {notas_grupo})
+        WHERE {grupo} AND ({fila}.nota <= minimo OR {fila}.nota >= maximo);
+    """
+
+
+def _recalcular_curso(id_curso: str) -> str:
+    return f"""
+        DELETE FROM resumen_notas_curso WHERE id_curso = {id_curso};
+        INSERT INTO resumen_notas_curso (id_curso, id_materia, suma, cantidad, minimo, maximo)
+        SELECT e.id_curso, n.id_materia, SUM(n.nota), COUNT(*), MIN(n.nota), MAX(n.nota)
+        FROM estudiante e JOIN notas n ON n.id_estudiante = e.id_estudiante
+        WHERE e.id_curso = {id_curso} AND n.id_materia IS NOT NULL
+        GROUP BY e.id_curso, n.id_materia;
+    """
+
+
+def _cargar_resumenes(cursor):
+    """Calcula las tablas de resumen desde los registros existentes."""
+    cursor.execute("DELETE FROM resumen_asistencia_mensual")
+    cursor.execute(
+        "INSERT INTO resumen_asistencia_mensual (id_estudiante, mes, estado_asistencia, total) "
+        "SELECT id_estudiante, substr(fecha, 1, 7), estado_asistencia, COUNT(*) FROM asistencia "
+        "WHERE id_estudiante IS NOT NULL AND estado_asistencia IS NOT NULL "
+        "GROUP BY id_estudiante, substr(fecha, 1, 7), estado_asistencia"
+    )
+    cursor.execute("DELETE FROM resumen_notas_curso")
+    cursor.execute(
+        "INSERT INTO resumen_notas_curso (id_curso, id_materia, suma, cantidad, minimo, maximo) "
+        "SELECT e.id_curso, n.id_materia, SUM(n.nota), COUNT(*), MIN(n.nota), MAX(n.nota) "
+        "FROM notas n JOIN estudiante e ON e.id_estudiante = n.id_estudiante "
+        "WHERE e.id_curso IS NOT NULL AND n.id_materia IS NOT NULL "
+        "GROUP BY e.id_curso, n.id_materia"
+    )
+
+
+MIGRACIONES = [
+    (1, "tablas del colegio", [
+        """
+        CREATE TABLE IF NOT EXISTS curso (
+            id_curso INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre TEXT NOT NULL,
+            descripcion TEXT
+        );
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS materia (
+            id_materia INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre_materia TEXT NOT NULL UNIQUE,
+            descripcion TEXT
+        );
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS profesor (
+            id_profesor INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre TEXT NOT NULL,
+            apellido TEXT NOT NULL,
+            email TEXT UNIQUE,
+            telefono TEXT
+        );
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS estudiante (
+            id_estudiante INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre TEXT NOT NULL,
+            apellido TEXT NOT NULL,
+            fecha_nacimiento TEXT, -- Formato YYYY-MM-DD
+            direccion TEXT,
+            telefono TEXT,
+            email TEXT UNIQUE,
+            id_curso INTEGER,
+            FOREIGN KEY (id_curso) REFERENCES curso(id_curso) ON DELETE CASCADE
+        );
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS profesor_materia (
+            id_profesor INTEGER,
+            id_materia INTEGER,
+            PRIMARY KEY (id_profesor, id_materia),
+            FOREIGN KEY (id_profesor) REFERENCES profesor(id_profesor) ON DELETE CASCADE,
+            FOREIGN KEY (id_materia) REFERENCES materia(id_materia) ON DELETE CASCADE
+        );
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS asistencia (
+            id_asistencia INTEGER PRIMARY KEY AUTOINCREMENT,
+            id_estudiante INTEGER,
+            fecha TEXT NOT NULL, -- Formato YYYY-MM-DD
+            estado_asistencia TEXT DEFAULT 'Presente'
+            CHECK(estado_asistencia IN ('Presente', 'Ausente', 'Tarde')),
+            FOREIGN KEY (id_estudiante) REFERENCES estudiante(id_estudiante) ON DELETE CASCADE
+        );
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS notas (
+            id_nota INTEGER PRIMARY KEY AUTOINCREMENT,
+            id_estudiante INTEGER,
+            id_materia INTEGER,
+            nota REAL NOT NULL CHECK(nota >= 0 AND nota <= 100), -- Ajusta la escala si es necesario
+            fecha TEXT NOT NULL, -- Formato YYYY-MM-DD
+            FOREIGN KEY (id_estudiante) REFERENCES estudiante(id_estudiante) ON DELETE CASCADE,
+            FOREIGN KEY (id_materia) REFERENCES materia(id_materia) ON DELETE CASCADE
+        );
+        """,
+    ]),
+    # Índices de las consultas más frecuentes (reportes, listados y borrados en cascada).
+    # El índice único de asistencia permite además hacer upserts por (id_estudiante, fecha).
+    (2, "índices de reportes y listados", [
+        _eliminar_asistencias_duplicadas,
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_asistencia_estudiante_fecha ON asistencia(id_estudiante, fecha)",
+        "CREATE INDEX IF NOT EXISTS idx_asistencia_estudiante_fecha_estado ON asistencia(id_estudiante, fecha, estado_asistencia)",
+        "CREATE INDEX IF NOT EXISTS idx_notas_estudiante_materia ON notas(id_estudiante, id_materia, nota)",
+        "CREATE INDEX IF NOT EXISTS idx_notas_materia ON notas(id_materia, nota)",
+        "CREATE INDEX IF NOT EXISTS idx_estudiante_curso ON estudiante(id_curso)",
+        "CREATE INDEX IF NOT EXISTS idx_profesor_materia_materia ON profesor_materia(id_materia)",
+    ]),
+    # Tablas de resumen para los reportes de asistencia y notas por curso (ver _sumar_asistencia y siguientes)
+    (3, "tablas de resumen de asistencia y notas", [
+        """
+        CREATE TABLE IF NOT EXISTS resumen_asistencia_mensual (
+            id_estudiante INTEGER NOT NULL,
+            mes TEXT NOT NULL, -- Formato YYYY-MM
+            estado_asistencia TEXT NOT NULL,
+            total INTEGER NOT NULL,
+            PRIMARY KEY (id_estudiante, mes, estado_asistencia)
+        ) WITHOUT ROWID;
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS resumen_notas_curso (
+            id_curso INTEGER NOT NULL,
+            id_materia INTEGER NOT NULL,
+            suma REAL NOT NULL,
+            cantidad INTEGER NOT NULL,
+            minimo REAL NOT NULL,
+            maximo REAL NOT NULL,
+            PRIMARY KEY (id_curso, id_materia)
+        ) WITHOUT ROWID;
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_resumen_asistencia_insert AFTER INSERT ON asistencia
+        BEGIN {_sumar_asistencia("NEW")} END;
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_resumen_asistencia_update AFTER UPDATE ON asistencia
+        BEGIN {_restar_asistencia("OLD")} {_sumar_asistencia("NEW")} END;
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_resumen_asistencia_delete AFTER DELETE ON asistencia
+        BEGIN {_restar_asistencia("OLD")} END;
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_resumen_notas_insert AFTER INSERT ON notas
+        BEGIN {_sumar_nota("NEW")} END;
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_resumen_notas_update AFTER UPDATE ON notas
+        BEGIN {_restar_nota("OLD")} {_sumar_nota("NEW")} END;
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_resumen_notas_delete AFTER DELETE ON notas
+        BEGIN {_restar_nota("OLD")} END;
+        """,
+        # Cambio de curso de un estudiante: sus notas pasan de un grupo a otro
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_resumen_estudiante_curso AFTER UPDATE OF id_curso ON estudiante
+        WHEN OLD.id_curso IS NOT NEW.id_curso
+        BEGIN {_recalcular_curso("OLD.id_curso")} {_recalcular_curso("NEW.id_curso")} END;
+        """,
+        # En un borrado en cascada el estudiante ya no existe cuando se borran sus notas,
+        # así que el curso se recalcula aquí (sin las notas del estudiante borrado)
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_resumen_estudiante_delete AFTER DELETE ON estudiante
+        BEGIN
+            DELETE FROM resumen_asistencia_mensual WHERE id_estudiante = OLD.id_estudiante;
+            {_recalcular_curso("OLD.id_curso")}
+        END;
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_resumen_curso_delete AFTER DELETE ON curso
+        BEGIN DELETE FROM resumen_notas_curso WHERE id_curso = OLD.id_curso; END;
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_resumen_materia_delete AFTER DELETE ON materia
+        BEGIN DELETE FROM resumen_notas_curso WHERE id_materia = OLD.id_materia; END;
+        """,
+        _cargar_resumenes,
+    ]),
+    # Estadísticas de notas por período: recorren notas en orden (id_materia, nota) filtrando por fecha.
+    # Con fecha en el índice el recorrido no lee la tabla; reemplaza a idx_notas_materia (mismo prefijo).
+    (4, "índice de notas por materia y fecha", [
+        "CREATE INDEX IF NOT EXISTS idx_notas_materia_nota_fecha ON notas(id_materia, nota, fecha)",
+        "DROP INDEX IF EXISTS idx_notas_materia",
+    ]),
+    # La búsqueda de emails ya registrados (importación) compara con email IN (...) sobre el índice UNIQUE
+    (5, "emails de estudiante en minúsculas", [
+        _emails_en_minusculas,
+    ]),
+]
+
+# Versión del esquema que espera esta versión de la aplicación
+VERSION_ESQUEMA = MIGRACIONES[-1][0]
+
+
+def version_actual(cursor) -> int:
+    """
+    Lee la versión del esquema guardada en el archivo.
+    :return: 0 si la base es nueva o anterior al control de versiones
+    """
+    cursor.execute("PRAGMA user_version")
+    return cursor.fetchone()[0]
+
+
+def aplicar_migraciones(conn, cursor):
+    """
+    Aplica en orden las migraciones posteriores a la versión guardada, todas en una sola
+    transacción: si un paso falla no queda ningún cambio a medias. Si el esquema ya está al día
+    solo se lee user_version.
+    :return: Lista de versiones aplicadas ([] si no había pendientes) o None si hubo error
+    """
+    try:
+        actual = version_actual(cursor)
+        if actual > VERSION_ESQUEMA:
+            print(f"La base de datos tiene el esquema v{actual}, más nuevo que el de esta versión (v{VERSION_ESQUEMA}).")
+            return []
+        pendientes = [m for m in MIGRACIONES if m[0] > actual]
+        if not pendientes:
+            return []
+
+        print(f"Actualizando el esquema de v{actual} a v{VERSION_ESQUEMA}...")
+        cursor.execute("BEGIN")
+        for version, descripcion, pasos in pendientes:
+            for paso in pasos:
+                if callable(paso):
+                    paso(cursor)
+                else:
+                    cursor.execute(paso)
+            print(f"  v{version}: {descripcion}")
+        cursor.execute(f"PRAGMA user_version = {VERSION_ESQUEMA}")
+        conn.commit()
+
+        # Estadísticas completas para el planificador tras cambiar el esquema
+        # (con estadísticas parciales SQLite puede preferir índices automáticos)
+        cursor.execute("ANALYZE")
+        conn.commit()
+        return [m[0] for m in pendientes]
+    except sqlite3.Error as e:
+        print(f"Error aplicando las migraciones del esquema: {e}")
+        conn.rollback()
+        return None
@@ -0,0 +1,12 @@
+import sys
+import os
+
+# Separado de models/database.py para que las vistas que solo muestran imágenes
+# no carguen el conector de la base de datos antes del primer frame.
+def resource_path(relative_path):
+    try:
+        # PyInstaller usa una carpeta temporal
+        base_path = sys._MEIPASS
+    except AttributeError:
+        base_path = os.path.abspath(".")
+    return os.path.join(base_path, relative_path)
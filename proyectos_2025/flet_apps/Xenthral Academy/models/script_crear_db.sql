@@ -0,0 +1,6 @@
+CREATE DATABASE IF NOT EXISTS colegio;
+
+-- Las tablas e índices ya no se crean con este script: la aplicación aplica al iniciar
+-- las migraciones pendientes de models/migraciones_mysql.py y registra cada versión en la
+-- tabla schema_migrations. Una base creada con una versión anterior de este script
+-- se actualiza sola la primera vez que se abre la aplicación.
@@ -2,7 +2,7 @@ import flet as ft
 import asyncio
 
 
-from models.database import resource_path
+from models.recursos import resource_path
 
 # La definición de la función ACEPTA 'page' y 'app_state'
 def acerca_de_view(page: ft.Page, app_state: dict):
@@ -77,8 +77,16 @@ def acerca_de_view(page: ft.Page, app_state: dict):
         """Acción al presionar el botón de reproducir."""
         app_state["is_music_playing"] = True
         # Usar el control de audio global desde app_state
-        if app_state.get("audio_control"):
-            app_state["audio_control"].play() 
+        audio_control = app_state.get("audio_control")
+        if audio_control is None:
+            # El audio se crea recién la primera vez que se reproduce (no retrasa el arranque);
+            # con autoplay empieza a sonar en cuanto el cliente lo carga.
+            audio_control = ft.Audio(src="assets/song.mp3", autoplay=True) # ft.Audio está obsoleto, considerar migrar a flet_audio
+            app_state["audio_control"] = audio_control
+            page.overlay.append(audio_control)
+            page.update()
+        else:
+            audio_control.play() 
         
         # Cancelar cualquier tarea de animación anterior para esta vista
         if app_state.get("acerca_de_animation_task") and not app_state["acerca_de_animation_task"].done():
@@ -3,7 +3,9 @@ from datetime import date, datetime
 # Asegúrate que la ruta a models.database es correcta según tu estructura de proyecto
 # Ejemplo: from ..models.database import Curso, Estudiante, Asistencia
 # Si asistencias_view.py está en una carpeta 'views' y 'models' está al mismo nivel:
-from models.database import Curso, Estudiante, Asistencia # Asegúrate que esto funciona
+from models.database import Curso, Asistencia # Asegúrate que esto funciona
+from models.asincrono import Asincrono, ejecutar
+from views.registro_vistas import con_refresco, con_overlay
 
 # Estados de asistencia posibles
 ESTADOS_ASISTENCIA = ["Presente", "Ausente", "Tarde"]
@@ -19,7 +21,7 @@ def asistencias_view(page: ft.Page):
         hint_text="Elija un curso para ver sus estudiantes",
         options=[], # Se llenarán dinámicamente
         width=400,
-        on_change=lambda e: cargar_estudiantes_asistencia() # Recargar al cambiar curso
+        on_change=lambda e: page.run_task(cargar_estudiantes_asistencia) # Recargar al cambiar curso
     )
 
     def abrir_dialogo_datepicker(dp: ft.DatePicker):
@@ -31,7 +33,7 @@ def asistencias_view(page: ft.Page):
         if fecha_asistencia_picker.value: # El valor ya es un datetime
             fecha_seleccionada = fecha_asistencia_picker.value.date() # Convertir datetime a date
             fecha_display_button.text = f"Fecha: {fecha_seleccionada.strftime('%Y-%m-%d')}"
-            cargar_estudiantes_asistencia() # Asegúrate que esto no cause un bucle si on_change se dispara al abrir
+            page.run_task(cargar_estudiantes_asistencia) # Asegúrate que esto no cause un bucle si on_change se dispara al abrir
         else: # Si el usuario cancela el DatePicker, value podría ser None
             # Mantener la fecha anterior o la fecha de hoy si es la primera vez
             current_picker_date_obj = fecha_asistencia_picker.value
@@ -79,7 +81,7 @@ def asistencias_view(page: ft.Page):
     btn_guardar_asistencia = ft.ElevatedButton(
         text="Guardar Asistencia",
         icon=ft.Icons.SAVE, # CORREGIDO
-        on_click=lambda e: guardar_asistencias_click(),
+        on_click=lambda e: page.run_task(guardar_asistencias_click),
         bgcolor=ft.Colors.BLUE_600, # CORREGIDO
         color=ft.Colors.WHITE, # CORREGIDO
         visible=False # Solo visible cuando hay estudiantes cargados
@@ -92,10 +94,11 @@ def asistencias_view(page: ft.Page):
     estudiantes_data_actual = {}
 
 
-    def cargar_cursos():
-        """Carga los cursos en el Dropdown."""
+    def cargar_cursos(cursos=None):
+        """Carga los cursos en el Dropdown (consulta la base de datos si no se reciben las filas)."""
         try:
-            cursos = Curso.obtener_todos()
+            if cursos is None:
+                cursos = Curso.obtener_todos()
             if cursos:
                 cursos_dropdown.options = [
                     ft.dropdown.Option(key=curso[0], text=curso[1]) for curso in cursos
@@ -121,7 +124,7 @@ def asistencias_view(page: ft.Page):
         # page.update()
 
 
-    def cargar_estudiantes_asistencia():
+    async def cargar_estudiantes_asistencia():
         """Carga los estudiantes del curso y fecha seleccionados, y su asistencia si existe."""
         id_curso_seleccionado = cursos_dropdown.value
         fecha_seleccionada_dt = fecha_asistencia_picker.value
@@ -148,7 +151,8 @@ def asistencias_view(page: ft.Page):
         fecha_seleccionada = fecha_seleccionada_dt.date()
 
         try:
-            estudiantes = Estudiante.obtener_por_id_curso(int(id_curso_seleccionado))
+            # Estudiantes del curso y su asistencia de la fecha en una sola consulta (en el pool de hilos)
+            estudiantes = await Asincrono(Asistencia).obtener_roster_con_asistencia(int(id_curso_seleccionado), fecha_seleccionada)
 
             if not estudiantes:
                 estudiantes_list_view.controls.append(ft.Text("No hay estudiantes en este curso."))
@@ -156,18 +160,8 @@ def asistencias_view(page: ft.Page):
                 page.update()
                 return
 
-            for est_row in estudiantes:
-                id_estudiante = est_row[0]
-                nombre_completo = f"{est_row[1]} {est_row[2]}"
-
-                asistencia_existente = Asistencia.obtener_asistencia_por_estudiante_y_fecha(id_estudiante, fecha_seleccionada)
-
-                estado_actual = None
-                id_asistencia_db = None
-
-                if asistencia_existente:
-                    id_asistencia_db = asistencia_existente[0]
-                    estado_actual = asistencia_existente[1]
+            for id_estudiante, nombre, apellido, id_asistencia_db, estado_actual in estudiantes:
+                nombre_completo = f"{nombre} {apellido}"
 
                 radios_estado = [
                     ft.Radio(value=estado, label=estado) for estado in ESTADOS_ASISTENCIA
@@ -207,7 +201,7 @@ def asistencias_view(page: ft.Page):
             progreso_carga.visible = False
             page.update()
 
-    def guardar_asistencias_click():
+    async def guardar_asistencias_click():
         """Maneja el evento de clic del botón Guardar Asistencia."""
         id_curso_seleccionado = cursos_dropdown.value
         fecha_seleccionada_dt = fecha_asistencia_picker.value
@@ -223,34 +217,24 @@ def asistencias_view(page: ft.Page):
 
         registros_guardados = 0
         registros_actualizados = 0
-        errores = 0
+        registros = []
 
         try:
             for id_estudiante, data in estudiantes_data_actual.items():
                 estado_seleccionado = data['control_estado'].value
-                id_asistencia_existente = data['id_asistencia_existente']
 
                 if not estado_seleccionado:
                     continue
 
-                try:
-                    if id_asistencia_existente:
-                        Asistencia.actualizar_asistencia(id_asistencia_existente, estado_seleccionado)
-                        registros_actualizados += 1
-                    else:
-                        Asistencia.registrar_asistencia(id_estudiante, fecha_seleccionada, estado_seleccionado)
-                        registros_guardados += 1
-                except Exception as e_detalle:
-                    errores += 1
-                    print(f"Error guardando asistencia para ID {id_estudiante}: {e_detalle}")
-
-            if errores > 0:
-                mensaje = f"Guardado con {errores} error(es)."
-                if registros_guardados > 0:
-                    mensaje += f" {registros_guardados} nuevo(s)."
-                if registros_actualizados > 0:
-                    mensaje += f" {registros_actualizados} actualizado(s)."
-                mostrar_feedback(mensaje, error=True)
+                registros.append((id_estudiante, estado_seleccionado))
+                if data['id_asistencia_existente']:
+                    registros_actualizados += 1
+                else:
+                    registros_guardados += 1
+
+            # Todo el curso se guarda en una sola transacción
+            if not await Asincrono(Asistencia).guardar_lote(fecha_seleccionada, registros):
+                mostrar_feedback("No se pudo guardar la asistencia. No se aplicó ningún cambio.", error=True)
             else:
                 mensaje = "Asistencia guardada exitosamente."
                 if registros_guardados > 0:
@@ -259,7 +243,7 @@ def asistencias_view(page: ft.Page):
                     mensaje += f" ({registros_actualizados} actualizado(s))"
                 mostrar_feedback(mensaje)
 
-            cargar_estudiantes_asistencia() # Recargar para reflejar los cambios y nuevos IDs de asistencia
+            await cargar_estudiantes_asistencia() # Recargar para reflejar los cambios y nuevos IDs de asistencia
 
         except Exception as e:
             mostrar_feedback(f"Error general al guardar: {e}", error=True)
@@ -272,8 +256,12 @@ def asistencias_view(page: ft.Page):
     # --- Carga Inicial ---
     cargar_cursos()
 
+    async def refrescar():
+        """Al volver a la vista: recarga los cursos (pudieron cambiar en la vista Cursos)."""
+        cargar_cursos(await ejecutar(Curso.obtener_todos))
+
     # --- Layout de la Vista ---
-    return ft.Column(
+    return con_overlay(con_refresco(ft.Column(
         expand=True,
         controls=[
             ft.Container(
@@ -299,4 +287,4 @@ def asistencias_view(page: ft.Page):
         ],
         horizontal_alignment=ft.CrossAxisAlignment.STRETCH,
         spacing=10
-    )
\ No newline at end of file
+    ), refrescar), fecha_asistencia_picker)
@@ -0,0 +1,68 @@
+import asyncio
+
+import flet as ft
+from models.asincrono import ejecutar
+
+# Pausa de escritura (en segundos) que se espera antes de consultar la base de datos
+ESPERA_BUSQUEDA_SEG = 0.3
+
+
+class BusquedaDiferida:
+    """
+    Búsqueda con espera (debounce) para los campos de ID que muestran el nombre del registro.
+
+    Cada `programar` cancela la búsqueda anterior (esté esperando o consultando) y agenda una nueva
+    que solo consulta si el usuario dejó de escribir durante `espera` segundos. La consulta corre en
+    el pool de hilos y solo se muestra el resultado de la última búsqueda: una respuesta que llega
+    tarde, de un valor que el usuario ya cambió, se descarta.
+    """
+    def __init__(self, page: ft.Page, buscar, mostrar, espera: float = ESPERA_BUSQUEDA_SEG):
+        """
+        Args:
+            page (ft.Page): La página de Flet.
+            buscar: Función bloqueante que recibe la clave (el ID) y retorna el resultado (p. ej. el nombre).
+            mostrar: Función (clave, resultado) que actualiza los controles con el resultado.
+                Si la consulta lanza una excepción recibe el resultado None.
+            espera (float): Segundos sin cambios antes de consultar.
+        """
+        self.page = page
+        self.buscar = buscar
+        self.mostrar = mostrar
+        self.espera = espera
+        self._tarea = None
+        self._generacion = 0 # Cambia con cada búsqueda programada o cancelada
+
+    def programar(self, clave, inmediata: bool = False):
+        """
+        Agenda la búsqueda de una clave, reemplazando la que estuviera pendiente.
+
+        Args:
+            clave: Valor a buscar (normalmente el ID ya convertido a entero).
+            inmediata (bool): True para consultar sin esperar (p. ej. al cargar una fila en el formulario).
+        """
+        self.cancelar()
+        self._tarea = self.page.run_task(self._buscar, clave, self._generacion, 0 if inmediata else self.espera)
+
+    def cancelar(self):
+        """Descarta la búsqueda pendiente; su resultado ya no se mostrará."""
+        self._generacion += 1
+        if self._tarea is not None:
+            self._tarea.cancel()
+            self._tarea = None
+
+    async def _buscar(self, clave, generacion, espera):
+        if espera:
+            await asyncio.sleep(espera) # Una nueva pulsación cancela la tarea durante esta espera
+        if generacion != self._generacion:
+            return
+        try:
+            resultado = await ejecutar(self.buscar, clave)
+        except Exception as ex:
+            print(f"Error en la búsqueda de {clave}: {ex}")
+            resultado = None
+        # La consulta ya en curso no se puede interrumpir, pero su resultado se ignora si quedó viejo
+        if generacion != self._generacion:
+            return
+        self._tarea = None
+        self.mostrar(clave, resultado)
+        self.page.update()
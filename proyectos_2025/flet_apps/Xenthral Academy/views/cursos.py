@@ -1,5 +1,8 @@
 import flet as ft
 from models.database import Curso
+from views.paginacion import Paginador, IndiceFilas
+from models.asincrono import Asincrono
+from views.registro_vistas import con_refresco, con_overlay
 import asyncio
 
 class TablaCursos:
@@ -16,44 +19,48 @@ class TablaCursos:
             ],
             border=ft.border.all(1, ft.Colors.GREY),
         )
+        self.indice = IndiceFilas(self.table, self._crear_fila)
+        self.paginador = Paginador(page, Curso.obtener_pagina, self._actualizar_filas)
         self.actualizar_tabla() # Carga inicial de la tabla
 
     def cerrar_dialogo(self, e):
         """Cierra el diálogo modal."""
         self.dlg_modal.open = False
-        self.page.update()
+        self.dlg_modal.update()
 
     def actualizar_tabla(self):
-        """Recarga los datos de la base de datos y actualiza la tabla."""
-        data = Curso.obtener_todos()
-        new_rows = []
-        for curso_id, nombre, descripcion in data:
-            new_rows.append(
-                ft.DataRow(
-                    cells=[
-                        ft.DataCell(ft.Text(str(curso_id))),
-                        ft.DataCell(ft.Text(nombre)),
-                        ft.DataCell(ft.Text(descripcion)),
-                        ft.DataCell(
-                            ft.IconButton(
-                                icon=ft.Icons.EDIT,
-                                tooltip="Editar curso",
-                                on_click=lambda ev, cid=curso_id, nom=nombre, desc=descripcion: self.seleccionar_curso(ev, cid, nom, desc),
-                            )
-                        ),
-                        ft.DataCell(
-                            ft.IconButton(
-                                icon=ft.Icons.DELETE,
-                                tooltip="Eliminar curso",
-                                on_click=lambda ev, cid=curso_id, nom=nombre, desc=descripcion: self.eliminar_curso(ev, cid, nom, desc),
-                            )
-                        )
-                    ]
-                )
-            )
-        self.table.rows = new_rows
+        """Recarga la página actual desde la base de datos y actualiza la tabla."""
+        self.paginador.cargar()
+
+    def _actualizar_filas(self, data):
+        self.indice.cargar(data)
         self.page.update()
 
+    def _crear_fila(self, datos):
+        """Crea la fila de la tabla para un registro."""
+        curso_id, nombre, descripcion = datos
+        return ft.DataRow(
+            cells=[
+                ft.DataCell(ft.Text(str(curso_id))),
+                ft.DataCell(ft.Text(nombre)),
+                ft.DataCell(ft.Text(descripcion)),
+                ft.DataCell(
+                    ft.IconButton(
+                        icon=ft.Icons.EDIT,
+                        tooltip="Editar curso",
+                        on_click=lambda ev, cid=curso_id, nom=nombre, desc=descripcion: self.seleccionar_curso(ev, cid, nom, desc),
+                    )
+                ),
+                ft.DataCell(
+                    ft.IconButton(
+                        icon=ft.Icons.DELETE,
+                        tooltip="Eliminar curso",
+                        on_click=lambda ev, cid=curso_id, nom=nombre, desc=descripcion: self.eliminar_curso(ev, cid, nom, desc),
+                    )
+                )
+            ]
+        )
+
     def actualizar_datos(self, e, curso_id: int, nombre: str, descripcion: str):
         """
         Persiste los datos editados del curso de vuelta a la base de datos
@@ -62,7 +69,7 @@ class TablaCursos:
         curso = Curso(nombre=nombre, descripcion=descripcion, id_curso=curso_id)
         curso.actualizar_registro()
         self.cerrar_dialogo(e)
-        self.actualizar_tabla()  # Llamada para actualizar la tabla
+        self.indice.reemplazar((curso_id, nombre, descripcion))  # Solo se redibuja la fila editada
     
     def eliminar_curso(self, e, curso_id: int, nombre: str, descripcion: str):
         """
@@ -71,7 +78,13 @@ class TablaCursos:
         """
         curso = Curso(nombre=nombre, descripcion=descripcion, id_curso=curso_id)
         curso.eliminar_registro()
-        self.actualizar_tabla()  # Llamada para actualizar la tabla
+        self.indice.quitar(curso_id)  # Solo se quita la fila eliminada
+        self.paginador.fila_quitada(len(self.table.rows))
+
+    def agregar_fila(self, datos):
+        """Muestra un registro recién creado si le corresponde a la página actual."""
+        if self.paginador.admite_nueva_fila(datos[0], len(self.table.rows)):
+            self.indice.agregar(datos)
 
     def seleccionar_curso(self, e, curso_id: int, curso_nombre: str, curso_descripcion: str):
         """
@@ -106,8 +119,8 @@ class TablaCursos:
         self.page.update()
 
     def construir_tabla(self):
-        """Retorna el control de la tabla para ser añadido a la página."""
-        return ft.Column([self.table], scroll=True)
+        """Retorna el control de la tabla (con su paginación) para ser añadido a la página."""
+        return ft.Column([self.paginador.construir(), self.table], scroll=True)
 
 
 
@@ -123,6 +136,7 @@ def formulario_registro(page: ft.Page,tabla_cursos):
     # Campos del formulario
     nombre = ft.TextField(label="Nombre del curso")
     descripcion = ft.TextField(label="Descripción")
+    progreso_carga = ft.ProgressRing(visible=False, width=20, height=20)
     estado_registro = ft.Text(value="", color=ft.Colors.GREEN_600)
 
     # Función para insertar curso
@@ -136,12 +150,15 @@ def formulario_registro(page: ft.Page,tabla_cursos):
         else:
             try:
                 curso = Curso(nombre.value.strip(), descripcion.value.strip())
-                curso.guardar_registro()
+                progreso_carga.visible = True
+                page.update()
+                await Asincrono(curso).guardar_registro() # Se guarda en un hilo, sin bloquear la interfaz
+                progreso_carga.visible = False
                 estado_registro.value = "Curso registrado exitosamente"
                 estado_registro.color = ft.Colors.GREEN
                 page.update()
                 
-                tabla_cursos.actualizar_tabla()
+                tabla_cursos.agregar_fila((curso.id_curso, curso.nombre, curso.descripcion))
 
                 await asyncio.sleep(2)
                 estado_registro.value = ""
@@ -150,6 +167,7 @@ def formulario_registro(page: ft.Page,tabla_cursos):
                 descripcion.value = ""
             except Exception as ex:
                 estado_registro.value = f"Error: {ex}"
+                progreso_carga.visible = False
         page.update()
 
     # Botón de guardar
@@ -177,7 +195,7 @@ def formulario_registro(page: ft.Page,tabla_cursos):
                     ft.Text("Registrar Curso", size=24, weight="bold"),
                     nombre,
                     descripcion,
-                    boton_guardar,
+                    ft.Row([boton_guardar, progreso_carga], alignment=ft.MainAxisAlignment.CENTER),
                     estado_registro,
                 ],
             ),
@@ -190,7 +208,7 @@ def cursos(page: ft.Page):
     # Tabs de la interfaz
     tabla_cursos = TablaCursos(page)
 
-    return ft.Tabs(
+    vista = ft.Tabs(
         selected_index=0,
         animation_duration=300,
         expand=True,
@@ -215,3 +233,6 @@ def cursos(page: ft.Page):
             ),
         ],
     )
+
+    # Al volver a la vista solo se recarga la página visible de la tabla
+    return con_overlay(con_refresco(vista, tabla_cursos.paginador.cargar_async), tabla_cursos.dlg_modal)
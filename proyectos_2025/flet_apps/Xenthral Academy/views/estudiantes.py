@@ -1,5 +1,9 @@
 import flet as ft
 from models.database import Curso,Estudiante
+from models.importacion import importar_estudiantes, COLUMNAS
+from views.paginacion import Paginador, IndiceFilas
+from models.asincrono import Asincrono, ejecutar
+from views.registro_vistas import con_refresco, con_overlay
 import asyncio
 
 class TablaEstudiantes:
@@ -29,56 +33,66 @@ class TablaEstudiantes:
             ],
             border=ft.border.all(1, ft.Colors.GREY),
         )
+        self.id_curso_filtro = None
+        self.indice = IndiceFilas(self.table, self._crear_fila)
+        self.paginador = Paginador(page, Estudiante.obtener_pagina, self._actualizar_filas)
         self.actualizar_tabla() # Carga inicial de la tabla
 
     def cerrar_dialogo(self, e):
         """Cierra el diálogo modal."""
         self.dlg_modal.open = False
-        self.page.update()
+        self.dlg_modal.update()
 
     def actualizar_tabla_id_curso(self, id_curso: int):
-        data = Estudiante.obtener_por_id_curso(id_curso)
-        self._actualizar_filas(data)
+        """Filtra la tabla por curso y vuelve a la primera página."""
+        self.id_curso_filtro = id_curso
+        self.paginador.reiniciar(lambda after_id, limit: Estudiante.obtener_pagina(after_id, limit, id_curso))
 
 
     def actualizar_tabla(self):
-        data = Estudiante.obtener_todos()
-        self._actualizar_filas(data)
+        """Recarga la página actual de la tabla."""
+        self.paginador.cargar()
 
     def _actualizar_filas(self, data):
-        new_rows = []
-        for e in data:
-            new_rows.append(
-                ft.DataRow(
-                    cells=[
-                        ft.DataCell(ft.Text(str(e[0]))),
-                        ft.DataCell(ft.Text(f"{e[1]} {e[2]}")),
-                        ft.DataCell(ft.Text(e[5])),
-                        ft.DataCell(ft.Text(e[3])),
-                        ft.DataCell(
-                            ft.IconButton(
-                                icon=ft.Icons.EDIT,
-                                tooltip="Editar Estudiante",
-                                on_click=lambda ev, id=e[0], nombre=e[1], apellido=e[2], 
-                                fecha_nacimiento=e[3], direccion=e[4], telefono=e[5], 
-                                email=e[6], id_curso=e[7]: self.seleccionar_estudiante(
-                                    ev, id, nombre, apellido, fecha_nacimiento, 
-                                    direccion, telefono, email, id_curso),
-                            )
-                        ),
-                        ft.DataCell(
-                            ft.IconButton(
-                                icon=ft.Icons.DELETE,
-                                tooltip="Eliminar Estudiante",
-                                on_click=lambda ev, id=e[0] : self.eliminar_estudiante(ev, id),
-                            )
-                        )
-                    ]
-                )
-            )
-        self.table.rows = new_rows
+        self.indice.cargar(data)
         self.page.update()
 
+    def _crear_fila(self, e):
+        """Crea la fila de la tabla para un registro."""
+        return ft.DataRow(
+            cells=[
+                ft.DataCell(ft.Text(str(e[0]))),
+                ft.DataCell(ft.Text(f"{e[1]} {e[2]}")),
+                ft.DataCell(ft.Text(e[5])),
+                ft.DataCell(ft.Text(e[3])),
+                ft.DataCell(
+                    ft.IconButton(
+                        icon=ft.Icons.EDIT,
+                        tooltip="Editar Estudiante",
+                        on_click=lambda ev, id=e[0], nombre=e[1], apellido=e[2], 
+                        fecha_nacimiento=e[3], direccion=e[4], telefono=e[5], 
+                        email=e[6], id_curso=e[7]: self.seleccionar_estudiante(
+                            ev, id, nombre, apellido, fecha_nacimiento, 
+                            direccion, telefono, email, id_curso),
+                    )
+                ),
+                ft.DataCell(
+                    ft.IconButton(
+                        icon=ft.Icons.DELETE,
+                        tooltip="Eliminar Estudiante",
+                        on_click=lambda ev, id=e[0] : self.eliminar_estudiante(ev, id),
+                    )
+                )
+            ]
+        )
+
+    def agregar_fila(self, datos):
+        """Muestra un registro recién creado si le corresponde a la página actual."""
+        if self.id_curso_filtro is not None and int(datos[7]) != self.id_curso_filtro:
+            return # El estudiante no pertenece al curso filtrado
+        if self.paginador.admite_nueva_fila(datos[0], len(self.table.rows)):
+            self.indice.agregar(datos)
+
     def actualizar_datos(self,e,id,nombre,apellido,fecha_nacimiento,direccion,telefono,email,id_curso):
         """
         Persiste los datos editados de los estudiantes en la base de datos
@@ -87,7 +101,8 @@ class TablaEstudiantes:
         estudiante = Estudiante(nombre, apellido, id_curso, fecha_nacimiento, direccion, telefono, email, id_estudiante = id)
         estudiante.actualizar_registro()
         self.cerrar_dialogo(e)
-        self.actualizar_tabla()  # Llamada para actualizar la tabla
+        # Solo se redibuja la fila editada
+        self.indice.reemplazar((id, nombre, apellido, fecha_nacimiento, direccion, telefono, email, id_curso))
 
     def eliminar_estudiante(self, e, id):
         """
@@ -95,7 +110,8 @@ class TablaEstudiantes:
 
         """
         Estudiante.eliminar_registro(id)
-        self.actualizar_tabla()  # Llamada para actualizar la tabla
+        self.indice.quitar(id)  # Solo se quita la fila eliminada
+        self.paginador.fila_quitada(len(self.table.rows))
 
     def seleccionar_estudiante(self, e, id,nombre,apellido,fecha_nacimiento,direccion,telefono,email,id_curso):
         """
@@ -205,15 +221,25 @@ class TablaEstudiantes:
         para ser añadido a la página.
 
         Returns:
-            ft.Column: Un control de columna que contiene la tabla de materias.
+            ft.Column: Un control de columna que contiene la paginación y la tabla de estudiantes.
         """
-        return ft.Column([self.table], scroll=True)
+        return ft.Column([self.paginador.construir(), self.table], scroll=True)
 
 #----------------------------------------------------------------------------------------------------------------
 # Módulo para el formulario de registro de materias
 #----------------------------------------------------------------------------------------------------------------
 
-def autocompletado_cursos(tabla_estudiantes: TablaEstudiantes):
+def sugerencias_cursos(cursos):
+    """Sugerencias de los autocompletados de cursos a partir de las filas (id, nombre, descripcion)."""
+    return [
+        ft.AutoCompleteSuggestion(
+            key=f"{id} {nombre}",
+            value=f"{nombre} - {descripcion}"
+        ) for id, nombre, descripcion in cursos
+    ]
+
+
+def autocompletado_cursos(tabla_estudiantes: TablaEstudiantes, cursos, autocompletados: list):
     def actualizar_curso(e):
         try:
             id_curso = int(e.selection.key.split()[0])
@@ -221,19 +247,14 @@ def autocompletado_cursos(tabla_estudiantes: TablaEstudiantes):
         except (IndexError, ValueError):
             pass
 
-    def obtener_sugerencias():
-        return [
-            ft.AutoCompleteSuggestion(
-                key=f"{id} {nombre}",
-                value=f"{nombre} - {descripcion}"
-            ) for id, nombre, descripcion in Curso.obtener_todos()
-        ]
+    auto_complete = ft.AutoComplete(
+        suggestions=sugerencias_cursos(cursos),
+        on_select=actualizar_curso
+    )
+    autocompletados.append(auto_complete)
 
     return ft.Container(
-        content=ft.AutoComplete(
-            suggestions=obtener_sugerencias(),
-            on_select=actualizar_curso
-        ),
+        content=auto_complete,
         width=400,
         border=ft.border.all(1, ft.Colors.GREY),
         border_radius=ft.border_radius.all(5),
@@ -241,7 +262,7 @@ def autocompletado_cursos(tabla_estudiantes: TablaEstudiantes):
     )
 
 
-def formulario_registro(page: ft.Page, tabla_materias: TablaEstudiantes):
+def formulario_registro(page: ft.Page, tabla_materias: TablaEstudiantes, cursos, autocompletados: list):
 
     """
     Crea y devuelve el formulario para registrar nuevos estudiantes.
@@ -250,6 +271,8 @@ def formulario_registro(page: ft.Page, tabla_materias: TablaEstudiantes):
         page (ft.Page): La página de Flet en la que se mostrará el formulario.
         tabla_materias (TablaMaterias): Una instancia de la clase TablaMaterias
                                        para poder actualizar la tabla después del registro.
+        cursos: Filas (id, nombre, descripcion) de los cursos para el autocompletado.
+        autocompletados (list): Lista donde se registra el autocompletado de cursos para refrescarlo.
 
     Returns:
         ft.Row: Una fila que contiene el formulario de registro centrado.
@@ -272,20 +295,11 @@ def formulario_registro(page: ft.Page, tabla_materias: TablaEstudiantes):
 
 
     #Apartado del Input con sugerencias curso
-    def refrescar_datos_curso():
-        return Curso.obtener_todos()
-
-    def obtener_sugenerencias_curso():
-        items = []
-        refrescar_datos_curso()
-        for id, nombre, descripcion in refrescar_datos_curso():
-            items.append(ft.AutoCompleteSuggestion(key=f"{id} {nombre}", value=f"{nombre} - {descripcion}"))
-        return items
-
     auto_complete = ft.AutoComplete(
-                suggestions=obtener_sugenerencias_curso(),
+                suggestions=sugerencias_cursos(cursos),
                 on_select=lambda e: actualizar_id_curso(e.selection),
             )
+    autocompletados.append(auto_complete)
     curso = ft.Container(
         content=auto_complete,
         expand=1,
@@ -301,6 +315,7 @@ def formulario_registro(page: ft.Page, tabla_materias: TablaEstudiantes):
 
     
 
+    progreso_carga = ft.ProgressRing(visible=False, width=20, height=20)
     estado_registro = ft.Text(value="", color=ft.Colors.GREEN_600)
 
     
@@ -332,8 +347,15 @@ def formulario_registro(page: ft.Page, tabla_materias: TablaEstudiantes):
                         fecha_nacimiento = None
 
                     nuevo_estudiante = Estudiante(nombre.value, apellido.value, id_curso, fecha_nacimiento, direccion.value, telefono.value, email.value)
-                    nuevo_estudiante.guardar_registro()
-                    tabla_materias.actualizar_tabla()
+                    progreso_carga.visible = True
+                    page.update()
+                    await Asincrono(nuevo_estudiante).guardar_registro() # Se guarda en un hilo, sin bloquear la interfaz
+                    progreso_carga.visible = False
+                    tabla_materias.agregar_fila((
+                        nuevo_estudiante.id_estudiante, nuevo_estudiante.nombre, nuevo_estudiante.apellido,
+                        nuevo_estudiante.fecha_nacimiento, nuevo_estudiante.direccion, nuevo_estudiante.telefono,
+                        nuevo_estudiante.email, nuevo_estudiante.id_curso,
+                    ))
                     estado_registro.value = "Estudiante registrado exitosamente"
                     estado_registro.color = ft.Colors.GREEN
                     page.update()
@@ -359,6 +381,7 @@ def formulario_registro(page: ft.Page, tabla_materias: TablaEstudiantes):
 
                 except Exception as ex:
                     estado_registro.value = f"Error: {ex}"
+                    progreso_carga.visible = False
 
         page.update()
 
@@ -390,7 +413,7 @@ def formulario_registro(page: ft.Page, tabla_materias: TablaEstudiantes):
                     ft.Container(content=ft.Row([curso,email])),
                     ft.Text("Fecha de nacimiento:"),
                     ft.Container(content=ft.Row([año,mes,dia]),width=300),
-                    boton_guardar,
+                    ft.Row([boton_guardar, progreso_carga], alignment=ft.MainAxisAlignment.CENTER),
                     estado_registro,
                     
                 ],
@@ -402,6 +425,111 @@ def formulario_registro(page: ft.Page, tabla_materias: TablaEstudiantes):
 
 
 
+def formulario_importacion(page: ft.Page, tabla_estudiantes: TablaEstudiantes):
+    """
+    Crea la tarjeta para importar muchos estudiantes desde un archivo CSV o Excel (.xlsx).
+
+    Args:
+        page (ft.Page): La página de Flet.
+        tabla_estudiantes (TablaEstudiantes): La tabla que se recarga al terminar la importación.
+
+    Returns:
+        ft.Row: Una fila con la tarjeta de importación centrada.
+    """
+    estado_importacion = ft.Text(value="")
+    barra_progreso = ft.ProgressBar(visible=False, width=400)
+    lista_errores = ft.Column(spacing=2)
+
+    def progreso(leidas, insertados, rechazados):
+        # Se llama desde el hilo de la importación después de cada lote
+        estado_importacion.value = f"Leídas {leidas} filas: {insertados} importadas, {rechazados} con errores..."
+        page.update()
+
+    async def importar(ruta):
+        boton_importar.disabled = True
+        barra_progreso.visible = True
+        lista_errores.controls.clear()
+        estado_importacion.value = "Importando..."
+        estado_importacion.color = None
+        page.update()
+        try:
+            resultado = await ejecutar(importar_estudiantes, ruta, progreso=progreso)
+            if resultado is None:
+                estado_importacion.value = "No se pudo conectar a la base de datos o leer los cursos."
+                estado_importacion.color = ft.Colors.RED
+            else:
+                estado_importacion.value = (
+                    f"{resultado['insertados']} de {resultado['leidas']} estudiantes importados, "
+                    f"{resultado['rechazados']} con errores."
+                )
+                estado_importacion.color = ft.Colors.GREEN if not resultado["rechazados"] else ft.Colors.ORANGE
+                for fila, motivo in resultado["errores"]:
+                    lista_errores.controls.append(ft.Text(f"Fila {fila}: {motivo}", size=12, color=ft.Colors.RED))
+                if resultado["reporte"]:
+                    lista_errores.controls.append(ft.Text(f"Reporte completo de errores: {resultado['reporte']}", size=12, italic=True))
+                await tabla_estudiantes.paginador.cargar_async()
+        except Exception as ex:
+            estado_importacion.value = f"Error: {ex}"
+            estado_importacion.color = ft.Colors.RED
+        finally:
+            boton_importar.disabled = False
+            barra_progreso.visible = False
+            page.update()
+
+    def archivo_elegido(e: ft.FilePickerResultEvent):
+        if not e.files:
+            return
+        if not e.files[0].path:
+            estado_importacion.value = "La importación necesita acceso al archivo (versión de escritorio)."
+            estado_importacion.color = ft.Colors.RED
+            page.update()
+            return
+        page.run_task(importar, e.files[0].path)
+
+    selector_archivo = ft.FilePicker(on_result=archivo_elegido)
+    if selector_archivo not in page.overlay:
+        page.overlay.append(selector_archivo)
+
+    boton_importar = ft.ElevatedButton(
+        text="Elegir archivo",
+        icon=ft.Icons.UPLOAD_FILE,
+        style=ft.ButtonStyle(shape=ft.RoundedRectangleBorder(radius=8)),
+        on_click=lambda e: selector_archivo.pick_files(
+            dialog_title="Importar estudiantes", allowed_extensions=["csv", "xlsx"], allow_multiple=False
+        ),
+    )
+
+    formulario = ft.Card(
+        elevation=8,
+        shape=ft.RoundedRectangleBorder(radius=16),
+        content=ft.Container(
+            width=800,
+            padding=ft.padding.all(24),
+            bgcolor=ft.Colors.WHITE,
+            content=ft.Column(
+                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                spacing=20,
+                controls=[
+                    ft.Text("Importar Estudiantes", size=24, weight="bold"),
+                    ft.Text(
+                        f"Archivo CSV o Excel (.xlsx) con encabezado. Columnas: {', '.join(COLUMNAS)} "
+                        "(nombre, apellido e id_curso son obligatorias). Las filas con errores no se importan "
+                        "y se guardan en un reporte junto al archivo.",
+                        color=ft.Colors.GREY_700,
+                    ),
+                    boton_importar,
+                    barra_progreso,
+                    estado_importacion,
+                    lista_errores,
+                ],
+            ),
+        ),
+    )
+
+    return con_overlay(ft.Row(controls=[formulario], alignment=ft.MainAxisAlignment.CENTER), selector_archivo)
+
+
+
 def estudiantes(page: ft.Page):
     """
     Función principal para la gestión de materias, mostrando pestañas
@@ -414,12 +542,13 @@ def estudiantes(page: ft.Page):
     tabla_estudiantes = TablaEstudiantes(page)
 
 
-    #Autocpmpletado
+    #Autocpmpletado: una sola consulta de cursos para el filtro y el formulario
+    cursos = Curso.obtener_todos()
+    autocompletados = []
+    auto2 = ft.Container(content=autocompletado_cursos(tabla_estudiantes, cursos, autocompletados),width=300)
+    importacion = formulario_importacion(page, tabla_estudiantes)
 
-    auto = ft.Row([ft.Text("Seleccionar curso: "),autocompletado_cursos(tabla_estudiantes)])
-    auto2 = ft.Container(content=autocompletado_cursos(tabla_estudiantes),width=300)
-
-    return ft.Tabs(
+    vista = ft.Tabs(
         selected_index=0,
         animation_duration=300,
         expand=True,
@@ -428,7 +557,16 @@ def estudiantes(page: ft.Page):
                 text="Registrar",
                 icon=ft.Icons.NOTE_ADD,
                 content=ft.Container(
-                    content=formulario_registro(page, tabla_estudiantes),
+                    content=formulario_registro(page, tabla_estudiantes, cursos, autocompletados),
+                    alignment=ft.alignment.center,
+                    padding=30,
+                ),
+            ),
+            ft.Tab(
+                text="Importar",
+                icon=ft.Icons.UPLOAD_FILE,
+                content=ft.Container(
+                    content=importacion,
                     alignment=ft.alignment.center,
                     padding=30,
                 ),
@@ -448,5 +586,15 @@ def estudiantes(page: ft.Page):
         ],
     )
 
+    async def refrescar():
+        """Al volver a la vista: recarga la página de la tabla y los cursos (pudieron cambiar en la vista Cursos)."""
+        await tabla_estudiantes.paginador.cargar_async()
+        cursos = await ejecutar(Curso.obtener_todos)
+        for auto_complete in autocompletados:
+            auto_complete.suggestions = sugerencias_cursos(cursos)
+        page.update()
+
+    return con_overlay(con_refresco(vista, refrescar), tabla_estudiantes.dlg_modal, *importacion.data["overlay"])
+
 
 
@@ -1,5 +1,5 @@
 import flet as ft
-from models.database import resource_path
+from models.recursos import resource_path
 
 
 def inicio():
@@ -1,5 +1,8 @@
 import flet as ft
 from models.database import Materia
+from views.paginacion import Paginador, IndiceFilas
+from models.asincrono import Asincrono
+from views.registro_vistas import con_refresco, con_overlay
 import asyncio
 
 class TablaMaterias:
@@ -28,49 +31,53 @@ class TablaMaterias:
             ],
             border=ft.border.all(1, ft.Colors.GREY),
         )
+        self.indice = IndiceFilas(self.table, self._crear_fila)
+        self.paginador = Paginador(page, Materia.obtener_pagina, self._actualizar_filas)
         self.actualizar_tabla() # Carga inicial de la tabla
 
     def cerrar_dialogo(self, e):
         """Cierra el diálogo modal."""
         self.dlg_modal.open = False
-        self.page.update()
+        self.dlg_modal.update()
 
     def actualizar_tabla(self):
         """
-        Recarga los datos de la base de datos y actualiza la tabla de materias.
+        Recarga la página actual desde la base de datos y actualiza la tabla de materias.
 
         Este método puede ser llamado desde otros módulos para reflejar
         los cambios en la base de datos en la interfaz de usuario.
         """
-        data = Materia.obtener_todos()
-        new_rows = []
-        for materia_id, nombre, descripcion in data:
-            new_rows.append(
-                ft.DataRow(
-                    cells=[
-                        ft.DataCell(ft.Text(str(materia_id))),
-                        ft.DataCell(ft.Text(nombre)),
-                        ft.DataCell(ft.Text(descripcion)),
-                        ft.DataCell(
-                            ft.IconButton(
-                                icon=ft.Icons.EDIT,
-                                tooltip="Editar Materia",
-                                on_click=lambda ev, mid=materia_id, nom=nombre, desc=descripcion: self.seleccionar_materia(ev, mid, nom, desc),
-                            )
-                        ),
-                        ft.DataCell(
-                            ft.IconButton(
-                                icon=ft.Icons.DELETE,
-                                tooltip="Eliminar Materia",
-                                on_click=lambda ev, mid=materia_id, nom=nombre, desc=descripcion: self.eliminar_materia(ev, mid, nom, desc),
-                            )
-                        )
-                    ]
-                )
-            )
-        self.table.rows = new_rows
+        self.paginador.cargar()
+
+    def _actualizar_filas(self, data):
+        self.indice.cargar(data)
         self.page.update()
 
+    def _crear_fila(self, datos):
+        """Crea la fila de la tabla para un registro."""
+        materia_id, nombre, descripcion = datos
+        return ft.DataRow(
+            cells=[
+                ft.DataCell(ft.Text(str(materia_id))),
+                ft.DataCell(ft.Text(nombre)),
+                ft.DataCell(ft.Text(descripcion)),
+                ft.DataCell(
+                    ft.IconButton(
+                        icon=ft.Icons.EDIT,
+                        tooltip="Editar Materia",
+                        on_click=lambda ev, mid=materia_id, nom=nombre, desc=descripcion: self.seleccionar_materia(ev, mid, nom, desc),
+                    )
+                ),
+                ft.DataCell(
+                    ft.IconButton(
+                        icon=ft.Icons.DELETE,
+                        tooltip="Eliminar Materia",
+                        on_click=lambda ev, mid=materia_id, nom=nombre, desc=descripcion: self.eliminar_materia(ev, mid, nom, desc),
+                    )
+                )
+            ]
+        )
+
     def actualizar_datos(self, e, materia_id: int, nombre: str, descripcion: str):
         """
         Persiste los datos editados de la materia en la base de datos
@@ -85,7 +92,7 @@ class TablaMaterias:
         materia = Materia(nombre=nombre, descripcion=descripcion, id_materia=materia_id)
         materia.actualizar_registro()
         self.cerrar_dialogo(e)
-        self.actualizar_tabla()  # Llamada para actualizar la tabla
+        self.indice.reemplazar((materia_id, nombre, descripcion))  # Solo se redibuja la fila editada
 
     def eliminar_materia(self, e, materia_id: int, nombre: str, descripcion: str):
         """
@@ -99,7 +106,13 @@ class TablaMaterias:
         """
         materia = Materia(nombre=nombre,descripcion=descripcion,id_materia=materia_id)
         materia.eliminar_registro()
-        self.actualizar_tabla()  # Llamada para actualizar la tabla
+        self.indice.quitar(materia_id)  # Solo se quita la fila eliminada
+        self.paginador.fila_quitada(len(self.table.rows))
+
+    def agregar_fila(self, datos):
+        """Muestra un registro recién creado si le corresponde a la página actual."""
+        if self.paginador.admite_nueva_fila(datos[0], len(self.table.rows)):
+            self.indice.agregar(datos)
 
     def seleccionar_materia(self, e, materia_id: int, materia_nombre: str, materia_descripcion: str):
         """
@@ -145,9 +158,9 @@ class TablaMaterias:
         para ser añadido a la página.
 
         Returns:
-            ft.Column: Un control de columna que contiene la tabla de materias.
+            ft.Column: Un control de columna que contiene la paginación y la tabla de materias.
         """
-        return ft.Column([self.table], scroll=True)
+        return ft.Column([self.paginador.construir(), self.table], scroll=True)
 
 #----------------------------------------------------------------------------------------------------------------
 # Módulo para el formulario de registro de materias
@@ -168,6 +181,7 @@ def formulario_registro(page: ft.Page, tabla_materias: TablaMaterias):
     # Campos del formulario
     nombre = ft.TextField(label="Nombre de la Materia")
     descripcion = ft.TextField(label="Descripción")
+    progreso_carga = ft.ProgressRing(visible=False, width=20, height=20)
     estado_registro = ft.Text(value="", color=ft.Colors.GREEN_600)
 
     # Función para insertar materia
@@ -182,12 +196,15 @@ def formulario_registro(page: ft.Page, tabla_materias: TablaMaterias):
         else:
             try:
                 materia = Materia(nombre.value.strip(), descripcion.value.strip())
-                materia.guardar_registro()
+                progreso_carga.visible = True
+                page.update()
+                await Asincrono(materia).guardar_registro() # Se guarda en un hilo, sin bloquear la interfaz
+                progreso_carga.visible = False
                 estado_registro.value = "Materia registrada exitosamente"
                 estado_registro.color = ft.Colors.GREEN
                 page.update()
 
-                tabla_materias.actualizar_tabla() # Actualiza la tabla después de guardar
+                tabla_materias.agregar_fila((materia.id_materia, materia.nombre, materia.descripcion)) # Agrega la fila sin recargar la tabla
 
                 await asyncio.sleep(2)
                 estado_registro.value = ""
@@ -196,6 +213,7 @@ def formulario_registro(page: ft.Page, tabla_materias: TablaMaterias):
                 descripcion.value = ""
             except Exception as ex:
                 estado_registro.value = f"Error: {ex}"
+                progreso_carga.visible = False
         page.update()
 
     # Botón de guardar
@@ -223,7 +241,7 @@ def formulario_registro(page: ft.Page, tabla_materias: TablaMaterias):
                     ft.Text("Registrar Materia", size=24, weight="bold"),
                     nombre,
                     descripcion,
-                    boton_guardar,
+                    ft.Row([boton_guardar, progreso_carga], alignment=ft.MainAxisAlignment.CENTER),
                     estado_registro,
                 ],
             ),
@@ -243,7 +261,7 @@ def materias(page: ft.Page):
     # Instancia de la tabla de materias
     tabla_materias = TablaMaterias(page)
 
-    return ft.Tabs(
+    vista = ft.Tabs(
         selected_index=0,
         animation_duration=300,
         expand=True,
@@ -269,3 +287,6 @@ def materias(page: ft.Page):
         ],
     )
 
+    # Al volver a la vista solo se recarga la página visible de la tabla
+    return con_overlay(con_refresco(vista, tabla_materias.paginador.cargar_async), tabla_materias.dlg_modal)
+
@@ -1,6 +1,9 @@
 import flet as ft
 from datetime import date
-from models.database import Nota, Estudiante, Materia # Asegúrate que Estudiante y Materia estén aquí
+from models.database import Nota, Estudiante, Materia, Curso # Asegúrate que Estudiante y Materia estén aquí
+from models.asincrono import Asincrono, ejecutar
+from views.busqueda_diferida import BusquedaDiferida
+from views.registro_vistas import con_refresco
 
 def notas_view(page: ft.Page):
     """
@@ -10,28 +13,31 @@ def notas_view(page: ft.Page):
     error_text = ft.Text(value="", color=ft.Colors.RED)
 
     # --- Función para actualizar el display de nombres ---
-    def actualizar_display_nombre(id_field, nombre_display_control, funcion_obtener_nombre, entidad_nombre="Entidad"):
+    def mostrar_nombre(nombre_display_control, nombre, entidad_nombre):
+        if nombre:
+            nombre_display_control.value = str(nombre)
+            nombre_display_control.color = ft.Colors.BLUE_ACCENT_700
+        else:
+            nombre_display_control.value = f"⚠️ {entidad_nombre} ID no encontrado"
+            nombre_display_control.color = ft.Colors.ORANGE_ACCENT_700
+
+    def actualizar_display_nombre(id_field, nombre_display_control, busqueda, entidad_nombre="Entidad", inmediata=False):
         # Esta función ya no llama a page.update() directamente.
         # La llamada a page.update() se hará desde el manejador de evento que la invoca.
+        # El nombre se busca en segundo plano cuando el usuario deja de escribir (ver BusquedaDiferida);
+        # mientras tanto el display queda vacío.
         try:
             if id_field.value.strip():
                 item_id = int(id_field.value)
-                nombre = funcion_obtener_nombre(item_id)
-                if nombre:
-                    nombre_display_control.value = str(nombre)
-                    nombre_display_control.color = ft.Colors.BLUE_ACCENT_700
-                else:
-                    nombre_display_control.value = f"⚠️ {entidad_nombre} ID no encontrado"
-                    nombre_display_control.color = ft.Colors.ORANGE_ACCENT_700
+                nombre_display_control.value = ""
+                busqueda.programar(item_id, inmediata=inmediata)
             else:
+                busqueda.cancelar()
                 nombre_display_control.value = ""
         except ValueError:
+            busqueda.cancelar()
             nombre_display_control.value = f"⚠️ ID de {entidad_nombre} inválido"
             nombre_display_control.color = ft.Colors.RED_ACCENT_700
-        except Exception as ex:
-            print(f"Error al obtener nombre de {entidad_nombre}: {ex}")
-            nombre_display_control.value = f"⚠️ Error al buscar {entidad_nombre}"
-            nombre_display_control.color = ft.Colors.RED_ACCENT_700
 
     # --- Botones de acción ---
     btn_registrar = ft.ElevatedButton(text="Registrar", icon=ft.Icons.ADD_CIRCLE_OUTLINE, disabled=True) # Inicia deshabilitado
@@ -71,15 +77,26 @@ def notas_view(page: ft.Page):
     nota_field = ft.TextField(label="Nota", width=100)
     fecha_field = ft.TextField(label="Fecha (YYYY-MM-DD)", width=150, value=date.today().isoformat())
 
+    # --- Búsquedas de nombres (con espera y en segundo plano) ---
+    def mostrar_estudiante(_, nombre):
+        mostrar_nombre(estudiante_nombre_display, nombre, "Estudiante")
+
+    def mostrar_materia(_, nombre):
+        mostrar_nombre(materia_nombre_display, nombre, "Materia")
+        actualizar_estado_boton_registrar()
+
+    busqueda_estudiante = BusquedaDiferida(page, Estudiante.obtener_nombre_completo, mostrar_estudiante)
+    busqueda_materia = BusquedaDiferida(page, Materia.obtener_nombre_materia, mostrar_materia)
+
     # --- Manejadores de eventos on_change para campos de ID ---
     def on_id_est_change(e):
-        actualizar_display_nombre(id_est_field, estudiante_nombre_display, Estudiante.obtener_nombre_completo, "Estudiante")
+        actualizar_display_nombre(id_est_field, estudiante_nombre_display, busqueda_estudiante, "Estudiante")
         # Opcional: Si la validez del estudiante también debe afectar btn_registrar, llamar aquí:
         # actualizar_estado_boton_registrar() 
         page.update()
 
     def on_id_mat_change(e):
-        actualizar_display_nombre(id_mat_field, materia_nombre_display, Materia.obtener_nombre_materia, "Materia")
+        actualizar_display_nombre(id_mat_field, materia_nombre_display, busqueda_materia, "Materia")
         actualizar_estado_boton_registrar() # Actualiza el estado del botón registrar
         page.update()
 
@@ -95,6 +112,18 @@ def notas_view(page: ft.Page):
         column_spacing=20,
     )
     
+    # --- Indicador de carga ---
+    progreso_carga = ft.ProgressRing(visible=False, width=20, height=20)
+
+    async def en_segundo_plano(funcion, *args):
+        """Ejecuta una operación de la base de datos en el pool de hilos mostrando el indicador de carga."""
+        progreso_carga.visible = True
+        page.update()
+        try:
+            return await ejecutar(funcion, *args)
+        finally:
+            progreso_carga.visible = False
+
     # --- Funciones CRUD y auxiliares (modificadas para llamar a actualizar_estado_boton_registrar donde sea pertinente) ---
     def limpiar_campos_entrada(reset_id_nota=True):
         if reset_id_nota:
@@ -103,6 +132,7 @@ def notas_view(page: ft.Page):
         # id_est_field.value = ""
         # estudiante_nombre_display.value = ""
         id_mat_field.value = ""
+        busqueda_materia.cancelar()
         materia_nombre_display.value = "" # Limpiar también el display
         nota_field.value = ""
         fecha_field.value = date.today().isoformat()
@@ -119,8 +149,8 @@ def notas_view(page: ft.Page):
         nota_field.value = str(datos_fila[3])
         fecha_field.value = str(datos_fila[4])
         
-        actualizar_display_nombre(id_est_field, estudiante_nombre_display, Estudiante.obtener_nombre_completo, "Estudiante")
-        actualizar_display_nombre(id_mat_field, materia_nombre_display, Materia.obtener_nombre_materia, "Materia")
+        actualizar_display_nombre(id_est_field, estudiante_nombre_display, busqueda_estudiante, "Estudiante", inmediata=True)
+        actualizar_display_nombre(id_mat_field, materia_nombre_display, busqueda_materia, "Materia", inmediata=True)
         actualizar_estado_boton_registrar() # Actualizar estado del botón después de poblar campos
         
         id_nota_field.disabled = False 
@@ -130,7 +160,7 @@ def notas_view(page: ft.Page):
     #    asegurándose que llamar a limpiar_campos_entrada o actualizar_estado_boton_registrar donde sea necesario)
 
     # Modificación en registrar_nota para que llame a limpiar_campos_entrada
-    def registrar_nota(_):
+    async def registrar_nota(_):
         try:
             error_text.value = ""
             if not all([id_est_field.value, id_mat_field.value, nota_field.value, fecha_field.value]):
@@ -141,18 +171,18 @@ def notas_view(page: ft.Page):
             id_est = int(id_est_field.value)
             id_mat = int(id_mat_field.value)
             val_nota = float(nota_field.value)
-            if not (0 <= val_nota <= 5):
-                 error_text.value = "La nota debe estar entre 0 y 5."
+            if not (Nota.MINIMA <= val_nota <= Nota.MAXIMA):
+                 error_text.value = f"La nota debe estar entre {Nota.MINIMA} y {Nota.MAXIMA}."
                  page.update()
                  return
 
             fecha = fecha_field.value
             
-            Nota.registrar_nota(id_est, id_mat, val_nota, fecha)
+            await en_segundo_plano(Nota.registrar_nota, id_est, id_mat, val_nota, fecha)
             error_text.value = "Nota registrada exitosamente."
             error_text.color = ft.Colors.GREEN_ACCENT_700
             limpiar_campos_entrada(reset_id_nota=True) # Esto ya llama a actualizar_estado_boton_registrar
-            listar_notas(None)
+            await listar_notas(None)
             id_nota_field.disabled = True
 
         except ValueError as ve:
@@ -165,7 +195,7 @@ def notas_view(page: ft.Page):
             page.update()
             
     # Similarmente, asegurar que actualizar_nota y eliminar_nota llamen a limpiar_campos_entrada
-    def actualizar_nota(_):
+    async def actualizar_nota(_):
         try:
             error_text.value = ""
             if not id_nota_field.value or not nota_field.value:
@@ -175,16 +205,16 @@ def notas_view(page: ft.Page):
 
             id_nota = int(id_nota_field.value)
             nuevo_valor_nota = float(nota_field.value)
-            if not (0 <= nuevo_valor_nota <= 5):
-                 error_text.value = "La nota debe estar entre 0 y 5."
+            if not (Nota.MINIMA <= nuevo_valor_nota <= Nota.MAXIMA):
+                 error_text.value = f"La nota debe estar entre {Nota.MINIMA} y {Nota.MAXIMA}."
                  page.update()
                  return
             
-            Nota.actualizar_nota(id_nota, nuevo_valor_nota)
+            await en_segundo_plano(Nota.actualizar_nota, id_nota, nuevo_valor_nota)
             error_text.value = "Nota actualizada exitosamente."
             error_text.color = ft.Colors.GREEN_ACCENT_700
             limpiar_campos_entrada(reset_id_nota=True) # Llama a actualizar_estado_boton_registrar
-            listar_notas(None)
+            await listar_notas(None)
             id_nota_field.disabled = True
 
         except ValueError as ve:
@@ -196,7 +226,7 @@ def notas_view(page: ft.Page):
             error_text.color = ft.Colors.RED_ACCENT_700
             page.update()
 
-    def eliminar_nota(_):
+    async def eliminar_nota(_):
         try:
             error_text.value = ""
             if not id_nota_field.value:
@@ -205,11 +235,11 @@ def notas_view(page: ft.Page):
                 return
 
             id_nota = int(id_nota_field.value)
-            Nota.eliminar_nota(id_nota)
+            await en_segundo_plano(Nota.eliminar_nota, id_nota)
             error_text.value = "Nota eliminada exitosamente."
             error_text.color = ft.Colors.GREEN_ACCENT_700
             limpiar_campos_entrada(reset_id_nota=True) # Llama a actualizar_estado_boton_registrar
-            listar_notas(None)
+            await listar_notas(None)
             id_nota_field.disabled = True
 
         except ValueError as ve:
@@ -221,7 +251,7 @@ def notas_view(page: ft.Page):
             error_text.color = ft.Colors.RED_ACCENT_700
             page.update()
             
-    def listar_notas(_): # Copiada de la respuesta anterior, con mejoras
+    async def listar_notas(_): # Copiada de la respuesta anterior, con mejoras
         try:
             if not id_est_field.value or not id_est_field.value.strip().isdigit():
                 error_text.value = "Por favor, ingrese un ID de Estudiante válido para listar."
@@ -233,7 +263,7 @@ def notas_view(page: ft.Page):
                 return
             
             est_id = int(id_est_field.value)
-            data = Nota.obtener_notas_por_estudiante(est_id) 
+            data = await en_segundo_plano(Nota.obtener_notas_por_estudiante, est_id)
             
             table.columns.clear() 
             table.rows.clear()
@@ -255,7 +285,7 @@ def notas_view(page: ft.Page):
                     ft.DataColumn(ft.Text("Acciones")), 
                 ]
                 for r in data: 
-                    nombre_materia = Materia.obtener_nombre_materia(r[2]) or f"ID Mat: {r[2]}"
+                    nombre_materia = r[5] or f"ID Mat: {r[2]}"
                     def crear_handler_seleccionar_para_editar(datos_fila_capturada):
                         return lambda e: poblar_campos_desde_fila(datos_fila_capturada)
                     table.rows.append(
@@ -294,16 +324,186 @@ def notas_view(page: ft.Page):
         wrap=False, spacing=15, alignment=ft.MainAxisAlignment.START, vertical_alignment=ft.CrossAxisAlignment.START
     )
     action_buttons_row = ft.Row(
-        [btn_registrar, btn_listar, btn_actualizar, btn_eliminar],
+        [btn_registrar, btn_listar, btn_actualizar, btn_eliminar, progreso_carga],
         spacing=10, alignment=ft.MainAxisAlignment.START
     )
+    planilla = planilla_notas(page)
     container = ft.Column(
         [input_fields_row, action_buttons_row, error_text, ft.Divider(),
-         ft.Text("Notas Registradas:", weight=ft.FontWeight.BOLD), table],
+         ft.Text("Notas Registradas:", weight=ft.FontWeight.BOLD), table,
+         ft.Divider(), planilla],
         expand=True, spacing=15, scroll=ft.ScrollMode.ADAPTIVE
     )
 
     # Establecer estado inicial del botón registrar al cargar la vista
     actualizar_estado_boton_registrar()
 
-    return container
+    # Al volver a la vista se recargan los cursos y materias de la planilla
+    return con_refresco(container, planilla.data["refrescar"])
+
+
+def planilla_notas(page: ft.Page):
+    """
+    Planilla para calificar a todo un curso en una materia y fecha: los estudiantes se cargan
+    en una consulta, las notas se escriben en la tabla y se guardan todas juntas en una transacción.
+    Si el estudiante ya tiene nota en esa materia y fecha, se muestra y se puede corregir.
+
+    Args:
+        page (ft.Page): La página de Flet.
+
+    Returns:
+        ft.Column: La sección de la planilla, con su función de refresco (ver `con_refresco`).
+    """
+    def opciones(registros):
+        return [ft.dropdown.Option(str(registro[0]), registro[1]) for registro in registros or []]
+
+    curso_dropdown = ft.Dropdown(label="Curso", width=220, options=opciones(Curso.obtener_todos()))
+    materia_dropdown = ft.Dropdown(label="Materia", width=220, options=opciones(Materia.obtener_todos()))
+    fecha_planilla = ft.TextField(label="Fecha (YYYY-MM-DD)", width=150, value=date.today().isoformat())
+    btn_cargar = ft.ElevatedButton(text="Cargar planilla", icon=ft.Icons.GRID_ON)
+    btn_guardar = ft.ElevatedButton(text="Guardar planilla", icon=ft.Icons.SAVE, disabled=True)
+    progreso = ft.ProgressRing(visible=False, width=20, height=20)
+    mensaje = ft.Text(value="")
+    tabla = ft.DataTable(
+        columns=[
+            ft.DataColumn(ft.Text("ID")),
+            ft.DataColumn(ft.Text("Estudiante")),
+            ft.DataColumn(ft.Text(f"Nota ({Nota.MINIMA}-{Nota.MAXIMA})")),
+        ],
+        rows=[],
+        visible=False,
+    )
+    # Planilla cargada: (id_estudiante, id_nota, nota_original, campo) por fila, y su materia y fecha
+    filas = []
+    cargada = {"id_materia": None, "fecha": None}
+
+    def mostrar_mensaje(texto, color):
+        mensaje.value = texto
+        mensaje.color = color
+
+    async def cargar(_):
+        if not curso_dropdown.value or not materia_dropdown.value:
+            mostrar_mensaje("Seleccione el curso y la materia.", ft.Colors.RED_ACCENT_700)
+            page.update()
+            return
+        try:
+            fecha = date.fromisoformat(fecha_planilla.value.strip())
+        except ValueError:
+            mostrar_mensaje("Formato de fecha inválido. Use YYYY-MM-DD", ft.Colors.RED_ACCENT_700)
+            page.update()
+            return
+
+        progreso.visible = True
+        btn_cargar.disabled = True
+        page.update()
+        try:
+            id_materia = int(materia_dropdown.value)
+            data = await ejecutar(Nota.obtener_planilla, int(curso_dropdown.value), id_materia, fecha)
+            if data is None:
+                raise Exception("No se pudo consultar la planilla.")
+            filas.clear()
+            tabla.rows.clear()
+            for id_est, nombre, apellido, id_nota, nota in data:
+                campo = ft.TextField(value="" if nota is None else str(nota), width=90, dense=True)
+                filas.append((id_est, id_nota, nota, campo))
+                tabla.rows.append(ft.DataRow(cells=[
+                    ft.DataCell(ft.Text(str(id_est))),
+                    ft.DataCell(ft.Text(f"{apellido} {nombre}")),
+                    ft.DataCell(campo),
+                ]))
+            cargada["id_materia"], cargada["fecha"] = id_materia, fecha
+            tabla.visible = bool(filas)
+            btn_guardar.disabled = not filas
+            mostrar_mensaje(
+                f"{len(filas)} estudiantes." if filas else "El curso no tiene estudiantes.",
+                ft.Colors.BLUE_700,
+            )
+        except Exception as ex:
+            mostrar_mensaje(f"Error al cargar la planilla: {ex}", ft.Colors.RED_ACCENT_700)
+        finally:
+            progreso.visible = False
+            btn_cargar.disabled = False
+            page.update()
+
+    async def guardar(_):
+        # Validación de toda la planilla antes de escribir: si una nota es inválida no se guarda ninguna
+        valores, errores = Nota.validar_notas([campo.value for _, _, _, campo in filas])
+        for posicion, (_, _, _, campo) in enumerate(filas):
+            campo.error_text = errores.get(posicion)
+        if errores:
+            mostrar_mensaje(f"Corrija {len(errores)} nota(s) marcadas en rojo.", ft.Colors.RED_ACCENT_700)
+            page.update()
+            return
+
+        # Solo las notas escritas que son nuevas o cambiaron
+        lote = [
+            (id_est, nota, id_nota)
+            for (id_est, id_nota, original, _), nota in zip(filas, valores)
+            if nota is not None and (original is None or float(original) != nota)
+        ]
+        if not lote:
+            mostrar_mensaje("No hay notas nuevas ni cambios para guardar.", ft.Colors.BLUE_700)
+            page.update()
+            return
+
+        progreso.visible = True
+        btn_guardar.disabled = True
+        page.update()
+        try:
+            resultado = await ejecutar(Nota.registrar_lote, cargada["id_materia"], cargada["fecha"], lote)
+            if resultado is None:
+                mostrar_mensaje("No se pudo guardar la planilla; no se registró ninguna nota.", ft.Colors.RED_ACCENT_700)
+                return
+            insertadas, actualizadas = resultado
+            mostrar_mensaje(f"{insertadas} notas registradas y {actualizadas} actualizadas.", ft.Colors.GREEN_ACCENT_700)
+        except Exception as ex:
+            mostrar_mensaje(f"Error al guardar la planilla: {ex}", ft.Colors.RED_ACCENT_700)
+            return
+        finally:
+            progreso.visible = False
+            btn_guardar.disabled = False
+            page.update()
+        await cargar(None) # Recarga para tener los ID de las notas nuevas
+
+    def cambio_seleccion(_):
+        # La planilla en pantalla ya no corresponde a la selección: hay que volver a cargarla
+        filas.clear()
+        tabla.rows.clear()
+        tabla.visible = False
+        btn_guardar.disabled = True
+        mensaje.value = ""
+        page.update()
+
+    async def refrescar():
+        """Al volver a la vista: recarga cursos y materias (pudieron cambiar en sus vistas)."""
+        cursos = await Asincrono(Curso).obtener_todos()
+        materias = await Asincrono(Materia).obtener_todos()
+        seleccion_borrada = False
+        for dropdown, registros in ((curso_dropdown, cursos), (materia_dropdown, materias)):
+            if not registros:
+                continue # La lista también llega vacía si falló la lectura: se dejan las opciones que había
+            dropdown.options = opciones(registros)
+            if dropdown.value and dropdown.value not in {opcion.key for opcion in dropdown.options}:
+                dropdown.value = None
+                seleccion_borrada = True
+        if seleccion_borrada:
+            cambio_seleccion(None) # La planilla en pantalla era de un curso o materia que ya no existe
+        else:
+            page.update()
+
+    btn_cargar.on_click = cargar
+    btn_guardar.on_click = guardar
+    curso_dropdown.on_change = cambio_seleccion
+    materia_dropdown.on_change = cambio_seleccion
+    fecha_planilla.on_change = cambio_seleccion
+
+    return con_refresco(ft.Column(
+        [
+            ft.Text("Planilla por curso:", weight=ft.FontWeight.BOLD),
+            ft.Row([curso_dropdown, materia_dropdown, fecha_planilla], spacing=15, wrap=True),
+            ft.Row([btn_cargar, btn_guardar, progreso], spacing=10),
+            mensaje,
+            tabla,
+        ],
+        spacing=15,
+    ), refrescar)
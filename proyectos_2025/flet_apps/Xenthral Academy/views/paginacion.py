@@ -0,0 +1,167 @@
+import flet as ft
+from models.asincrono import ejecutar
+
+# Tamaños de página que se ofrecen en las tablas
+TAMANOS_PAGINA = (25, 50, 100)
+
+
+class Paginador:
+    """
+    Controles de paginación por clave (keyset) para las tablas CRUD.
+
+    En lugar de cargar toda la tabla, pide a la base de datos solo la página visible
+    con `obtener_pagina(after_id, limit)`: filas con id mayor que `after_id`, ordenadas por id.
+    Guarda el id de inicio de cada página visitada para poder volver atrás.
+    """
+    def __init__(self, page: ft.Page, obtener_pagina, mostrar_filas, tamano: int = TAMANOS_PAGINA[1]):
+        """
+        Args:
+            page (ft.Page): La página de Flet.
+            obtener_pagina: Función (after_id, limit) -> lista de filas cuyo primer campo es el id.
+            mostrar_filas: Función que recibe las filas de la página y las dibuja en la tabla.
+            tamano (int): Cantidad de filas por página.
+        """
+        self.page = page
+        self.obtener_pagina = obtener_pagina
+        self.mostrar_filas = mostrar_filas
+        self.tamano = tamano
+        self.inicios = [0] # after_id con el que empieza cada página visitada
+        self.hay_siguiente = False
+        self._ultimo_id = 0
+
+        self.btn_anterior = ft.IconButton(icon=ft.Icons.CHEVRON_LEFT, tooltip="Página anterior", on_click=self.anterior)
+        self.btn_siguiente = ft.IconButton(icon=ft.Icons.CHEVRON_RIGHT, tooltip="Página siguiente", on_click=self.siguiente)
+        self.txt_pagina = ft.Text()
+        self.dd_tamano = ft.Dropdown(
+            label="Filas",
+            width=100,
+            value=str(tamano),
+            options=[ft.dropdown.Option(str(t)) for t in TAMANOS_PAGINA],
+            on_change=self.cambiar_tamano,
+        )
+
+    def cargar(self):
+        """Consulta y dibuja la página actual."""
+        # Se pide una fila extra solo para saber si existe una página siguiente
+        filas = self.obtener_pagina(self.inicios[-1], self.tamano + 1) or []
+        self._mostrar(filas)
+
+    async def cargar_async(self):
+        """Igual que `cargar`, pero la consulta corre en el pool de hilos (refresco sin bloquear la interfaz)."""
+        filas = await ejecutar(self.obtener_pagina, self.inicios[-1], self.tamano + 1) or []
+        self._mostrar(filas)
+
+    def _mostrar(self, filas):
+        self.hay_siguiente = len(filas) > self.tamano
+        filas = filas[:self.tamano]
+
+        self.btn_anterior.disabled = len(self.inicios) == 1
+        self.btn_siguiente.disabled = not self.hay_siguiente
+        self.txt_pagina.value = f"Página {len(self.inicios)}"
+        self._ultimo_id = filas[-1][0] if filas else self.inicios[-1]
+        self.mostrar_filas(filas)
+
+    def reiniciar(self, obtener_pagina=None):
+        """Vuelve a la primera página, opcionalmente con otra fuente de datos (p. ej. un filtro)."""
+        if obtener_pagina is not None:
+            self.obtener_pagina = obtener_pagina
+        self.inicios = [0]
+        self.cargar()
+
+    def siguiente(self, e=None):
+        if self.hay_siguiente:
+            self.inicios.append(self._ultimo_id)
+            self.cargar()
+
+    def anterior(self, e=None):
+        if len(self.inicios) > 1:
+            self.inicios.pop()
+            self.cargar()
+
+    def admite_nueva_fila(self, id_registro, filas_visibles: int) -> bool:
+        """
+        Indica si un registro recién creado (con el id más alto) se muestra en la página actual.
+        Solo ocurre en la última página si todavía tiene espacio; si está llena, se habilita
+        el botón de página siguiente para llegar a él.
+        """
+        if self.hay_siguiente:
+            return False
+        if filas_visibles < self.tamano:
+            self._ultimo_id = id_registro
+            return True
+        self.hay_siguiente = True
+        self.btn_siguiente.disabled = False
+        self.btn_siguiente.update()
+        return False
+
+    def fila_quitada(self, filas_visibles: int):
+        """Si se eliminó la última fila de la página, vuelve a la página anterior."""
+        if filas_visibles == 0:
+            self.anterior()
+
+    def cambiar_tamano(self, e):
+        self.tamano = int(self.dd_tamano.value)
+        self.reiniciar()
+
+    def construir(self):
+        """Retorna la fila de controles de paginación."""
+        return ft.Row(
+            [self.btn_anterior, self.txt_pagina, self.btn_siguiente, self.dd_tamano],
+            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+        )
+
+
+class IndiceFilas:
+    """
+    Índice id -> ft.DataRow de una tabla.
+
+    Permite editar, agregar o quitar solo la fila afectada y enviar al cliente
+    únicamente la tabla (`table.update()`) en lugar de reconstruir todas las filas.
+    """
+    def __init__(self, table: ft.DataTable, crear_fila):
+        """
+        Args:
+            table (ft.DataTable): La tabla cuyas filas se indexan.
+            crear_fila: Función que recibe los datos de un registro (el primer campo es el id)
+                y retorna su ft.DataRow.
+        """
+        self.table = table
+        self.crear_fila = crear_fila
+        self.filas = {}
+
+    def cargar(self, data):
+        """Reconstruye todas las filas (carga inicial o cambio de página)."""
+        self.filas = {}
+        rows = []
+        for datos in data:
+            fila = self.crear_fila(datos)
+            self.filas[datos[0]] = fila
+            rows.append(fila)
+        self.table.rows = rows
+
+    def reemplazar(self, datos) -> bool:
+        """Redibuja la fila del registro editado. Retorna False si no está en la tabla."""
+        anterior = self.filas.get(datos[0])
+        if anterior is None:
+            return False
+        fila = self.crear_fila(datos)
+        self.table.rows[self.table.rows.index(anterior)] = fila
+        self.filas[datos[0]] = fila
+        self.table.update()
+        return True
+
+    def agregar(self, datos):
+        """Agrega al final la fila de un registro nuevo."""
+        fila = self.crear_fila(datos)
+        self.filas[datos[0]] = fila
+        self.table.rows.append(fila)
+        self.table.update()
+
+    def quitar(self, id_registro) -> bool:
+        """Quita la fila de un registro eliminado. Retorna False si no está en la tabla."""
+        fila = self.filas.pop(id_registro, None)
+        if fila is None:
+            return False
+        self.table.rows.remove(fila)
+        self.table.update()
+        return True
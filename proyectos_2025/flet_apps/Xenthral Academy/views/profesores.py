@@ -1,5 +1,8 @@
 import flet as ft
 from models.database import Profesor, Materia, MateriaProfesor
+from views.paginacion import Paginador, IndiceFilas
+from models.asincrono import Asincrono, ejecutar
+from views.registro_vistas import con_refresco, con_overlay
 import asyncio
 
 class TablaEstudiantes:
@@ -29,12 +32,14 @@ class TablaEstudiantes:
             ],
             border=ft.border.all(1, ft.Colors.GREY),
         )
+        self.indice = IndiceFilas(self.table, self._crear_fila)
+        self.paginador = Paginador(page, Profesor.obtener_pagina, self._actualizar_filas)
         self.actualizar_tabla() # Carga inicial de la tabla
 
     def cerrar_dialogo(self, e):
         """Cierra el diálogo modal."""
         self.dlg_modal.open = False
-        self.page.update()
+        self.dlg_modal.update()
 
     def actualizar_tabla(self):
         """
@@ -43,36 +48,42 @@ class TablaEstudiantes:
         Este método puede ser llamado desde otros módulos para reflejar
         los cambios en la base de datos en la interfaz de usuario.
         """
-        data = Profesor.obtener_todos()
-        new_rows = []
-        for e in data:
-            new_rows.append(
-                ft.DataRow(
-                    cells=[
-                        ft.DataCell(ft.Text(str(e[0]))),
-                        ft.DataCell(ft.Text(f"{e[1]} {e[2]}")),
-                        ft.DataCell(ft.Text(e[3])),
-                        ft.DataCell(ft.Text(e[4])),
-                        ft.DataCell(
-                            ft.IconButton(
-                                icon=ft.Icons.EDIT,
-                                tooltip="Editar Profesor",
-                                on_click=lambda ev, id=e[0], nombre=e[1], apellido=e[2], email=e[3], telefono=e[4]: self.seleccionar_estudiante(ev, id, nombre, apellido, email, telefono),
-                            )
-                        ),
-                        ft.DataCell(
-                            ft.IconButton(
-                                icon=ft.Icons.DELETE,
-                                tooltip="Eliminar Estudiante",
-                                on_click=lambda ev, id=e[0], nombre=e[1], apellido=e[2], email=e[3], telefono=e[4]: self.eliminar_estudiante(ev, id, nombre, apellido, email, telefono),
-                            )
-                        )
-                    ]
-                )
-            )
-        self.table.rows = new_rows
+        self.paginador.cargar()
+
+    def _actualizar_filas(self, data):
+        self.indice.cargar(data)
         self.page.update()
 
+    def _crear_fila(self, e):
+        """Crea la fila de la tabla para un registro."""
+        return ft.DataRow(
+            cells=[
+                ft.DataCell(ft.Text(str(e[0]))),
+                ft.DataCell(ft.Text(f"{e[1]} {e[2]}")),
+                ft.DataCell(ft.Text(e[3])),
+                ft.DataCell(ft.Text(e[4])),
+                ft.DataCell(
+                    ft.IconButton(
+                        icon=ft.Icons.EDIT,
+                        tooltip="Editar Profesor",
+                        on_click=lambda ev, id=e[0], nombre=e[1], apellido=e[2], email=e[3], telefono=e[4]: self.seleccionar_estudiante(ev, id, nombre, apellido, email, telefono),
+                    )
+                ),
+                ft.DataCell(
+                    ft.IconButton(
+                        icon=ft.Icons.DELETE,
+                        tooltip="Eliminar Estudiante",
+                        on_click=lambda ev, id=e[0], nombre=e[1], apellido=e[2], email=e[3], telefono=e[4]: self.eliminar_estudiante(ev, id, nombre, apellido, email, telefono),
+                    )
+                )
+            ]
+        )
+
+    def agregar_fila(self, datos):
+        """Muestra un registro recién creado si le corresponde a la página actual."""
+        if self.paginador.admite_nueva_fila(datos[0], len(self.table.rows)):
+            self.indice.agregar(datos)
+
     def actualizar_datos(self,e,nombre,apellido,email,telefono,id):
         """
         Persiste los datos editados de los estudiantes en la base de datos
@@ -81,7 +92,7 @@ class TablaEstudiantes:
         profesor = Profesor(nombre, apellido, email, telefono,id)
         profesor.actualizar_registro()
         self.cerrar_dialogo(e)
-        self.actualizar_tabla()  # Llamada para actualizar la tabla
+        self.indice.reemplazar((id, nombre, apellido, email, telefono))  # Solo se redibuja la fila editada
 
     def eliminar_estudiante(self, e, id,nombre,apellido,email,telefono):
         """
@@ -90,7 +101,8 @@ class TablaEstudiantes:
         """
         profesor = Profesor(nombre, apellido, email, telefono,id)
         profesor.eliminar_registro()
-        self.actualizar_tabla()  # Llamada para actualizar la tabla
+        self.indice.quitar(id)  # Solo se quita la fila eliminada
+        self.paginador.fila_quitada(len(self.table.rows))
 
     def seleccionar_estudiante(self, e, id,nombre,apellido,email,telefono):
         """
@@ -161,9 +173,9 @@ class TablaEstudiantes:
         para ser añadido a la página.
 
         Returns:
-            ft.Column: Un control de columna que contiene la tabla de materias.
+            ft.Column: Un control de columna que contiene la paginación y la tabla de profesores.
         """
-        return ft.Column([self.table], scroll=True)
+        return ft.Column([self.paginador.construir(), self.table], scroll=True)
 
 #----------------------------------------------------------------------------------------------------------------
 # Módulo para el formulario de registro de materias
@@ -193,6 +205,7 @@ def formulario_registro(page: ft.Page, tabla_materias: TablaEstudiantes):
 
     
 
+    progreso_carga = ft.ProgressRing(visible=False, width=20, height=20)
     estado_registro = ft.Text(value="", color=ft.Colors.GREEN_600)
 
     
@@ -212,8 +225,11 @@ def formulario_registro(page: ft.Page, tabla_materias: TablaEstudiantes):
                 try:
 
                     nuevo_estudiante = Profesor(nombre.value, apellido.value, email.value, telefono.value)
-                    nuevo_estudiante.guardar_registro()
-                    tabla_materias.actualizar_tabla()
+                    progreso_carga.visible = True
+                    page.update()
+                    await Asincrono(nuevo_estudiante).guardar_registro() # Se guarda en un hilo, sin bloquear la interfaz
+                    progreso_carga.visible = False
+                    tabla_materias.agregar_fila((nuevo_estudiante.id_profesor, nuevo_estudiante.nombre, nuevo_estudiante.apellido, nuevo_estudiante.email, nuevo_estudiante.telefono))
                     estado_registro.value = "Profesor registrado exitosamente"
                     estado_registro.color = ft.Colors.GREEN
                     page.update()
@@ -234,6 +250,7 @@ def formulario_registro(page: ft.Page, tabla_materias: TablaEstudiantes):
 
                 except Exception as ex:
                     estado_registro.value = f"Error: {ex}"
+                    progreso_carga.visible = False
 
         page.update()
 
@@ -262,7 +279,7 @@ def formulario_registro(page: ft.Page, tabla_materias: TablaEstudiantes):
                     ft.Text("Registrar Profesor", size=24, weight="bold"),
                     ft.Container(content=ft.Row([nombre,apellido])),
                     ft.Container(content=ft.Row([email,telefono])),
-                    boton_guardar,
+                    ft.Row([boton_guardar, progreso_carga], alignment=ft.MainAxisAlignment.CENTER),
                     estado_registro,
                     
                 ],
@@ -311,12 +328,13 @@ class TablaMaterias:
             ],
             border=ft.border.all(1, ft.Colors.GREY),
         )
+        self.indice = IndiceFilas(self.table, self._crear_fila)
         self.actualizar_tabla() # Carga inicial de la tabla
 
     def cerrar_dialogo(self, e):
         """Cierra el diálogo modal."""
         self.dlg_modal.open = False
-        self.page.update()
+        self.dlg_modal.update()
 
     def actualizar_tabla(self):
         """
@@ -326,26 +344,26 @@ class TablaMaterias:
         los cambios en la base de datos en la interfaz de usuario.
         """
         data = MateriaProfesor.obtener_materias_por_profesor(valor_id_profesor)
-        new_rows = []
-        for materia_id, nombre in data:
-            new_rows.append(
-                ft.DataRow(
-                    cells=[
-                        ft.DataCell(ft.Text(str(materia_id))),
-                        ft.DataCell(ft.Text(nombre)),
-                        ft.DataCell(
-                            ft.IconButton(
-                                icon=ft.Icons.DELETE,
-                                tooltip="Eliminar Materia",
-                                on_click=lambda ev, mid=materia_id, nom=nombre: self.eliminar_materia(ev, mid, nom),
-                            )
-                        )
-                    ]
-                )
-            )
-        self.table.rows = new_rows
+        self.indice.cargar(data)
         self.page.update()
 
+    def _crear_fila(self, datos):
+        """Crea la fila de la tabla para un registro."""
+        materia_id, nombre = datos
+        return ft.DataRow(
+            cells=[
+                ft.DataCell(ft.Text(str(materia_id))),
+                ft.DataCell(ft.Text(nombre)),
+                ft.DataCell(
+                    ft.IconButton(
+                        icon=ft.Icons.DELETE,
+                        tooltip="Eliminar Materia",
+                        on_click=lambda ev, mid=materia_id, nom=nombre: self.eliminar_materia(ev, mid, nom),
+                    )
+                )
+            ]
+        )
+
     def actualizar_datos(self, e, materia_id: int, nombre: str, descripcion: str):
         """
         Persiste los datos editados de la materia en la base de datos
@@ -375,7 +393,7 @@ class TablaMaterias:
 
        
         MateriaProfesor.eliminar_materias_de_profesor(valor_id_profesor,[materia_id])
-        self.actualizar_tabla()  # Llamada para actualizar la tabla
+        self.indice.quitar(materia_id)  # Solo se quita la fila eliminada
 
 
     def construir_tabla(self):
@@ -400,6 +418,26 @@ def actualizar_informacion_materia(page: ft.Page):
     infromacion_materia.value = f"Materia: {Materia.obtener_nombre_materia(valor_id_materia)}"
     page.update()
 
+def sugerencias_profesores():
+    """Sugerencias del autocompletado de profesores."""
+    items = []
+    for p in Profesor.obtener_todos():
+        items.append(ft.AutoCompleteSuggestion(
+          key = f"{p[0]} {p[1]}",
+          value= f"{p[1]} {p[2]}" 
+        ))
+
+    return items
+
+def sugerencias_materias():
+    """Sugerencias del autocompletado de materias."""
+    return [
+        ft.AutoCompleteSuggestion(
+            key=f"{id} {nombre}",
+            value=f"{nombre} - {descripcion}"
+        ) for id, nombre, descripcion in Materia.obtener_todos()
+    ]
+
 def autocompletado_profesores(page: ft.Page, tabla_materias:TablaMaterias):
     def actualizar_id(id):
         global valor_id_profesor
@@ -415,20 +453,10 @@ def autocompletado_profesores(page: ft.Page, tabla_materias:TablaMaterias):
             #tabla_estudiantes.actualizar_tabla_id_curso(id_curso)
         except (IndexError, ValueError):
             pass
-            
-    def obtener_sugerencias():
-        items = []
-        for p in Profesor.obtener_todos():
-            items.append(ft.AutoCompleteSuggestion(
-              key = f"{p[0]} {p[1]}",
-              value= f"{p[1]} {p[2]}" 
-            ))
-
-        return items
 
     return ft.Container(
         content=ft.AutoComplete(
-            suggestions=obtener_sugerencias(),
+            suggestions=sugerencias_profesores(),
             on_select=seleccionar_profesor
         ),
         expand=4,
@@ -452,17 +480,9 @@ def autocompletado_materias(page: ft.Page):
         except (IndexError, ValueError):
             pass
 
-    def obtener_sugerencias():
-        return [
-            ft.AutoCompleteSuggestion(
-                key=f"{id} {nombre}",
-                value=f"{nombre} - {descripcion}"
-            ) for id, nombre, descripcion in Materia.obtener_todos()
-        ]
-
     return ft.Container(
         content=ft.AutoComplete(
-            suggestions=obtener_sugerencias(),
+            suggestions=sugerencias_materias(),
             on_select=seleccionar_materia
         ),
         expand=4,
@@ -483,10 +503,12 @@ def modulo_asignar_materias(page: ft.Page):
 
 
     #-----------Autocompletado profesores-----------#
-    auto_profesores = ft.Row([ft.Text("Profesor: ",expand=1), autocompletado_profesores(page,tabla_materias)])
+    auto_completado_profesores = autocompletado_profesores(page,tabla_materias)
+    auto_profesores = ft.Row([ft.Text("Profesor: ",expand=1), auto_completado_profesores])
 
     #--------Autocompletado materias-------------#
-    auto_materias = ft.Row([ft.Text("Materia:  ",expand=1), autocompletado_materias(page)])
+    auto_completado_materias = autocompletado_materias(page)
+    auto_materias = ft.Row([ft.Text("Materia:  ",expand=1), auto_completado_materias])
 
     
     #Informacion del profesor y materia selccionados
@@ -495,6 +517,7 @@ def modulo_asignar_materias(page: ft.Page):
 
     #Esta de asignacion
     estado_asignacion = ft.Text("")
+    progreso_asignacion = ft.ProgressRing(visible=False, width=20, height=20)
 
 
     #Asignar
@@ -505,8 +528,13 @@ def modulo_asignar_materias(page: ft.Page):
             page.update()
             await asyncio.sleep(2)
         else:
-            MateriaProfesor.asociar_materia_a_profesor(valor_id_profesor,valor_id_materia)
-            tabla_materias.actualizar_tabla()
+            progreso_asignacion.visible = True
+            page.update()
+            # La asignación y la recarga de las materias del profesor corren en un hilo
+            await Asincrono(MateriaProfesor).asociar_materia_a_profesor(valor_id_profesor,valor_id_materia)
+            data = await Asincrono(MateriaProfesor).obtener_materias_por_profesor(valor_id_profesor)
+            tabla_materias.indice.cargar(data)
+            progreso_asignacion.visible = False
             estado_asignacion.value = "Exito"
             estado_asignacion.color = ft.Colors.GREEN
             page.update()
@@ -526,7 +554,7 @@ def modulo_asignar_materias(page: ft.Page):
                 ft.Divider(),
                 auto_profesores,
                 auto_materias,
-                btn_asignar,
+                ft.Row([btn_asignar, progreso_asignacion]),
                 estado_asignacion
                 ]
         ),
@@ -548,7 +576,14 @@ def modulo_asignar_materias(page: ft.Page):
             ]),
         expand=True
     )
-    return contenido
+
+    async def refrescar():
+        """Al volver a la vista: recarga las sugerencias (pudieron registrarse profesores o materias)."""
+        auto_completado_profesores.content.suggestions = await ejecutar(sugerencias_profesores)
+        auto_completado_materias.content.suggestions = await ejecutar(sugerencias_materias)
+        page.update()
+
+    return con_overlay(con_refresco(contenido, refrescar), tabla_materias.dlg_modal)
 
 def profesores(page: ft.Page):
     """
@@ -560,8 +595,9 @@ def profesores(page: ft.Page):
     """
     # Instancia de la tabla de materias
     tabla_estudiantes = TablaEstudiantes(page)
+    asignacion = modulo_asignar_materias(page)
 
-    return ft.Tabs(
+    vista = ft.Tabs(
         selected_index=0,
         animation_duration=300,
         expand=True,
@@ -589,7 +625,7 @@ def profesores(page: ft.Page):
                 text="Asignar Materias",
                 icon=ft.Icons.BOOK,
                 content=ft.Container(
-                    content=modulo_asignar_materias(page),
+                    content=asignacion,
                     alignment=ft.alignment.center,
                     padding=30,
                 ),
@@ -597,6 +633,13 @@ def profesores(page: ft.Page):
         ],
     )
 
+    async def refrescar():
+        """Al volver a la vista: recarga la página de la tabla y las sugerencias de la asignación."""
+        await tabla_estudiantes.paginador.cargar_async()
+        await asignacion.data["refrescar"]()
+
+    return con_overlay(con_refresco(vista, refrescar), tabla_estudiantes.dlg_modal, *asignacion.data["overlay"])
+
 
 
 def main(page: ft.Page):
@@ -0,0 +1,127 @@
+import inspect
+from collections import OrderedDict
+
+import flet as ft
+
+# Presupuesto de memoria: cantidad máxima de vistas construidas que se mantienen vivas.
+# Al superarlo se descarta la usada hace más tiempo y se reconstruye si se vuelve a visitar.
+MAX_VISTAS_EN_MEMORIA = 5
+
+
+def _datos(vista: ft.Control) -> dict:
+    if not isinstance(vista.data, dict):
+        vista.data = {}
+    return vista.data
+
+
+def con_refresco(vista: ft.Control, refrescar):
+    """
+    Asocia a una vista la función que la pone al día cada vez que se vuelve a mostrar.
+
+    Args:
+        vista (ft.Control): El control raíz de la vista.
+        refrescar: Función o corrutina sin argumentos (p. ej. recargar la página de una tabla).
+
+    Returns:
+        ft.Control: La misma vista, para poder usarlo en el `return` de la vista.
+    """
+    _datos(vista)["refrescar"] = refrescar
+    return vista
+
+
+def con_overlay(vista: ft.Control, *controles: ft.Control):
+    """
+    Asocia a una vista los controles que agrega a `page.overlay` (diálogos, FilePicker, DatePicker).
+    Cuando el registro descarta la vista los quita del overlay; si quedaran ahí, cada reconstrucción
+    agregaría otra copia y sus handlers mantendrían viva la vista descartada.
+
+    Args:
+        vista (ft.Control): El control raíz de la vista.
+        controles (ft.Control): Controles del overlay que pertenecen a la vista.
+
+    Returns:
+        ft.Control: La misma vista, para poder usarlo en el `return` de la vista.
+    """
+    _datos(vista).setdefault("overlay", []).extend(controles)
+    return vista
+
+
+class RegistroVistas:
+    """
+    Registro de las vistas del menú lateral.
+
+    Cada vista se construye la primera vez que se visita y después se reutiliza el mismo control,
+    así cambiar de vista no vuelve a crear tablas ni a repetir sus consultas. Al mostrar de nuevo una
+    vista solo se ejecuta su función de refresco (ver `con_refresco`), en segundo plano si es una corrutina.
+    Se mantienen vivas como máximo `max_vistas` vistas; se descarta la menos usada recientemente (LRU)
+    junto con sus controles del overlay (ver `con_overlay`).
+    """
+    def __init__(self, page: ft.Page, max_vistas: int = MAX_VISTAS_EN_MEMORIA):
+        """
+        Args:
+            page (ft.Page): La página de Flet.
+            max_vistas (int): Cantidad máxima de vistas que se mantienen en memoria.
+        """
+        self.page = page
+        self.max_vistas = max_vistas
+        self._constructores = {}
+        self._vistas = OrderedDict() # indice -> control, de la menos a la más usada
+
+    def registrar(self, indice: int, constructor, cachear: bool = True):
+        """
+        Registra la vista de un índice del menú.
+
+        Args:
+            indice (int): Índice del destino en el menú lateral.
+            constructor: Función sin argumentos que construye y retorna el control de la vista.
+            cachear (bool): False para construirla de nuevo en cada visita (vistas con estado propio).
+        """
+        self._constructores[indice] = (constructor, cachear)
+
+    def __contains__(self, indice: int) -> bool:
+        return indice in self._constructores
+
+    def obtener(self, indice: int) -> ft.Control:
+        """Retorna el control de la vista; solo la construye si no está en memoria."""
+        constructor, cachear = self._constructores[indice]
+        if not cachear:
+            return constructor()
+
+        vista = self._vistas.get(indice)
+        if vista is None:
+            vista = constructor()
+            self._vistas[indice] = vista
+            while len(self._vistas) > self.max_vistas:
+                _, descartada = self._vistas.popitem(last=False)
+                self._liberar(descartada)
+        else:
+            self._vistas.move_to_end(indice)
+            self._refrescar(vista)
+        return vista
+
+    def invalidar(self, indice: int = None):
+        """Descarta una vista (o todas) para que se reconstruya en la próxima visita."""
+        if indice is None:
+            descartadas = list(self._vistas.values())
+            self._vistas.clear()
+        else:
+            descartadas = [self._vistas.pop(indice, None)]
+        for vista in descartadas:
+            if vista is not None:
+                self._liberar(vista)
+
+    def _liberar(self, vista: ft.Control):
+        """Quita del overlay los controles de una vista descartada (ver `con_overlay`)."""
+        controles = vista.data.get("overlay", []) if isinstance(vista.data, dict) else []
+        for control in controles:
+            if control in self.page.overlay:
+                self.page.overlay.remove(control)
+
+    def _refrescar(self, vista: ft.Control):
+        refrescar = vista.data.get("refrescar") if isinstance(vista.data, dict) else None
+        if refrescar is None:
+            return
+        if inspect.iscoroutinefunction(refrescar):
+            self.page.run_task(refrescar) # La vista se muestra ya; sus datos llegan después
+        else:
+            refrescar()
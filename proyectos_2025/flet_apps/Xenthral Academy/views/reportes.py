@@ -0,0 +1,617 @@
+import flet as ft
+from datetime import date
+from models.database import Reportes, Estudiante, Curso, Materia # Asegúrate que esta línea sea correcta para tu estructura
+from models.asincrono import Asincrono, ejecutar
+from models.exportacion import exportar_reporte, REPORTES, FORMATOS
+from models.estadisticas import estadisticas_notas, PERCENTILES
+from models.analisis_asistencia import analizar_asistencia_curso, UMBRAL_AUSENTISMO_CRONICO
+from views.busqueda_diferida import BusquedaDiferida
+from views.registro_vistas import con_overlay
+
+def reportes_view(page: ft.Page):
+    # Control para seleccionar el tipo de reporte
+    tipo_reporte = ft.Dropdown(
+        label="Seleccione tipo de reporte",
+        options=[
+            ft.dropdown.Option("Inscripción por cursos"),
+            ft.dropdown.Option("Asistencia por estudiante"),
+            ft.dropdown.Option("Asistencia por curso"),
+            ft.dropdown.Option("Promedio notas por estudiante"),
+            ft.dropdown.Option("Promedio notas por materia"),
+            ft.dropdown.Option("Estadísticas notas por curso"),
+            ft.dropdown.Option("Resumen de curso"),
+            ft.dropdown.Option("Estadísticas avanzadas de notas"),
+            ft.dropdown.Option("Distribución de notas"),
+            ft.dropdown.Option("Ausentismo crónico por curso"),
+            ft.dropdown.Option("Tendencia de asistencia por curso"),
+        ],
+        width=400
+    )
+
+    # Texto de ayuda
+    info_text = ft.Text(value="", italic=True, color=ft.Colors.GREY_600) # ACTUALIZADO
+
+    # Campos dinámicos
+    id_est_field = ft.TextField(
+        label="ID Estudiante",
+        width=200,
+        on_change=lambda e: actualizar_nombre(e, id_est_field, estudiante_nombre, busqueda_estudiante)
+    )
+    estudiante_nombre = ft.Text(color=ft.Colors.BLUE_800) # ACTUALIZADO
+    
+    id_curso_field = ft.TextField(
+        label="ID Curso",
+        width=200,
+        on_change=lambda e: actualizar_nombre(e, id_curso_field, curso_nombre, busqueda_curso)
+    )
+    curso_nombre = ft.Text(color=ft.Colors.BLUE_800) # ACTUALIZADO
+    
+    id_mat_field = ft.TextField(
+        label="ID Materia",
+        width=200,
+        on_change=lambda e: actualizar_nombre(e, id_mat_field, materia_nombre, busqueda_materia)
+    )
+    materia_nombre = ft.Text(color=ft.Colors.BLUE_800) # ACTUALIZADO
+    
+    fecha_inicio = ft.TextField(
+        label="Fecha inicio (YYYY-MM-DD)",
+        width=220,
+        hint_text="Ej: 2024-01-01"
+    )
+    fecha_fin = ft.TextField(
+        label="Fecha fin (YYYY-MM-DD)",
+        width=220,
+        hint_text="Ej: 2024-12-31"
+    )
+
+    btn_generar = ft.ElevatedButton(
+        text="Generar Reporte",
+        icon=ft.Icons.INSERT_CHART, # ACTUALIZADO
+        color=ft.Colors.WHITE,      # ACTUALIZADO
+        bgcolor=ft.Colors.BLUE_600  # ACTUALIZADO
+    )
+    progreso_carga = ft.ProgressRing(visible=False, width=20, height=20)
+
+    # Exportación: escribe el reporte directo al archivo, sin armar la tabla en pantalla
+    formato_exportacion = ft.Dropdown(
+        label="Formato",
+        options=[ft.dropdown.Option(formato, formato.upper()) for formato in FORMATOS],
+        value="csv",
+        width=120
+    )
+    btn_exportar = ft.OutlinedButton(text="Exportar", icon=ft.Icons.DOWNLOAD)
+    barra_exportacion = ft.ProgressBar(visible=False, width=300)
+    estado_exportacion = ft.Text(value="", size=12)
+
+    # Panel del resumen de curso (encabezado e indicadores de asistencia; las notas van en la tabla)
+    resumen_titulo = ft.Text(size=16, weight=ft.FontWeight.BOLD)
+    resumen_asistencia = ft.Row(spacing=10, wrap=True)
+    panel_resumen = ft.Column([resumen_titulo, resumen_asistencia], spacing=10, visible=False)
+
+    # Tabla de resultados
+    # CORRECCIÓN: Inicializar con una columna por defecto
+    table = ft.DataTable(
+        columns=[ft.DataColumn(ft.Text(""))], 
+        rows=[], 
+        visible=False
+    )
+
+    def crear_busqueda(control_nombre, funcion_obtener):
+        """Crea la búsqueda diferida que muestra en `control_nombre` el nombre del ID escrito"""
+        def mostrar(_, nombre):
+            control_nombre.value = nombre or "⚠️ ID no encontrado"
+            control_nombre.color = ft.Colors.BLUE_800 if nombre else ft.Colors.RED # ACTUALIZADO
+        return BusquedaDiferida(page, funcion_obtener, mostrar)
+
+    def nombre_curso(id_curso):
+        curso = Curso.obtener_por_id(id_curso)
+        return curso.nombre if curso else None
+
+    busqueda_estudiante = crear_busqueda(estudiante_nombre, Estudiante.obtener_nombre_completo)
+    busqueda_curso = crear_busqueda(curso_nombre, nombre_curso)
+    busqueda_materia = crear_busqueda(materia_nombre, Materia.obtener_nombre_materia)
+
+    def actualizar_nombre(e, control_id, control_nombre, busqueda):
+        """Busca el nombre cuando el usuario deja de escribir el ID (la consulta no bloquea la interfaz)"""
+        try:
+            if control_id.value.strip():
+                id_val = int(control_id.value)
+                # Mientras se busca no se deja a la vista el nombre del ID anterior
+                if control_nombre.value:
+                    control_nombre.value = ""
+                    control_nombre.update()
+                busqueda.programar(id_val)
+                return
+            busqueda.cancelar()
+            control_nombre.value = ""
+            page.update()
+        except ValueError:
+            busqueda.cancelar()
+            control_nombre.value = "⚠️ ID inválido"
+            control_nombre.color = ft.Colors.RED # ACTUALIZADO
+            page.update()
+
+    def actualizar_campos(e):
+        """Muestra/oculta campos según el tipo de reporte"""
+        # Resetear todos los campos
+        for campo in [id_est_field, id_curso_field, id_mat_field, fecha_inicio, fecha_fin]:
+            campo.visible = False
+            campo.value = ""
+        
+        for nombre_display in [estudiante_nombre, curso_nombre, materia_nombre]: # Renombrada la variable para evitar confusión
+            nombre_display.value = ""
+        for busqueda in [busqueda_estudiante, busqueda_curso, busqueda_materia]:
+            busqueda.cancelar() # Que una búsqueda pendiente no vuelva a llenar los nombres
+        
+        table.visible = False
+        panel_resumen.visible = False
+        table.rows.clear()
+        table.columns.clear()
+        # CORRECCIÓN: Asegurar que la tabla tenga al menos una columna después de limpiarla
+        table.columns.append(ft.DataColumn(ft.Text(""))) 
+
+        # Configurar campos según reporte
+        descripcion = ""
+        if tipo_reporte.value == "Inscripción por cursos":
+            descripcion = "Muestra cantidad de estudiantes inscritos en cada curso."
+        
+        elif tipo_reporte.value == "Asistencia por estudiante":
+            id_est_field.visible = True
+            fecha_inicio.visible = True
+            fecha_fin.visible = True
+            descripcion = "Asistencia de un estudiante específico. Fechas son opcionales."
+        
+        elif tipo_reporte.value == "Asistencia por curso":
+            id_curso_field.visible = True
+            fecha_inicio.visible = True
+            fecha_fin.visible = True
+            descripcion = "Asistencia general de un curso. Fechas son opcionales."
+        
+        elif tipo_reporte.value == "Promedio notas por estudiante":
+            id_est_field.visible = True
+            descripcion = "Promedio de notas por materia para un estudiante."
+        
+        elif tipo_reporte.value == "Promedio notas por materia":
+            id_mat_field.visible = True
+            descripcion = "Promedio general de todos los estudiantes en una materia."
+        
+        elif tipo_reporte.value == "Estadísticas notas por curso":
+            id_curso_field.visible = True
+            descripcion = "Estadísticas detalladas de notas por materia en un curso."
+
+        elif tipo_reporte.value == "Resumen de curso":
+            id_curso_field.visible = True
+            fecha_inicio.visible = True
+            fecha_fin.visible = True
+            descripcion = "Inscritos, asistencia y notas por materia de un curso en una sola consulta. Fechas son opcionales."
+
+        elif tipo_reporte.value == "Estadísticas avanzadas de notas":
+            id_curso_field.visible = True
+            fecha_inicio.visible = True
+            fecha_fin.visible = True
+            descripcion = ("Promedio, desviación estándar, percentiles y porcentaje de reprobados por materia. "
+                           "Deje el ID de curso vacío para todo el colegio. Fechas son opcionales (período).")
+
+        elif tipo_reporte.value == "Distribución de notas":
+            id_curso_field.visible = True
+            fecha_inicio.visible = True
+            fecha_fin.visible = True
+            descripcion = ("Cantidad de notas por intervalo de la escala en cada materia. "
+                           "Deje el ID de curso vacío para todo el colegio. Fechas son opcionales (período).")
+
+        elif tipo_reporte.value == "Ausentismo crónico por curso":
+            id_curso_field.visible = True
+            fecha_inicio.visible = True
+            fecha_fin.visible = True
+            descripcion = (f"Estudiantes que faltaron al {UMBRAL_AUSENTISMO_CRONICO:g}% o más de los días registrados, "
+                           "con sus rachas de ausencias y su ausencia de los últimos 7 y 30 días. Fechas son opcionales.")
+
+        elif tipo_reporte.value == "Tendencia de asistencia por curso":
+            id_curso_field.visible = True
+            fecha_inicio.visible = True
+            fecha_fin.visible = True
+            descripcion = "Ausencias y tardanzas del curso por semana, con promedios móviles de 7 y 30 días. Fechas son opcionales."
+
+        info_text.value = descripcion
+        page.update()
+
+    tipo_reporte.on_change = actualizar_campos
+
+    def formatear_fecha(fecha_str):
+        """Intenta formatear fechas de texto a objeto date"""
+        try:
+            return date.fromisoformat(fecha_str) if fecha_str else None
+        except ValueError:
+            raise ValueError("Formato de fecha inválido. Use YYYY-MM-DD")
+
+    def indicador_asistencia(estado, cantidad, total):
+        """Crea la tarjeta de un estado de asistencia con su cantidad y porcentaje"""
+        porcentaje = cantidad * 100 / total if total else 0
+        return ft.Container(
+            content=ft.Column([
+                ft.Text(estado, weight=ft.FontWeight.BOLD),
+                ft.Text(f"{cantidad} ({porcentaje:.1f}%)"),
+            ], spacing=2, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
+            padding=10,
+            border_radius=8,
+            bgcolor=ft.Colors.BLUE_50,
+        )
+
+    async def generar_reporte(e):
+        # Las consultas corren en el pool de hilos; la interfaz sigue respondiendo mientras tanto
+        progreso_carga.visible = True
+        btn_generar.disabled = True
+        page.update()
+        try:
+            table.rows.clear()
+            table.columns.clear() # Limpiar columnas (incluyendo la de placeholder)
+            panel_resumen.visible = False
+
+            report_generated = False # Flag para saber si se generaron columnas
+
+            if tipo_reporte.value == "Inscripción por cursos":
+                data = await Asincrono(Reportes).reporte_inscripcion_cursos()
+                table.columns = [
+                    ft.DataColumn(ft.Text("Curso")),
+                    ft.DataColumn(ft.Text("Estudiantes", text_align=ft.TextAlign.RIGHT))
+                ]
+                table.rows = [
+                    ft.DataRow(cells=[
+                        ft.DataCell(ft.Text(row[1])),  # Nombre del curso
+                        ft.DataCell(ft.Text(str(row[2]), text_align=ft.TextAlign.RIGHT))
+                    ]) for row in data
+                ]
+                report_generated = True
+
+            elif tipo_reporte.value == "Asistencia por estudiante":
+                id_est = int(id_est_field.value)
+                fi = formatear_fecha(fecha_inicio.value)
+                ff = formatear_fecha(fecha_fin.value)
+                data = await Asincrono(Reportes).reporte_asistencia_por_estudiante(id_est, fi, ff)
+                
+                table.columns = [
+                    ft.DataColumn(ft.Text("Estado")),
+                    ft.DataColumn(ft.Text("Cantidad", text_align=ft.TextAlign.RIGHT))
+                ]
+                table.rows = [
+                    ft.DataRow(cells=[
+                        ft.DataCell(ft.Text(k)),
+                        ft.DataCell(ft.Text(str(v))), 
+                    ]) for k, v in data.items()
+                ]
+                report_generated = True
+            
+            elif tipo_reporte.value == "Asistencia por curso":
+                id_curso = int(id_curso_field.value)
+                fi = formatear_fecha(fecha_inicio.value)
+                ff = formatear_fecha(fecha_fin.value)
+                data = await Asincrono(Reportes).reporte_asistencia_por_curso(id_curso, fi, ff)
+                
+                table.columns = [
+                    ft.DataColumn(ft.Text("Estado")),
+                    ft.DataColumn(ft.Text("Cantidad", text_align=ft.TextAlign.RIGHT))
+                ]
+                table.rows = [
+                    ft.DataRow(cells=[
+                        ft.DataCell(ft.Text(k)),
+                        ft.DataCell(ft.Text(str(v))), 
+                    ]) for k, v in data.items()
+                ]
+                report_generated = True
+
+            elif tipo_reporte.value == "Promedio notas por estudiante":
+                id_est = int(id_est_field.value)
+                data = await Asincrono(Reportes).reporte_promedio_notas_por_estudiante(id_est)
+                
+                table.columns = [
+                    ft.DataColumn(ft.Text("Materia")),
+                    ft.DataColumn(ft.Text("Promedio", text_align=ft.TextAlign.RIGHT))
+                ]
+                rows = []
+                for materia_id, promedio, nombre_materia in data:
+                    nombre_materia = nombre_materia or f"Materia {materia_id}"
+                    rows.append(
+                        ft.DataRow(cells=[
+                            ft.DataCell(ft.Text(nombre_materia)),
+                            ft.DataCell(ft.Text(f"{promedio:.2f}")),
+                        ]))
+                table.rows = rows
+                report_generated = True
+
+            elif tipo_reporte.value == "Promedio notas por materia":
+                id_mat = int(id_mat_field.value)
+                promedio = await Asincrono(Reportes).reporte_promedio_notas_por_materia(id_mat)
+                
+                table.columns = [
+                    ft.DataColumn(ft.Text("Materia")),
+                    ft.DataColumn(ft.Text("Promedio General", text_align=ft.TextAlign.RIGHT))
+                ]
+                nombre_materia = await Asincrono(Materia).obtener_nombre_materia(id_mat) or f"Materia {id_mat}"
+                table.rows = [
+                    ft.DataRow(cells=[
+                        ft.DataCell(ft.Text(nombre_materia)),
+                        ft.DataCell(ft.Text(f"{promedio:.2f}")),
+                    ])
+                ]
+                report_generated = True
+
+            elif tipo_reporte.value == "Estadísticas notas por curso":
+                id_curso = int(id_curso_field.value)
+                data = await Asincrono(Reportes).reporte_estadisticas_notas_por_curso(id_curso)
+                
+                table.columns = [
+                    ft.DataColumn(ft.Text("Materia")),
+                    ft.DataColumn(ft.Text("Promedio", text_align=ft.TextAlign.RIGHT)),
+                    ft.DataColumn(ft.Text("Mínima", text_align=ft.TextAlign.RIGHT)),
+                    ft.DataColumn(ft.Text("Máxima", text_align=ft.TextAlign.RIGHT))
+                ]
+                rows = []
+                for materia_id, avg, min_val, max_val, nombre_materia in data:
+                    nombre_materia = nombre_materia or f"Materia {materia_id}"
+                    rows.append(
+                        ft.DataRow(cells=[
+                            ft.DataCell(ft.Text(nombre_materia)),
+                            ft.DataCell(ft.Text(f"{avg:.2f}")),
+                            ft.DataCell(ft.Text(f"{min_val:.2f}")),
+                            ft.DataCell(ft.Text(f"{max_val:.2f}")),
+                        ]))
+                table.rows = rows
+                report_generated = True
+
+            elif tipo_reporte.value == "Resumen de curso":
+                id_curso = int(id_curso_field.value)
+                fi = formatear_fecha(fecha_inicio.value)
+                ff = formatear_fecha(fecha_fin.value)
+                resumen = await Asincrono(Reportes).resumen_curso(id_curso, (fi, ff))
+                if resumen is None:
+                    raise Exception("No se pudo generar el resumen del curso.")
+                if not resumen:
+                    raise ValueError(f"No existe un curso con ID {id_curso}.")
+
+                resumen_titulo.value = f"{resumen['curso']}: {resumen['inscritos']} estudiantes inscritos"
+                total_asistencia = sum(resumen["asistencia"].values())
+                resumen_asistencia.controls = [
+                    indicador_asistencia(estado, resumen["asistencia"].get(estado, 0), total_asistencia)
+                    for estado in ("Presente", "Ausente", "Tarde")
+                ]
+                panel_resumen.visible = True
+
+                table.columns = [
+                    ft.DataColumn(ft.Text("Materia")),
+                    ft.DataColumn(ft.Text("Notas", text_align=ft.TextAlign.RIGHT)),
+                    ft.DataColumn(ft.Text("Promedio", text_align=ft.TextAlign.RIGHT)),
+                    ft.DataColumn(ft.Text("Mínima", text_align=ft.TextAlign.RIGHT)),
+                    ft.DataColumn(ft.Text("Máxima", text_align=ft.TextAlign.RIGHT))
+                ]
+                rows = []
+                for materia_id, nombre_materia, cantidad, avg, min_val, max_val in resumen["notas"]:
+                    nombre_materia = nombre_materia or f"Materia {materia_id}"
+                    rows.append(
+                        ft.DataRow(cells=[
+                            ft.DataCell(ft.Text(nombre_materia)),
+                            ft.DataCell(ft.Text(str(cantidad))),
+                            ft.DataCell(ft.Text(f"{avg:.2f}")),
+                            ft.DataCell(ft.Text(f"{min_val:.2f}")),
+                            ft.DataCell(ft.Text(f"{max_val:.2f}")),
+                        ]))
+                table.rows = rows
+                report_generated = True
+
+            elif tipo_reporte.value in ("Estadísticas avanzadas de notas", "Distribución de notas"):
+                id_curso = int(id_curso_field.value) if id_curso_field.value.strip() else None
+                fi = formatear_fecha(fecha_inicio.value)
+                ff = formatear_fecha(fecha_fin.value)
+                data = await ejecutar(estadisticas_notas, id_curso, (fi, ff))
+                if data is None:
+                    raise Exception("No se pudieron calcular las estadísticas.")
+
+                if tipo_reporte.value == "Estadísticas avanzadas de notas":
+                    encabezados = ["Materia", "Notas", "Promedio", "Desv. est.", "Mínima",
+                                   *[f"P{p}" if p != 50 else "Mediana" for p in PERCENTILES], "Máxima", "% Reprobados"]
+                    filas = [
+                        [nombre_materia, str(m["cantidad"]), f"{m['promedio']:.2f}", f"{m['desviacion']:.2f}", f"{m['minimo']:.2f}",
+                         *[f"{m['percentiles'][p]:.2f}" for p in PERCENTILES], f"{m['maximo']:.2f}", f"{m['reprobados']:.1f}%"]
+                        for _, nombre_materia, m in data
+                    ]
+                else:
+                    intervalos = data[0][2]["histograma"] if data else []
+                    # Notas anteriores a la escala actual: columna aparte para que cada fila sume 100%
+                    con_fuera_escala = any(m["fuera_escala"] for _, _, m in data)
+                    encabezados = ["Materia", *[f"{desde:g} - {hasta:g}" for desde, hasta, _ in intervalos]]
+                    if con_fuera_escala:
+                        encabezados.append("Fuera de escala")
+
+                    def conteo(cantidad, total):
+                        return f"{cantidad} ({cantidad * 100 / total:.0f}%)"
+
+                    filas = [
+                        [nombre_materia, *[conteo(cantidad, m["cantidad"]) for _, _, cantidad in m["histograma"]],
+                         *([conteo(m["fuera_escala"], m["cantidad"])] if con_fuera_escala else [])]
+                        for _, nombre_materia, m in data
+                    ]
+                table.columns = [
+                    ft.DataColumn(ft.Text(encabezado), numeric=i > 0) for i, encabezado in enumerate(encabezados)
+                ]
+                table.rows = [ft.DataRow(cells=[ft.DataCell(ft.Text(valor)) for valor in fila]) for fila in filas]
+                report_generated = bool(filas)
+
+            elif tipo_reporte.value in ("Ausentismo crónico por curso", "Tendencia de asistencia por curso"):
+                id_curso = int(id_curso_field.value)
+                fi = formatear_fecha(fecha_inicio.value)
+                ff = formatear_fecha(fecha_fin.value)
+                analisis = await ejecutar(analizar_asistencia_curso, id_curso, (fi, ff))
+                if analisis is None:
+                    raise Exception("No se pudo analizar la asistencia del curso.")
+
+                def porcentaje(valor):
+                    return "-" if valor is None else f"{valor:.1f}%"
+
+                if tipo_reporte.value == "Ausentismo crónico por curso":
+                    cronicos = [fila for fila in analisis["estudiantes"] if fila[3]["cronico"]]
+                    resumen_titulo.value = (
+                        f"{len(cronicos)} de {len(analisis['estudiantes'])} estudiantes con ausentismo crónico "
+                        f"({UMBRAL_AUSENTISMO_CRONICO:g}% o más)"
+                    )
+                    resumen_asistencia.controls = []
+                    panel_resumen.visible = True
+                    encabezados = ["Estudiante", "Registros", "% Ausencia", "Racha máx.", "Racha actual",
+                                   "Ausencia 7 días", "Ausencia 30 días", "Tardanzas"]
+                    filas = [
+                        [f"{apellido} {nombre} ({id_est})", str(m["registros"]), porcentaje(m["ausencia"]),
+                         str(m["racha_maxima"]), str(m["racha_actual"]), porcentaje(m["ausencia_7"]),
+                         porcentaje(m["ausencia_30"]), str(m["tardanzas"])]
+                        for id_est, nombre, apellido, m in cronicos
+                    ]
+                else:
+                    encabezados = ["Semana", "Registros", "% Ausencia", "% Tardanza",
+                                   "Ausencia 7 días", "Ausencia 30 días", "Tardanza 30 días"]
+                    filas = [
+                        [s["semana"].isoformat(), str(s["registros"]), porcentaje(s["ausencia"]), porcentaje(s["tardanza"]),
+                         porcentaje(s["ausencia_7"]), porcentaje(s["ausencia_30"]), porcentaje(s["tardanza_30"])]
+                        for s in analisis["semanas"]
+                    ]
+                table.columns = [
+                    ft.DataColumn(ft.Text(encabezado), numeric=i > 0) for i, encabezado in enumerate(encabezados)
+                ]
+                table.rows = [ft.DataRow(cells=[ft.DataCell(ft.Text(valor)) for valor in fila]) for fila in filas]
+                report_generated = bool(filas)
+
+            if not report_generated or not table.columns:
+                # Si por alguna razón no se generaron columnas (ej. tipo_reporte.value es None o no coincide)
+                # o los datos resultaron en no columnas, añadir una columna por defecto.
+                table.columns = [ft.DataColumn(ft.Text("No hay datos para mostrar o tipo de reporte no seleccionado."))]
+                table.rows = []
+            
+            table.visible = True
+            page.update()
+
+        except Exception as ex:
+            page.dialog = ft.AlertDialog(
+                title=ft.Text("Error", color=ft.Colors.RED), # ACTUALIZADO
+                content=ft.Text(str(ex))
+            )
+            page.dialog.open = True
+            # Opcional: resetear la tabla a un estado seguro si es necesario
+            # table.columns = [ft.DataColumn(ft.Text(""))]
+            # table.rows.clear()
+            # table.visible = False
+            page.update()
+        finally:
+            progreso_carga.visible = False
+            btn_generar.disabled = False
+            page.update()
+
+    btn_generar.on_click = generar_reporte
+
+    def progreso_exportacion(filas, secciones_listas, total_secciones):
+        # Se llama desde el hilo de la exportación después de cada bloque de filas
+        barra_exportacion.value = secciones_listas / total_secciones if total_secciones else None
+        estado_exportacion.value = f"{filas} filas exportadas ({secciones_listas} de {total_secciones})..."
+        page.update()
+
+    async def exportar(ruta):
+        tipo = tipo_reporte.value
+        btn_exportar.disabled = True
+        barra_exportacion.value = None
+        barra_exportacion.visible = True
+        estado_exportacion.value = "Exportando..."
+        estado_exportacion.color = None
+        page.update()
+        try:
+            # El ID según lo que recibe el reporte; vacío en un reporte por curso o materia = todos
+            campo_id = {"estudiante": id_est_field, "curso": id_curso_field, "materia": id_mat_field}.get(REPORTES[tipo][1])
+            try:
+                id_filtro = int(campo_id.value) if campo_id and campo_id.value.strip() else None
+            except ValueError:
+                raise ValueError("El ID debe ser un número entero.")
+            rango = (formatear_fecha(fecha_inicio.value), formatear_fecha(fecha_fin.value))
+            resultado = await ejecutar(exportar_reporte, ruta, tipo, id_filtro, rango, progreso=progreso_exportacion)
+            if resultado is None:
+                estado_exportacion.value = "No se pudo exportar el reporte (error de base de datos)."
+                estado_exportacion.color = ft.Colors.RED
+            else:
+                estado_exportacion.value = f"{resultado['filas']} filas exportadas a {resultado['ruta']}"
+                estado_exportacion.color = ft.Colors.GREEN
+        except ValueError as ex:
+            estado_exportacion.value = str(ex)
+            estado_exportacion.color = ft.Colors.RED
+        except Exception as ex:
+            estado_exportacion.value = f"Error: {ex}"
+            estado_exportacion.color = ft.Colors.RED
+        finally:
+            btn_exportar.disabled = False
+            barra_exportacion.visible = False
+            page.update()
+
+    def archivo_elegido(e: ft.FilePickerResultEvent):
+        if not e.path:
+            return # Cancelado, o la versión web (no hay ruta donde escribir)
+        ruta = e.path
+        if not ruta.lower().endswith("." + formato_exportacion.value):
+            ruta += "." + formato_exportacion.value
+        page.run_task(exportar, ruta)
+
+    selector_archivo = ft.FilePicker(on_result=archivo_elegido)
+    if selector_archivo not in page.overlay:
+        page.overlay.append(selector_archivo)
+
+    def elegir_archivo(e):
+        if tipo_reporte.value not in REPORTES:
+            estado_exportacion.value = "Seleccione un tipo de reporte." if not tipo_reporte.value else "Este reporte no se puede exportar."
+            estado_exportacion.color = ft.Colors.RED
+            page.update()
+            return
+        selector_archivo.save_file(
+            dialog_title="Exportar reporte",
+            file_name=f"{tipo_reporte.value}.{formato_exportacion.value}",
+            allowed_extensions=[formato_exportacion.value],
+        )
+
+    btn_exportar.on_click = elegir_archivo
+    
+    # Llamar a actualizar_campos al inicio para configurar la visibilidad inicial de los campos
+    # y asegurar que la tabla esté correctamente inicializada para la primera vista.
+    actualizar_campos(None) # Pasar None o un objeto evento simulado si es necesario
+
+    # Layout
+    return con_overlay(ft.Column(
+        controls=[
+            ft.Container(
+                content=ft.Column([
+                    tipo_reporte,
+                    info_text,
+                    ft.Row([
+                        ft.Column([id_est_field, estudiante_nombre]),
+                        ft.Column([id_curso_field, curso_nombre]),
+                        ft.Column([id_mat_field, materia_nombre]),
+                    ], spacing=20, visible=True), # Asegurar que el Row que contiene los campos ID sea visible
+                                                  # La visibilidad de los campos individuales se maneja en actualizar_campos
+                    ft.Row([fecha_inicio, fecha_fin], spacing=20, visible=True), # Idem
+                    ft.Container(ft.Row([btn_generar, progreso_carga]), padding=10),
+                    ft.Row([formato_exportacion, btn_exportar, barra_exportacion], spacing=15),
+                    ft.Text(
+                        "Exportar escribe el reporte en un archivo sin mostrarlo. "
+                        "En los reportes por curso o por materia, deje el ID vacío para exportar todos.",
+                        italic=True, size=12, color=ft.Colors.GREY_600
+                    ),
+                    estado_exportacion,
+                    ft.Divider(),
+                    panel_resumen,
+                    table
+                ], spacing=15),
+                padding=30,
+                expand=True
+            )
+        ],
+        expand=True
+    ), selector_archivo)
+
+
+def main(page: ft.Page):
+    page.title = "Sistema de Reportes Escolares"
+    page.theme_mode = ft.ThemeMode.LIGHT # O ft.ThemeMode.DARK o ft.ThemeMode.SYSTEM
+ 
+    page.add(reportes_view(page))
+
+if __name__ == "__main__":
+    ft.app(target=main)
\ No newline at end of file